@@ -0,0 +1,104 @@
+"""Benchmark of plain-value contexts against one `KeyValueEvaluator` per key
+
+Times building a context of `--keys` values, measures its traced memory,
+and times rendering a template evaluating every key, for a context of
+`KeyValueEvaluator` objects and for the plain mapping passed to `generate`.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_context.py --keys 50000
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from dictrule import (
+    Context,
+    EvalRule,
+    Generator,
+)
+
+
+def evaluator_context(values: Dict[str, Any]) -> Context:
+    """Builds a context with one `KeyValueEvaluator` per key"""
+
+    return Context(
+        [
+            EvalRule.ContextCase(
+                evaluators=[
+                    EvalRule.KeyValueEvaluator(key, value) for key, value in values.items()
+                ],
+            )
+        ]
+    )
+
+
+def values_context(values: Dict[str, Any]) -> Optional[Context]:
+    """Builds the context `generate` uses for a plain mapping"""
+
+    return Generator.values_context(values)
+
+
+def measure(
+    build: Callable[[Dict[str, Any]], Union[Context, Dict[str, Any], None]],
+    values: Dict[str, Any],
+    repeat: int,
+) -> Dict[str, float]:
+    """Times and traces building a context"""
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(values)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    context = build(values)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del context
+    return {"build": statistics.median(timings), "memory": memory}
+
+
+def main():
+    """Entry point"""
+
+    parser = argparse.ArgumentParser(description="Benchmarks plain-value contexts.")
+    parser.add_argument("--keys", type=int, default=50_000, help="number of values")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per variant")
+    args = parser.parse_args()
+
+    values = {f"key_{index}": f"value_{index}" for index in range(args.keys)}
+    generator = Generator([{"eval": key} for key in values], trusted=True)
+    _ = generator.template
+
+    for name, build in (
+        ("KeyValueEvaluator", evaluator_context),
+        ("plain mapping", values_context),
+    ):
+        stats = measure(build, values, args.repeat)
+        renders: List[float] = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            generator.generate(build(values))
+            renders.append(time.perf_counter() - started)
+
+        print(
+            f"{name:<20} build {stats['build'] * 1000:9.2f} ms  "
+            f"memory {stats['memory'] / 1024:9.1f} KiB  "
+            f"build + render {statistics.median(renders) * 1000:9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
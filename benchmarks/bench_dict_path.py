@@ -0,0 +1,93 @@
+"""Benchmark of `EvalRule.DictPathEvaluator` against `EvalObject` conversion
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_dict_path.py --size-mb 500
+
+or with an existing document:
+
+    PYTHONPATH=src python benchmarks/bench_dict_path.py --json document.json
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from dictrule import EvalObject, EvalRule
+
+
+def build_document(size_mb: float) -> Dict[str, Any]:
+    """Builds a synthetic nested document of roughly `size_mb` megabytes of JSON"""
+
+    record = {
+        "id": 0,
+        "name": "record",
+        "tags": ["alpha", "beta", "gamma"],
+        "owner": {"name": "Zooxy Le", "email": "zooxy@example.com"},
+        "metrics": {"views": 1024, "score": 0.75},
+    }
+    record_size = len(json.dumps(record))
+    count = max(1, int(size_mb * 1024 * 1024 / record_size))
+    records: List[Dict[str, Any]] = []
+    for index in range(count):
+        item = json.loads(json.dumps(record))
+        item["id"] = index
+        records.append(item)
+
+    return {"project": {"name": "bench", "records": records}}
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark"""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=10.0)
+    parser.add_argument("--json", help="path of a JSON document to use instead")
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+
+    if args.json:
+        with open(args.json, mode="r", encoding="utf-8") as file:
+            document = json.load(file)
+        paths = ["project.name"]
+    else:
+        document = build_document(args.size_mb)
+        count = len(document["project"]["records"])
+        rand = random.Random(0)
+        paths = [
+            f"project.records[{rand.randrange(count)}].owner.name"
+            for _ in range(args.lookups)
+        ]
+
+    def _dict_path():
+        evaluator = EvalRule.DictPathEvaluator(prefix="doc", document=document)
+        return [evaluator.run("doc." + path) for path in paths]
+
+    def _eval_object():
+        converted = EvalObject.from_eo_property_object(document)
+        evaluator = EvalRule.DictPathEvaluator(prefix="doc", document=converted)
+        return [evaluator.run("doc." + path) for path in paths]
+
+    dict_path_values, dict_path_time = _timed(_dict_path)
+    eval_object_values, eval_object_time = _timed(_eval_object)
+    assert dict_path_values == eval_object_values
+
+    print(f"lookups:               {len(paths)}")
+    print(f"DictPathEvaluator:     {dict_path_time * 1000:.2f} ms")
+    print(f"EvalObject conversion: {eval_object_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
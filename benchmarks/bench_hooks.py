@@ -0,0 +1,156 @@
+"""Benchmark of the cost of render hooks
+
+Times `Generator.generate` of the README sample in a checkout without hooks,
+given by `--baseline`, and in this tree without hooks, with a no-op `Hooks`
+and with a `Profiler`. Without hooks, `generate` must stay within noise of
+the baseline.
+
+Each variant runs in a fresh interpreter importing dictrule from its own
+source tree, and rounds of the variants are interleaved so drifts of the
+machine affect them alike.
+
+Run from the repository root, with a checkout of the commit before hooks:
+
+    git worktree add /tmp/dictrule-base <commit>
+    PYTHONPATH=src python benchmarks/bench_hooks.py --baseline /tmp/dictrule-base/src
+
+Pass `--src` with a checkout of the commit adding hooks to leave out later changes.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dictrule import Generator  # noqa: E402  pylint: disable=wrong-import-position
+from workloads import (  # noqa: E402  pylint: disable=wrong-import-position
+    README_RULES,
+    _context,
+)
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def render_times(
+    hooks: str,
+    count: int,
+    repeat: int,
+) -> List[float]:
+    """Times `generate` with `hooks`, one of "none", "no-op" and "profiler"."""
+
+    context = _context(
+        {
+            "gen": {
+                "header": "THIS IS THE GENERATED EXAMPLE CODE",
+                "id": 3101,
+                "title": "Sampler for getting sample contents",
+                "date": "01-01-2024",
+                "author": "Zooxy Le",
+                "contents": ["Train", "Flight", "Ship"],
+            }
+        }
+    )
+    if hooks == "profiler":
+        generator = Generator(README_RULES * count, profile=True)
+    else:
+        generator = Generator(README_RULES * count)
+
+    if hooks == "no-op":
+        from dictrule import Hooks  # pylint: disable=import-outside-toplevel
+
+        generator.add_hooks(Hooks())
+
+    generator.generate(context)
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        generator.generate(context)
+        timings.append(time.perf_counter() - started)
+
+    return timings
+
+
+def run_variant(
+    src: Path,
+    hooks: str,
+    count: int,
+    repeat: int,
+) -> List[float]:
+    """Runs `render_times` in a fresh interpreter importing dictrule from `src`"""
+
+    env = dict(os.environ, PYTHONPATH=str(src))
+    completed = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--hooks",
+            hooks,
+            "--count",
+            str(count),
+            "--repeat",
+            str(repeat),
+        ],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def main():
+    """Entry point"""
+
+    parser = argparse.ArgumentParser(description="Benchmarks the cost of render hooks.")
+    parser.add_argument("--baseline", type=Path, help="src directory of a checkout without hooks")
+    parser.add_argument(
+        "--src",
+        type=Path,
+        default=SRC,
+        help="src directory of the checkout with hooks (default: this tree)",
+    )
+    parser.add_argument("--count", type=int, default=2000, help="README sample repetitions")
+    parser.add_argument("--rounds", type=int, default=5, help="interleaved rounds")
+    parser.add_argument("--repeat", type=int, default=4, help="timed runs per variant and round")
+    parser.add_argument("--hooks", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hooks is not None:
+        print(json.dumps(render_times(args.hooks, args.count, args.repeat)))
+        return
+
+    variants: List[Tuple[str, Path, str]] = [
+        ("generate, no hooks", args.src, "none"),
+        ("generate, no-op hooks", args.src, "no-op"),
+        ("generate, profiler", args.src, "profiler"),
+    ]
+    if args.baseline is not None:
+        variants.insert(0, ("baseline checkout", args.baseline, "none"))
+
+    timings: Dict[str, List[float]] = {name: [] for name, _, _ in variants}
+    for _ in range(args.rounds):
+        for name, src, hooks in variants:
+            timings[name].extend(run_variant(src, hooks, args.count, args.repeat))
+
+    baseline = statistics.median(timings[variants[0][0]])
+    for name, values in timings.items():
+        median = statistics.median(values)
+        print(
+            f"{name:<24} {min(values) * 1000:10.2f} ms min "
+            f"{median * 1000:10.2f} ms median {median / baseline:8.3f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark of `Project.generate` with one and many worker threads
+
+Renders `--entries` outputs of a CPU-bound template, then of a template whose
+evaluator waits `--latency` seconds per value like a remote service. Threads
+only overlap the waits: rendering holds the GIL.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_project.py --entries 64 --workers 8
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    List,
+)
+
+from dictrule import (
+    Context,
+    EvalRule,
+    Generator,
+    Project,
+)
+
+
+class WaitingEvaluator(EvalRule.Evaluable):
+    """Evaluator waiting before serving every name"""
+
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    @property
+    def name(self) -> str:
+        return ""
+
+    @property
+    def prefix_matching(self) -> bool:
+        return True
+
+    def run(self, cmd: str) -> Any:
+        time.sleep(self._latency)
+        return cmd
+
+
+def cpu_project(root: Path, entries: int, workers: int) -> Project:
+    """Entries rendering 2000 formatted values each"""
+
+    generator = Generator(
+        [{"format_snake_case": {"eval": f"model.field_{index}"}} for index in range(2_000)]
+    )
+    project = Project(max_workers=workers)
+    for index in range(entries):
+        project.add(
+            generator,
+            Generator.values_context(
+                {"model": {f"field_{field}": f"Field {index} {field}" for field in range(2_000)}}
+            ),
+            root / f"cpu_{index}.txt",
+        )
+
+    return project
+
+
+def waiting_project(root: Path, entries: int, workers: int, latency: float) -> Project:
+    """Entries evaluating 5 values from a waiting evaluator each"""
+
+    generator = Generator([{"eval": f"remote.value_{index}"} for index in range(5)])
+    context = Context([EvalRule.ContextCase(evaluators=[WaitingEvaluator(latency)])])
+    project = Project(max_workers=workers)
+    for index in range(entries):
+        project.add(generator, context, root / f"waiting_{index}.txt")
+
+    return project
+
+
+def measure(build: Callable[[int], Project], workers: int, repeat: int) -> float:
+    """Gets the median seconds of `Project.generate`"""
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        project = build(workers)
+        started = time.perf_counter()
+        project.generate()
+        timings.append(time.perf_counter() - started)
+
+    return statistics.median(timings)
+
+
+def main():
+    """Entry point"""
+
+    parser = argparse.ArgumentParser(description="Benchmarks Project.generate workers.")
+    parser.add_argument("--entries", type=int, default=64, help="number of outputs")
+    parser.add_argument("--workers", type=int, default=8, help="threads of the parallel runs")
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds per remote value")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per variant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        for name, build in (
+            ("cpu-bound", lambda workers: cpu_project(root, args.entries, workers)),
+            (
+                "waiting evaluator",
+                lambda workers: waiting_project(root, args.entries, workers, args.latency),
+            ),
+        ):
+            for workers in (1, args.workers):
+                seconds = measure(build, workers, args.repeat)
+                print(f"{name:<18} {workers:>3} workers {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
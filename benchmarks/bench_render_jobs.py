@@ -0,0 +1,80 @@
+"""Benchmark of `dictrule render --jobs`
+
+Writes `--templates` CPU-bound templates and a context file, then times the
+`render` command with one job and with `--jobs` worker processes.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_render_jobs.py --templates 16 --jobs 4
+"""
+
+import argparse
+import io
+import json
+import statistics
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import List
+
+from dictrule.cli import main as cli_main
+
+
+def build_project(root: Path, count: int, fields: int) -> List[str]:
+    """Writes `count` templates formatting `fields` values each, and a context file"""
+
+    templates: List[str] = []
+    for index in range(count):
+        path = root / f"template_{index}.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"format_snake_case": {"eval": f"models.model_{index}.field_{field}"}}
+                    for field in range(fields)
+                ]
+            ),
+            encoding="utf-8",
+        )
+        templates.append(str(path))
+
+    context = {
+        "models": {
+            f"model_{index}": {
+                f"field_{field}": f"Field {index} {field}" for field in range(fields)
+            }
+            for index in range(count)
+        }
+    }
+    (root / "context.json").write_text(json.dumps(context), encoding="utf-8")
+    return templates
+
+
+def main():
+    """Entry point"""
+
+    parser = argparse.ArgumentParser(description="Benchmarks `dictrule render --jobs`.")
+    parser.add_argument("--templates", type=int, default=16, help="number of templates")
+    parser.add_argument("--fields", type=int, default=5_000, help="values per template")
+    parser.add_argument("--jobs", type=int, default=4, help="worker processes")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per variant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        templates = build_project(root, args.templates, args.fields)
+        for jobs in (1, args.jobs):
+            timings: List[float] = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    cli_main(
+                        ["render", *templates, "-c", str(root / "context.json"), "-j", str(jobs)]
+                    )
+                timings.append(time.perf_counter() - started)
+
+            print(f"--jobs {jobs:<3} {statistics.median(timings) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark of `Watcher.poll` latency on a generated project
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_watch.py --templates 2000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from dictrule import TemplateLoader, Watcher
+
+
+def build_project(root: Path, count: int, partials: int):
+    """Writes `count` templates including `partials` shared partials, and a context file"""
+
+    for index in range(partials):
+        (root / f"partial_{index}.json").write_text(
+            json.dumps([f"# partial {index}", {"eval": f"shared.value_{index}"}]),
+            encoding="utf-8",
+        )
+
+    for index in range(count):
+        (root / f"template_{index}.json").write_text(
+            json.dumps(
+                [
+                    {"include": f"partial_{index % partials}"},
+                    {"eval": f"models.model_{index}.name"},
+                    {"indent_1": {"format_snake_case": {"eval": f"models.model_{index}.name"}}},
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+    context = {
+        "shared": {f"value_{index}": index for index in range(partials)},
+        "models": {f"model_{index}": {"name": f"Model {index}"} for index in range(count)},
+    }
+    (root / "context.json").write_text(json.dumps(context), encoding="utf-8")
+    return context
+
+
+def touch(path: Path, content: str):
+    """Rewrites a file with a new modification time"""
+
+    path.write_text(content, encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_mtime_ns + 1_000_000, stat.st_mtime_ns + 1_000_000))
+
+
+def measure(watcher: Watcher, label: str):
+    """Polls once and prints the latency"""
+
+    started = time.perf_counter()
+    results = watcher.poll()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed * 1000:8.2f} ms  {len(results):5d} re-rendered")
+
+
+def main():
+    """Entry point"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=2000)
+    parser.add_argument("--partials", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        context = build_project(root, args.templates, args.partials)
+        watcher = Watcher(
+            loader=TemplateLoader([root], max_entries=args.templates + args.partials),
+            targets=[
+                (root / f"template_{index}.json", root / "out" / f"{index}.txt")
+                for index in range(args.templates)
+            ],
+            context_path=root / "context.json",
+        )
+
+        started = time.perf_counter()
+        watcher.render_all()
+        print(f"{'initial render':<28} {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+        measure(watcher, "no change")
+        touch(root / "template_7.json", json.dumps(["changed"]))
+        measure(watcher, "one template")
+        touch(root / "partial_3.json", json.dumps(["# changed partial"]))
+        measure(watcher, "one partial")
+        context["models"]["model_11"]["name"] = "Renamed"
+        touch(root / "context.json", json.dumps(context))
+        measure(watcher, "one context value")
+
+
+if __name__ == "__main__":
+    main()
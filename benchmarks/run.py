@@ -0,0 +1,151 @@
+"""Benchmark suite of dictrule
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/run.py --output results.json
+
+Compare with a previous run, exiting with status 1 on regressions:
+
+    PYTHONPATH=src python benchmarks/run.py --compare baseline.json --threshold 0.1
+
+Use `--scale 0.01` for a quick run; `wide_for_in` loops over 1M items at scale 1.
+`import_time` and `first_render` run in fresh interpreters; raise `--repeat`
+to steady them.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from workloads import WORKLOADS  # noqa: E402  pylint: disable=wrong-import-position
+
+
+def run_workloads(
+    names: List[str],
+    scale: float,
+    repeat: int,
+) -> Dict[str, Any]:
+    """Times every workload, printing a line per workload"""
+
+    results: Dict[str, Any] = {}
+    for name in names:
+        started = time.perf_counter()
+        workload = WORKLOADS[name](scale)
+        setup = time.perf_counter() - started
+        if workload.measure is not None:
+            timings = [workload.measure() for _ in range(repeat)]
+        else:
+            timings = timeit.Timer(workload.run, timer=time.perf_counter).repeat(
+                repeat=repeat,
+                number=1,
+            )
+        results[name] = {
+            "description": workload.description,
+            "size": workload.size,
+            "setup": setup,
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "timings": timings,
+        }
+        print(
+            f"{name:<24} {min(timings) * 1000:10.2f} ms min "
+            f"{statistics.median(timings) * 1000:10.2f} ms median  size {workload.size}"
+        )
+
+    return results
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[str]:
+    """Prints the ratio of each median to the baseline and returns the regressed workloads"""
+
+    regressions: List[str] = []
+    print()
+    print(f"{'workload':<24} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or base.get("size") != result["size"]:
+            print(f"{name:<24} {'-':>12} {result['median'] * 1000:10.2f}ms {'n/a':>8}")
+            continue
+
+        ratio = result["median"] / base["median"] if base["median"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  improved"
+
+        print(
+            f"{name:<24} {base['median'] * 1000:10.2f}ms "
+            f"{result['median'] * 1000:10.2f}ms {ratio:8.3f}{flag}"
+        )
+
+    return regressions
+
+
+def main() -> int:
+    """Entry point"""
+
+    parser = argparse.ArgumentParser(description="Runs the dictrule benchmark suite.")
+    parser.add_argument(
+        "workloads",
+        nargs="*",
+        help=f"workloads to run (default: all): {', '.join(WORKLOADS)}",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="input size factor")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per workload")
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON file of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown of the median flagged as a regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    names = args.workloads or list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(unknown)}")
+
+    results = run_workloads(names, args.scale, args.repeat)
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,508 @@
+"""Synthetic workloads of the benchmark suite
+
+Each workload builder takes a `scale` factor and returns a `Workload`, whose
+`run` callable is timed; building rules and contexts is excluded from timings.
+Workloads running in a fresh interpreter measure their own time instead.
+"""
+
+import copy
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+import dictrule
+from dictrule import (
+    Context,
+    CommentRule,
+    EvalObject,
+    EvalRule,
+    Generator,
+    eo_property,
+)
+
+
+class Workload:
+    """A timed callable and the size of its input"""
+
+    def __init__(
+        self,
+        run: Callable[[], Any],
+        size: int,
+        description: str,
+        measure: Optional[Callable[[], float]] = None,
+    ):
+        self.run = run
+        self.size = size
+        self.description = description
+        self.measure = measure
+
+
+class PrefixEvaluator(EvalRule.Evaluable):
+    """Evaluator serving every name under its prefix"""
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+
+    @property
+    def name(self) -> str:
+        return self._prefix
+
+    @property
+    def prefix_matching(self) -> bool:
+        return True
+
+    def run(self, cmd: str) -> Any:
+        return cmd[len(self._prefix):]
+
+
+class Node:
+    """Object graph node with eo_property attributes"""
+
+    def __init__(self, index: int, children: List["Node"]):
+        self._index = index
+        self._children = children
+
+    @eo_property
+    def index(self) -> int:
+        """Index of the node"""
+        return self._index
+
+    @eo_property
+    def name(self) -> str:
+        """Name of the node"""
+        return f"node_{self._index}"
+
+    @eo_property
+    def children(self) -> List["Node"]:
+        """Child nodes"""
+        return self._children
+
+
+def _scaled(value: int, scale: float) -> int:
+    return max(1, int(value * scale))
+
+
+def _context(values: Dict[str, Any]) -> Context:
+    return Context(
+        [
+            EvalRule.ContextCase(
+                evaluators=[],
+                fallback=EvalRule.DictPathEvaluator("", values),
+            ),
+            CommentRule.ContextCase(
+                singleline=CommentRule.ContextCase.SinglelineComment("# "),
+            ),
+        ]
+    )
+
+
+def deep_nesting(scale: float) -> Workload:
+    """`indent`/`comment`/`block` rules nested 50 levels deep, repeated"""
+
+    def nested(depth: int) -> Any:
+        rule: Any = {"eval": "leaf"}
+        for level in range(depth):
+            kind = level % 3
+            if kind == 0:
+                rule = {"indent_1": {"block": [f"level {level}", rule]}}
+            elif kind == 1:
+                rule = {"comment": [f"level {level}", rule]}
+            else:
+                rule = {"block": [f"level {level}", rule]}
+        return rule
+
+    count = _scaled(200, scale)
+    generator = Generator([nested(50) for _ in range(count)])
+    context = _context({"leaf": "value"})
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count * 50,
+        description="50-level indent/comment/block trees",
+    )
+
+
+def wide_for_in(scale: float, trusted: bool = False) -> Workload:
+    """A `for`/`in` loop over many items"""
+
+    count = _scaled(1_000_000, scale)
+    generator = Generator(
+        [
+            {
+                "for": "item",
+                "in": "items",
+                "block": [{"inline": [{"eval": "item.index"}, ": ", {"eval": "item"}]}],
+            }
+        ],
+        trusted=trusted,
+    )
+    context = _context({"items": [f"item_{index}" for index in range(count)]})
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count,
+        description="for/in over a list of strings" + (", trusted" if trusted else ""),
+    )
+
+
+def heavy_format(scale: float) -> Workload:
+    """Every `format_*` rule over evaluated text"""
+
+    formats = [
+        "format_lowercase",
+        "format_uppercase",
+        "format_upper_head",
+        "format_camel_case",
+        "format_pascal_case",
+        "format_kebab_case",
+        "format_snake_case",
+    ]
+    count = _scaled(20_000, scale)
+    generator = Generator(
+        [{formats[index % len(formats)]: {"eval": "title"}} for index in range(count)]
+    )
+    context = _context({"title": "The quick brown Fox jumpsOver the lazy_dog"})
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count,
+        description="format_* rules",
+    )
+
+
+def many_prefix_evaluators(scale: float) -> Workload:
+    """Names resolved through hundreds of prefix evaluators"""
+
+    prefixes = _scaled(500, scale ** 0.5)
+    count = _scaled(50_000, scale)
+    context = Context(
+        [
+            EvalRule.ContextCase(
+                evaluators=[PrefixEvaluator(f"ns_{index}.") for index in range(prefixes)],
+            )
+        ]
+    )
+    generator = Generator(
+        [{"eval": f"ns_{index % prefixes}.value_{index}"} for index in range(count)]
+    )
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count,
+        description=f"eval names over {prefixes} prefix evaluators",
+    )
+
+
+def namespace_evaluators(scale: float) -> Workload:
+    """The names of `many_prefix_evaluators`, resolved through a namespace"""
+
+    prefixes = _scaled(500, scale ** 0.5)
+    count = _scaled(50_000, scale)
+    context = Context(
+        [
+            EvalRule.ContextCase(
+                evaluators=[
+                    EvalRule.NamespaceEvaluator(
+                        evaluators=[PrefixEvaluator(f"ns_{index}.") for index in range(prefixes)],
+                    )
+                ],
+            )
+        ]
+    )
+    generator = Generator(
+        [{"eval": f"ns_{index % prefixes}.value_{index}"} for index in range(count)]
+    )
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count,
+        description=f"eval names over {prefixes} evaluators mounted in a namespace",
+    )
+
+
+def eval_object_graph(scale: float) -> Workload:
+    """Converting and rendering a large `EvalObject` graph"""
+
+    width = _scaled(200, scale ** 0.5)
+    roots = [
+        Node(index, [Node(index * width + child, []) for child in range(width)])
+        for index in range(width)
+    ]
+    generator = Generator(
+        [
+            {
+                "for": "root",
+                "in": "roots",
+                "block": [
+                    {"eval": "root.name"},
+                    {
+                        "for": "child",
+                        "in": "root.children",
+                        "block": [{"indent_1": {"eval": "child.name"}}],
+                    },
+                ],
+            }
+        ]
+    )
+    _ = generator.template
+
+    def run():
+        graph = EvalObject.from_eo_property_object(roots)
+        context = Context(
+            [EvalRule.ContextCase(evaluators=[EvalRule.KeyValueEvaluator("roots", graph)])]
+        )
+        return generator.generate(context)
+
+    return Workload(
+        run=run,
+        size=width * (width + 1),
+        description="EvalObject conversion and nested for/in",
+    )
+
+
+def columns_for_in(scale: float, columns: bool = True) -> Workload:
+    """A trusted `for`/`in` loop reading fields of homogeneous records"""
+
+    count = _scaled(100_000, scale)
+    records = [
+        {"name": f"item_{index}", "speed": index, "ratio": index / 3} for index in range(count)
+    ]
+    generator = Generator(
+        [
+            {
+                "for": "item",
+                "in": "items",
+                "block": [
+                    {"eval": "item.name"},
+                    {"eval": "item.speed"},
+                    {"eval": "item.ratio"},
+                ],
+            }
+        ],
+        trusted=True,
+    )
+    items = EvalObject.from_homogeneous_list(records) if columns else records
+    context = Context(
+        [EvalRule.ContextCase(evaluators=[EvalRule.KeyValueEvaluator("items", items)])]
+    )
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count,
+        description="for/in over " + ("EvalObject.Columns" if columns else "dicts"),
+    )
+
+
+README_RULES: List[Any] = [
+    '"""',
+    {"format_uppercase": {"eval": "gen.header"}},
+    '"""',
+    None,
+    {
+        "comment": [
+            {"inline": [{"eval": "gen.id"}, ". ", {"eval": "gen.title"}]},
+            {"inline": ["Creation date: ", {"eval": "gen.date"}]},
+            {"inline": ["Author: ", {"eval": "gen.author"}]},
+        ]
+    },
+    None,
+    {"indent_0": "class Sample:"},
+    {"indent_1": "def contents(self) -> List[str]:"},
+    {"indent_2": "return ["},
+    {
+        "indent_3": {
+            "for": "content",
+            "in": "gen.contents",
+            "block": [
+                {"inline": [{"stringify": {"eval": "content.index"}}, ","]},
+                {"inline": [{"stringify": {"eval": "content"}}, ","]},
+            ],
+        }
+    },
+    {"indent_2": "]"},
+]
+
+
+def _readme_context() -> Context:
+    return _context(
+        {
+            "gen": {
+                "header": "THIS IS THE GENERATED EXAMPLE CODE",
+                "id": 3101,
+                "title": "Sampler for getting sample contents",
+                "date": "01-01-2024",
+                "author": "Zooxy Le",
+                "contents": ["Train", "Flight", "Ship"],
+            }
+        }
+    )
+
+
+def readme_sample(scale: float, trusted: bool = False) -> Workload:
+    """The README sample, repeated"""
+
+    count = _scaled(2_000, scale)
+    generator = Generator(README_RULES * count, trusted=trusted)
+    context = _readme_context()
+    _ = generator.template
+    return Workload(
+        run=lambda: generator.generate(context),
+        size=count,
+        description="README sample" + (", trusted" if trusted else ""),
+    )
+
+
+def cold_cached_readme_sample(scale: float) -> Workload:
+    """Copies of the README sample, rendered with an emptied render cache"""
+
+    count = _scaled(2_000, scale)
+    cache = dictrule.RenderCache()
+    rules = [copy.deepcopy(rule) for _ in range(count) for rule in README_RULES]
+    generator = Generator(rules, cache=cache)
+    context = _readme_context()
+    _ = generator.template
+
+    def run():
+        cache.clear()
+        return generator.generate(context)
+
+    return Workload(
+        run=run,
+        size=count,
+        description="README sample, cold render cache",
+    )
+
+
+def compile_readme_sample(scale: float) -> Workload:
+    """Compiling the README sample, repeated"""
+
+    count = _scaled(2_000, scale)
+    rules = README_RULES * count
+    return Workload(
+        run=lambda: Generator(rules).template,
+        size=count,
+        description="compiling the README sample",
+    )
+
+
+def load_compiled(scale: float) -> Workload:
+    """Loading the compiled README sample, repeated without shared dictionaries"""
+
+    count = _scaled(700, scale)
+    rules = json.loads(json.dumps(README_RULES * count))
+    data = Generator(rules).dumps()
+    nodes = len(Generator.loads(data).template.nodes)
+    return Workload(
+        run=lambda: Generator.loads(data),
+        size=nodes,
+        description=f"Generator.loads of {nodes} nodes, {len(data)} bytes",
+    )
+
+
+def dict_path_lookups(scale: float) -> Workload:
+    """`DictPathEvaluator` lookups in a nested document"""
+
+    count = _scaled(100_000, scale)
+    document = {"records": [{"owner": {"name": f"owner_{index}"}} for index in range(1_000)]}
+    evaluator = EvalRule.DictPathEvaluator("doc", document)
+    names = [f"doc.records[{index % 1_000}].owner.name" for index in range(count)]
+
+    def run():
+        for name in names:
+            evaluator.run(name)
+
+    return Workload(
+        run=run,
+        size=count,
+        description="DictPathEvaluator key path lookups",
+    )
+
+
+def _run_python(
+    args: List[str],
+) -> subprocess.CompletedProcess:
+    """Runs a fresh interpreter importing the benchmarked `dictrule`"""
+
+    source_dir = str(Path(dictrule.__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source_dir, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable] + args,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_time(scale: float) -> Workload:  # pylint: disable=unused-argument
+    """`import dictrule` in a fresh interpreter, as reported by `python -X importtime`"""
+
+    def measure() -> float:
+        result = _run_python(["-X", "importtime", "-c", "import dictrule"])
+        microseconds = 0
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == "dictrule":
+                microseconds += int(fields[1])
+        return microseconds / 1_000_000
+
+    return Workload(
+        run=measure,
+        size=1,
+        description="import dictrule, -X importtime cumulative",
+        measure=measure,
+    )
+
+
+def first_render(scale: float) -> Workload:  # pylint: disable=unused-argument
+    """`import dictrule` and a first render in a fresh interpreter"""
+
+    code = (
+        "import time\n"
+        "started = time.perf_counter()\n"
+        "import dictrule\n"
+        "dictrule.Generator(['text', {'format_uppercase': 'text'}]).generate()\n"
+        "print(time.perf_counter() - started)\n"
+    )
+
+    def measure() -> float:
+        return float(_run_python(["-c", code]).stdout)
+
+    return Workload(
+        run=measure,
+        size=1,
+        description="import dictrule and render once",
+        measure=measure,
+    )
+
+
+WORKLOADS: Dict[str, Callable[[float], Workload]] = {
+    "deep_nesting": deep_nesting,
+    "wide_for_in": wide_for_in,
+    "trusted_wide_for_in": lambda scale: wide_for_in(scale, trusted=True),
+    "heavy_format": heavy_format,
+    "many_prefix_evaluators": many_prefix_evaluators,
+    "namespace_evaluators": namespace_evaluators,
+    "eval_object_graph": eval_object_graph,
+    "columns_for_in": columns_for_in,
+    "dicts_for_in": lambda scale: columns_for_in(scale, columns=False),
+    "readme_sample": readme_sample,
+    "trusted_readme_sample": lambda scale: readme_sample(scale, trusted=True),
+    "cold_cached_readme_sample": cold_cached_readme_sample,
+    "compile_readme_sample": compile_readme_sample,
+    "load_compiled": load_compiled,
+    "dict_path_lookups": dict_path_lookups,
+    "import_time": import_time,
+    "first_render": first_render,
+}
@@ -37,6 +37,11 @@ if __name__ == "__main__":
         package_dir={"": "src"},
         include_package_data=True,
         python_requires=">=3.7",
+        entry_points={
+            "console_scripts": [
+                "dictrule = dictrule.cli:main",
+            ],
+        },
         license=about["__license__"],
         zip_safe=False,
         classifiers=[
@@ -7,11 +7,15 @@ r"""
 
 """
 
-from .generator import Generator
-from .rule import Rule
-from .context import Context
-from .eo_property import eo_property
-from .eval_object import EvalObject
+from typing import (
+    Any,
+    Dict,
+    List,
+    TYPE_CHECKING,
+)
+
+import importlib
+
 from .__version__ import (
     __title__,
     __description__,
@@ -27,27 +31,105 @@ from .exceptions import (
     NoneValueException,
     InvalidTypeException,
     InvalidValueException,
+    TemplateValidationException,
 )
 
-from .built_in_rules import (
-    BlockRule,
-    CommentRule,
-    EvalRule,
-    InlineRule,
-    IndentRule,
-    ForInRule,
-    JoinBlockRule,
-    JoinEvalRule,
-    FormatRule,
-)
+# Imported eagerly, a lazy name would be shadowed by its submodule once imported.
+from .eo_property import eo_property
+
+if TYPE_CHECKING:
+    from .generator import Generator
+    from .loader import TemplateLoader
+    from .project import Project
+    from .watcher import Watcher
+    from .rule import Rule
+    from .template import Template
+    from .hooks import Hooks
+    from .profiler import Profiler
+    from .memory import MemoryReport
+    from .render_cache import RenderCache
+    from .context import Context, FrozenContext
+    from .eval_object import EvalObject
+    from .built_in_rules import (
+        BlockRule,
+        CommentRule,
+        EvalRule,
+        InlineRule,
+        IndentRule,
+        ForInRule,
+        JoinBlockRule,
+        JoinEvalRule,
+        FormatRule,
+        StringifyRule,
+        IncludeRule,
+        MacroRule,
+        CallRule,
+    )
+
+# Modules of the public names, imported on first access to keep `import dictrule` fast.
+# For the same reason, modules import slow standard modules such as `re` in the
+# functions using them.
+_LAZY_NAMES: Dict[str, str] = {
+    "Generator": "generator",
+    "TemplateLoader": "loader",
+    "Project": "project",
+    "Watcher": "watcher",
+    "Rule": "rule",
+    "Template": "template",
+    "Hooks": "hooks",
+    "Profiler": "profiler",
+    "MemoryReport": "memory",
+    "RenderCache": "render_cache",
+    "Context": "context",
+    "FrozenContext": "context",
+    "EvalObject": "eval_object",
+    "BlockRule": "built_in_rules",
+    "CommentRule": "built_in_rules",
+    "EvalRule": "built_in_rules",
+    "InlineRule": "built_in_rules",
+    "IndentRule": "built_in_rules",
+    "ForInRule": "built_in_rules",
+    "JoinBlockRule": "built_in_rules",
+    "JoinEvalRule": "built_in_rules",
+    "FormatRule": "built_in_rules",
+    "StringifyRule": "built_in_rules",
+    "IncludeRule": "built_in_rules",
+    "MacroRule": "built_in_rules",
+    "CallRule": "built_in_rules",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
 
 __all__ = [
     "Generator",
+    "TemplateLoader",
+    "Project",
+    "Watcher",
     "Rule",
+    "Template",
+    "Hooks",
+    "Profiler",
+    "MemoryReport",
+    "RenderCache",
     "Context",
+    "FrozenContext",
     "NoneValueException",
     "InvalidTypeException",
     "InvalidValueException",
+    "TemplateValidationException",
     "BlockRule",
     "CommentRule",
     "EvalRule",
@@ -57,6 +139,10 @@ __all__ = [
     "JoinBlockRule",
     "JoinEvalRule",
     "FormatRule",
+    "StringifyRule",
+    "IncludeRule",
+    "MacroRule",
+    "CallRule",
     "eo_property",
     "EvalObject",
     "__title__",
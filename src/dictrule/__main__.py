@@ -0,0 +1,8 @@
+"""Runs the `dictrule` command with `python -m dictrule`"""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,16 +7,61 @@ r"""
                                                                
 """
 
-from .block_rule import BlockRule
-from .comment_rule import CommentRule
-from .eval_rule import EvalRule
-from .inline_rule import InlineRule
-from .indent_rule import IndentRule
-from .for_in_rule import ForInRule
-from .join_block_rule import JoinBlockRule
-from .join_eval_rule import JoinEvalRule
-from .format_rule import FormatRule
-from .stringify_rule import StringifyRule
+from typing import (
+    Any,
+    Dict,
+    List,
+    TYPE_CHECKING,
+)
+
+import importlib
+
+if TYPE_CHECKING:
+    from .block_rule import BlockRule
+    from .comment_rule import CommentRule
+    from .eval_rule import EvalRule
+    from .inline_rule import InlineRule
+    from .indent_rule import IndentRule
+    from .for_in_rule import ForInRule
+    from .join_block_rule import JoinBlockRule
+    from .join_eval_rule import JoinEvalRule
+    from .format_rule import FormatRule
+    from .stringify_rule import StringifyRule
+    from .include_rule import IncludeRule
+    from .macro_rule import MacroRule
+    from .call_rule import CallRule
+
+# Modules of the rules, imported on first access.
+_LAZY_NAMES: Dict[str, str] = {
+    "BlockRule": "block_rule",
+    "CommentRule": "comment_rule",
+    "EvalRule": "eval_rule",
+    "InlineRule": "inline_rule",
+    "IndentRule": "indent_rule",
+    "ForInRule": "for_in_rule",
+    "JoinBlockRule": "join_block_rule",
+    "JoinEvalRule": "join_eval_rule",
+    "FormatRule": "format_rule",
+    "StringifyRule": "stringify_rule",
+    "IncludeRule": "include_rule",
+    "MacroRule": "macro_rule",
+    "CallRule": "call_rule",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
 
 __all__ = [
     "BlockRule",
@@ -29,4 +74,7 @@ __all__ = [
     "JoinEvalRule",
     "FormatRule",
     "StringifyRule",
+    "IncludeRule",
+    "MacroRule",
+    "CallRule",
 ]
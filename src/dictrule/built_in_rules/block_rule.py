@@ -2,6 +2,7 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Callable,
     Optional,
@@ -36,6 +37,22 @@ class BlockRule(Rule):
     def _block(self, props: Dict[str, Any]) -> Any:
         """Property method for retrieving the `block` attribute."""
 
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
     def parse(
         self,
         rule_dict: Dict[str, Any],
@@ -61,6 +78,45 @@ class BlockRule(Rule):
             context=context,
         )
 
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `block` is a list.
+
+        Args:
+            rule_dict (Dict[str, Any]): A dictionary of rules.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        _, block = self._block(rule_dict)
+        if not isinstance(block, list):
+            return ["`block` value must be a list"]
+
+        return []
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary.
+
+        Args:
+            rule_dict (Dict[str, Any]): A dictionary of rules.
+            rule_callback (Callable[[Optional[Context], Any], str]): Callback function
+                for rules not handled by the current rule.
+            context (Optional[Context], optional): Context for the rule. Defaults to None.
+
+        Returns:
+            str: The generated text.
+        """
+
+        return "\n".join([str(rule_callback(context, rule)) for rule in rule_dict["block"]])
+
     def internal_parse(
         self,
         rule_dict: Dict[str, Any],
@@ -0,0 +1,223 @@
+"""Call rule module"""
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Any,
+    Callable,
+    Optional,
+)
+
+from .eval_rule import EvalRule
+from .for_in_rule import ForInRule
+from .macro_rule import MacroRule
+from ..rule import Rule
+from ..dr_property import dr_property
+from ..context import Context
+from ..exceptions import (
+    NoneValueException,
+    InvalidTypeException,
+    InvalidValueException,
+)
+
+
+class CallRule(Rule):
+    """This rule generates the block of a macro defined by `MacroRule`.
+
+    Each argument of `with` is bound to its param for the rules of the block:
+    - A `dict` with only an `eval` key passes the evaluated value as is,
+      so its properties can be read, like `param.name`.
+    - Another `dict` passes the text generated from it.
+    - Other values are passed as is.
+
+    Examples:
+    ---------
+    >>> dictrule.Generator([
+    ...     {"define": "field", "params": ["name"], "block": ["self.", {"eval": "name"}]},
+    ...     {"call": "field", "with": {"name": {"eval": "user.name"}}},
+    ... ]).generate(context)
+    self.
+    zooxy
+    """
+
+    @dr_property()
+    def _call(self, props: Dict[str, Any]) -> Any:
+        """Property method for retrieving the `call` attribute."""
+
+    @dr_property(optional=True)
+    def _with(self, props: Dict[str, Any]) -> Any:
+        """Property method for retrieving the `with` attribute."""
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself, arguments are compiled as sub-rules.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
+    def context_names(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """The rule reads macros from the `MacroRule` context and binds arguments
+        in the `EvalRule` context.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: The `MacroRule` and `EvalRule` case names.
+        """
+
+        _ = rule_dict
+        return [MacroRule.CONTEXT_NAME, EvalRule.CONTEXT_NAME]
+
+    def rule_values(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[Tuple[str, Any]]:
+        """Gets the arguments of `with`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `CallRule`.
+
+        Returns:
+            List[Tuple[str, Any]]: Argument paths and values.
+        """
+
+        return [(f"with.{key}", value) for key, value in self._arguments(rule_dict).items()]
+
+    def called_definition(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[str]:
+        """Gets the called macro name.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `CallRule`.
+
+        Returns:
+            Optional[str]: The macro name.
+        """
+
+        _, name = self._call(rule_dict)
+        if not isinstance(name, str):
+            raise InvalidTypeException(f"`call:` {name} must be a str")
+
+        return name
+
+    def parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses the rule dictionary for `CallRule`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `CallRule`.
+            rule_callback (Callable[[Optional[Context], Any], str]): Fallback for other rules.
+            context (Optional[Context], optional): Context containing
+                a `MacroRule.ContextCase`. Defaults to None.
+
+        Returns:
+            str: Parsed value for `rule_dict`.
+        """
+
+        if context is None:
+            raise NoneValueException("param `context` must not be None")
+
+        macro_context_case = context.get(MacroRule.CONTEXT_NAME)
+        if not isinstance(macro_context_case, MacroRule.ContextCase):
+            raise NoneValueException("Not found `MacroRule.ContextCase` in context")
+
+        macro = macro_context_case.macro(self.called_definition(rule_dict))
+        arguments = self._arguments(rule_dict)
+        for key in arguments:
+            if key not in macro.params:
+                raise InvalidValueException(f"Unknown argument `{key}` of macro `{macro.name}`")
+
+        eval_context_case = context.get(EvalRule.CONTEXT_NAME)
+        if not isinstance(eval_context_case, EvalRule.ContextCase):
+            eval_context_case = EvalRule.ContextCase(evaluators=[])
+
+        for param in macro.params:
+            if param not in arguments:
+                raise InvalidValueException(f"Missing argument `{param}` of macro `{macro.name}`")
+
+            eval_context_case = eval_context_case.with_evaluator(
+                ForInRule.ForInEval(
+                    var_name=param,
+                    var=self._argument_value(arguments[param], context, rule_callback),
+                    extra_properties={},
+                )
+            )
+
+        block_context = context.with_case(eval_context_case)
+        return "\n".join([str(rule_callback(block_context, rule)) for rule in macro.block])
+
+    def _arguments(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Gets the `with` arguments."""
+
+        _, arguments = self._with(rule_dict)
+        if arguments is None:
+            return {}
+
+        if not isinstance(arguments, dict):
+            raise InvalidTypeException(f"`call:with:` {arguments} must be a dict")
+
+        return arguments
+
+    @staticmethod
+    def _argument_value(
+        argument: Any,
+        context: Context,
+        rule_callback: Callable[[Optional[Context], Any], str],
+    ) -> Any:
+        """Gets the value bound for an argument."""
+
+        if not isinstance(argument, dict):
+            return argument
+
+        eval_name = argument.get(EvalRule.CONTEXT_NAME)
+        if len(argument) == 1 and isinstance(eval_name, str):
+            eval_context_case = context.get(EvalRule.CONTEXT_NAME)
+            if isinstance(eval_context_case, EvalRule.ContextCase):
+                return eval_context_case.eval(eval_name)
+
+        return rule_callback(context, argument)
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `call` is a str and `with` a dict.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `CallRule`.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        errors: List[str] = []
+        for check in (self.called_definition, self._arguments):
+            try:
+                check(rule_dict)
+            except InvalidTypeException as error:
+                errors.append(str(error))
+
+        return errors
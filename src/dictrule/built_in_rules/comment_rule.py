@@ -2,6 +2,7 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Optional,
     Callable,
@@ -202,6 +203,22 @@ class CommentRule(Rule):
 
             return None
 
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
     def parse(
         self,
         rule_dict: Dict[str, Any],
@@ -289,3 +306,22 @@ class CommentRule(Rule):
             output += "\n" + comment_close
 
         return output
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `comment` is a rule dictionary, a text or a list of rules.
+
+        Args:
+            rule_dict (Dict[str, Any]): The dictionary of rules.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        _, comment = self._comment(rule_dict)
+        if not isinstance(comment, (dict, str, list)):
+            return ["`comment` rule is an invalid type"]
+
+        return []
@@ -3,12 +3,19 @@
 from typing import (
     Dict,
     List,
+    Tuple,
     Any,
     Callable,
+    Iterable,
+    Union,
     Optional,
 )
 
+import copy
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from collections import OrderedDict
 from functools import lru_cache
 from ..rule import Rule
 from ..dr_property import dr_property
@@ -16,6 +23,7 @@ from ..context import Context
 from ..exceptions import (
     NoneValueException,
     InvalidTypeException,
+    InvalidValueException,
 )
 
 
@@ -73,6 +81,32 @@ class EvalRule(Rule):
 
             return None
 
+        def run_many(
+            self,
+            cmds: List[str],
+        ) -> Dict[str, Any]:
+            """Run many `cmd` at once
+
+            Override this method to resolve all eval names of a render in one round trip,
+            such as one query to a metadata service. `Generator` calls it once
+            before rendering with every eval name the template references.
+
+            Args:
+                cmds (List[str]): commands or variable names to eval the values
+
+            Returns:
+                Dict[str, Any]: map of values [cmd: str, value: Any],
+                    missing commands are evaluated later by `run`
+            """
+
+            return {cmd: self.run(cmd) for cmd in cmds}
+
+        @property
+        def batched(self) -> bool:
+            """`batched` property defines evaluator overrides `run_many`"""
+
+            return type(self).run_many is not EvalRule.Evaluable.run_many
+
     class KeyValueEvaluator(Evaluable):
         """Evaluator using key-value pairs."""
 
@@ -98,21 +132,396 @@ class EvalRule(Rule):
         def run(self, cmd: str) -> Any:
             return self._value
 
+    class DictPathEvaluator(Evaluable):
+        """Evaluator serving key paths straight from a nested dict/list document.
+
+        The evaluator matches eval names by its prefix, the rest of the name is
+        a key path such as `a.b[3].c`. Paths are parsed once and cached,
+        the document is never converted.
+
+        Examples:
+        ---------
+        >>> evaluator = EvalRule.DictPathEvaluator(
+        ...     prefix="doc",
+        ...     document={"a": {"b": [0, 1, 2, {"c": "value"}]}},
+        ... )
+        >>> evaluator.run("doc.a.b[3].c")
+        value
+        """
+
+        _SEGMENT_PATTERN = r"([^.\[\]]+)|\[(-?\d+)\]|(\.)"
+
+        def __init__(
+            self,
+            prefix: str,
+            document: Any,
+        ):
+            """Initial method for `DictPathEvaluator`
+
+            Args:
+                prefix (str): prefix of eval names served by the evaluator,
+                    an empty prefix serves every name
+                document (Any): nested dict/list document
+            """
+
+            self._prefix = prefix
+            self._document = document
+
+        @property
+        def name(self) -> str:
+            return self._prefix
+
+        @property
+        def prefix_matching(self) -> bool:
+            return True
+
+        @property
+        def document(self) -> Any:
+            """Get the `document` property"""
+
+            return self._document
+
+        @staticmethod
+        @lru_cache(maxsize=4096)
+        def parse_path(
+            path: str,
+        ) -> Tuple[Union[str, int], ...]:
+            """Parses a key path into segments.
+
+            Args:
+                path (str): key path such as `a.b[3].c`
+
+            Returns:
+                Tuple[Union[str, int], ...]: dict keys as `str`, list indexes as `int`
+            """
+
+            import re  # pylint: disable=import-outside-toplevel
+
+            segments: List[Union[str, int]] = []
+            position = 0
+            expects_key = False
+            for match in re.finditer(EvalRule.DictPathEvaluator._SEGMENT_PATTERN, path):
+                if match.start() != position:
+                    break
+
+                key, index, dot = match.groups()
+                if dot:
+                    if expects_key or not segments:
+                        break
+                    expects_key = True
+                elif key is not None:
+                    if segments and not expects_key:
+                        break
+                    segments.append(key)
+                    expects_key = False
+                else:
+                    if expects_key:
+                        break
+                    segments.append(int(index))
+
+                position = match.end()
+
+            if position != len(path) or expects_key:
+                raise InvalidValueException(f"Invalid key path `{path}`")
+
+            return tuple(segments)
+
+        def run(self, cmd: str) -> Any:
+            path = cmd[len(self._prefix) :]
+            if path.startswith("."):
+                path = path[1:]
+            elif path and self._prefix and not path.startswith("["):
+                return None
+
+            value = self._document
+            for segment in EvalRule.DictPathEvaluator.parse_path(path):
+                if isinstance(segment, int):
+                    if not isinstance(value, Sequence) or isinstance(value, str):
+                        return None
+                    try:
+                        value = value[segment]
+                    except IndexError:
+                        return None
+                elif isinstance(value, Mapping):
+                    value = value.get(segment)
+                else:
+                    return None
+
+            return value
+
+    class NamespaceEvaluator(Evaluable):
+        """Evaluator resolving names through a tree of evaluators and values
+        mounted at key paths.
+
+        A name such as `gen.owner.name` is resolved segment by segment to the
+        deepest mount on its path, instead of scanning prefix evaluators in order.
+        Evaluators are run with the name without the prefix of the namespace,
+        like prefix evaluators, and mounted values are walked by the rest of the name,
+        through keys of mappings, indexes of sequences and attributes of other objects.
+
+        Resolved paths are compiled once per name, and walked values are cached
+        per path, so `gen.owner.name` and `gen.owner.email` access `gen.owner` once.
+        Both caches keep the `max_entries` most recently added entries.
+        Call `invalidate` after changing a mounted value.
+
+        Examples:
+        ---------
+        >>> evaluator = EvalRule.NamespaceEvaluator(
+        ...     evaluators=[GitEvaluator()],  # named "git."
+        ...     values={"gen": {"title": "Sample"}},
+        ... )
+        >>> evaluator.mount("gen.owner", owner)
+        >>> evaluator.run("gen.owner.name")
+        Zooxy Le
+        """
+
+        _MISSING = object()
+
+        class Mount:
+            """Node of the namespace tree"""
+
+            __slots__ = (
+                "children",
+                "target",
+                "mounted",
+            )
+
+            def __init__(self):
+                self.children: Dict[Union[str, int], "EvalRule.NamespaceEvaluator.Mount"] = {}
+                self.target: Any = None
+                self.mounted = False
+
+        def __init__(
+            self,
+            prefix: str = "",
+            evaluators: Iterable["EvalRule.Evaluable"] = (),
+            values: Optional[Mapping] = None,
+            max_entries: int = 65536,
+        ):
+            """Initial method for `NamespaceEvaluator`
+
+            Args:
+                prefix (str, optional): prefix of eval names served by the evaluator,
+                    an empty prefix serves every name. Defaults to "".
+                evaluators (Iterable[EvalRule.Evaluable], optional): evaluators
+                    mounted at their names. Defaults to ().
+                values (Optional[Mapping], optional): values mounted at the root.
+                    Defaults to None.
+                max_entries (int, optional): Maximum number of compiled names,
+                    and of cached values. Defaults to 65536.
+            """
+
+            if max_entries <= 0:
+                raise InvalidValueException("`max_entries` must be positive")
+
+            self._prefix = prefix
+            self._max_entries = max_entries
+            self._root = EvalRule.NamespaceEvaluator.Mount()
+            self._paths: "OrderedDict[str, Optional[Tuple[Any, ...]]]" = OrderedDict()
+            self._values: "OrderedDict[Tuple[Union[str, int], ...], Any]" = OrderedDict()
+            if values is not None:
+                self.mount("", values)
+
+            for evaluator in evaluators:
+                self.mount(evaluator.name, evaluator)
+
+        @property
+        def name(self) -> str:
+            return self._prefix
+
+        @property
+        def prefix_matching(self) -> bool:
+            return True
+
+        def mount(
+            self,
+            path: str,
+            target: Any,
+        ) -> "EvalRule.NamespaceEvaluator":
+            """Mounts an evaluator or a value at a key path, replacing the previous mount.
+
+            Evaluators not matching by prefix only serve their exact path.
+
+            Args:
+                path (str): key path such as `gen.owner`, a trailing dot is ignored
+                    and an empty path mounts at the root
+                target (Any): an `EvalRule.Evaluable` or a value
+
+            Returns:
+                EvalRule.NamespaceEvaluator: The evaluator.
+            """
+
+            if path.endswith("."):
+                path = path[:-1]
+
+            node = self._root
+            for segment in EvalRule.DictPathEvaluator.parse_path(path):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = EvalRule.NamespaceEvaluator.Mount()
+                node = child
+
+            node.target = target
+            node.mounted = True
+            self.invalidate()
+            return self
+
+        def invalidate(self):
+            """Drops the compiled paths and the cached values."""
+
+            self._paths = OrderedDict()
+            self._values = OrderedDict()
+
+        def run(self, cmd: str) -> Any:
+            compiled = self._paths.get(cmd, EvalRule.NamespaceEvaluator._MISSING)
+            if compiled is EvalRule.NamespaceEvaluator._MISSING:
+                compiled = self._compile(cmd)
+                self._put(self._paths, cmd, compiled)
+
+            if compiled is None:
+                return None
+
+            target, segments, depth, path = compiled
+            if isinstance(target, EvalRule.Evaluable):
+                return target.run(path)
+
+            return self._value(target, segments, depth)
+
+        @staticmethod
+        def access(
+            value: Any,
+            segment: Union[str, int],
+        ) -> Any:
+            """Accesses a key, an index or a public attribute of a value.
+
+            Args:
+                value (Any): The value.
+                segment (Union[str, int]): dict key or attribute name as `str`,
+                    list index as `int`
+
+            Returns:
+                Any: The accessed value, None if not found.
+            """
+
+            if isinstance(segment, int):
+                if not isinstance(value, Sequence) or isinstance(value, str):
+                    return None
+
+                try:
+                    return value[segment]
+                except IndexError:
+                    return None
+
+            if isinstance(value, Mapping):
+                return value.get(segment)
+
+            if segment.startswith("_"):
+                return None
+
+            return getattr(value, segment, None)
+
+        def _compile(
+            self,
+            cmd: str,
+        ) -> Optional[Tuple[Any, Tuple[Union[str, int], ...], int, str]]:
+            """Finds the deepest mount serving a name, with the name segments,
+            the depth of the mount and the name without the prefix."""
+
+            if not cmd.startswith(self._prefix):
+                return None
+
+            path = cmd[len(self._prefix) :]
+            if path.startswith("."):
+                path = path[1:]
+            elif path and self._prefix and not path.startswith("["):
+                return None
+
+            try:
+                segments = EvalRule.DictPathEvaluator.parse_path(path)
+            except InvalidValueException:
+                return None
+
+            found: Optional[Tuple[Any, Tuple[Union[str, int], ...], int, str]] = None
+            node: Optional[EvalRule.NamespaceEvaluator.Mount] = self._root
+            for depth in range(len(segments) + 1):
+                if depth > 0:
+                    node = node.children.get(segments[depth - 1])
+                    if node is None:
+                        break
+
+                if not node.mounted:
+                    continue
+
+                target = node.target
+                if (
+                    isinstance(target, EvalRule.Evaluable)
+                    and not target.prefix_matching
+                    and depth != len(segments)
+                ):
+                    continue
+
+                found = (target, segments, depth, path)
+
+            return found
+
+        def _value(
+            self,
+            target: Any,
+            segments: Tuple[Union[str, int], ...],
+            depth: int,
+        ) -> Any:
+            """Walks a mounted value by the segments after its mount, caching every path."""
+
+            values = self._values
+            value = values.get(segments, EvalRule.NamespaceEvaluator._MISSING)
+            if value is not EvalRule.NamespaceEvaluator._MISSING:
+                return value
+
+            if len(segments) == depth:
+                value = target
+            else:
+                value = self._value(target, segments[:-1], depth)
+                if value is not None:
+                    value = EvalRule.NamespaceEvaluator.access(value, segments[-1])
+
+            self._put(values, segments, value)
+            return value
+
+        def _put(
+            self,
+            cache: "OrderedDict[Any, Any]",
+            key: Any,
+            value: Any,
+        ):
+            """Adds an entry to a cache, dropping the oldest entry when it is full."""
+
+            if len(cache) >= self._max_entries:
+                cache.popitem(last=False)
+
+            cache[key] = value
+
     class ContextCase(Context.Case):
         """`Context.Case` for `EvalRule`.
 
         This class manages contexts for the `EvalRule`,
-        including a list of evaluators and fallbacks.
+        including a list of evaluators, plain values and fallbacks.
+
+        Names are evaluated by the evaluator of the same name, then by prefix
+        evaluators, then from `values`, and finally by `fallback`. Values are
+        looked up in the mapping directly, without an evaluator per key, and
+        names of nested values are key paths such as `gen.contents[0]`.
 
         Attributes:
             name (str): The name of the context, inherited from `Context.Case`.
             evaluator_list (List["EvalRule.Evaluable"]): A list of evaluators.
             fallback (Optional["EvalRule.Evaluable"]): The fallback evaluator for other rules.
+            values (Optional[Mapping]): Plain values, optionally nested.
 
         Args:
             evaluators (List["EvalRule.Evaluable"]): The list of evaluators.
             fallback (Optional["EvalRule.Evaluable"], optional): The fallback evaluator
                 for other rules. Defaults to None.
+            values (Optional[Mapping], optional): Plain values. Defaults to None.
         """
 
         @property
@@ -133,10 +542,17 @@ class EvalRule(Rule):
 
             return self._fallback
 
+        @property
+        def values(self) -> Optional[Mapping]:
+            """Get the `values` property"""
+
+            return self._values
+
         def __init__(
             self,
             evaluators: List["EvalRule.Evaluable"],
             fallback: Optional["EvalRule.Evaluable"] = None,
+            values: Optional[Mapping] = None,
         ):
             """Constructor method for `EvalRule.ContextCase`.
 
@@ -144,10 +560,16 @@ class EvalRule(Rule):
                 evaluators (List["EvalRule.Evaluable"]): List of evaluators.
                 fallback (Optional["EvalRule.Evaluable"], optional): Fallback for other rules.
                     Defaults to None.
+                values (Optional[Mapping], optional): Plain values served without
+                    evaluators, such as `{"gen": {"title": "Sample"}}`. Defaults to None.
             """
 
             self._evaluator_list = list(evaluators)
             self._fallback = fallback
+            self._values = values
+            self._values_evaluator = (
+                EvalRule.DictPathEvaluator("", values) if values is not None else None
+            )
             nonprefix_evaluators: Dict[str, EvalRule.Evaluable] = {}
             prefix_evaluators: Dict[str, EvalRule.Evaluable] = {}
 
@@ -159,6 +581,22 @@ class EvalRule(Rule):
 
             self._evaluators = nonprefix_evaluators
             self._prefix_evaluators = prefix_evaluators
+            self._batch: Dict[str, Any] = {}
+            self._observer: Optional[Callable[[str, Any, float], None]] = None
+            self._frozen = False
+            self._batched = any(evaluator.batched for evaluator in evaluators) or bool(
+                fallback and fallback.batched
+            )
+
+        @property
+        def batched(self) -> bool:
+            """Get the `batched` property
+
+            Returns:
+                bool: True if any evaluator or the fallback overrides `run_many`
+            """
+
+            return self._batched
 
         def eval(
             self,
@@ -173,6 +611,223 @@ class EvalRule(Rule):
                 Optional[Any]: Evaluated value.
             """
 
+            if self._observer is not None:
+                return self._observed_eval(eval_name)
+
+            batch = self._batch
+            if batch and eval_name in batch:
+                return batch[eval_name]
+
+            return self._run(eval_name)
+
+        def with_observer(
+            self,
+            observer: Optional[Callable[[str, Any, float], None]],
+        ) -> "EvalRule.ContextCase":
+            """Derives a context case calling `observer` after every evaluation,
+            kept by the context cases derived from it.
+
+            Args:
+                observer (Optional[Callable[[str, Any, float], None]]): Called with
+                    the eval name, the value and the seconds spent evaluating it.
+                    None removes the observer.
+
+            Returns:
+                EvalRule.ContextCase: The derived context case.
+            """
+
+            case = self._derive()
+            case._observer = observer
+            return case
+
+        def prefetch(
+            self,
+            eval_names: Iterable[str],
+        ) -> "EvalRule.ContextCase":
+            """Derives a context case serving `eval_names` from one `run_many` call
+            per batched evaluator.
+
+            Args:
+                eval_names (Iterable[str]): The names to evaluate.
+
+            Returns:
+                EvalRule.ContextCase: The derived context case,
+                    `self` if no name is served by a batched evaluator.
+            """
+
+            groups: Dict[int, Tuple[EvalRule.Evaluable, List[str]]] = {}
+            for eval_name in eval_names:
+                if eval_name in self._batch:
+                    continue
+
+                evaluator = self._find_evaluator(eval_name)
+                if not evaluator or not evaluator.batched:
+                    continue
+
+                groups.setdefault(id(evaluator), (evaluator, []))[1].append(eval_name)
+
+            if not groups:
+                return self
+
+            batch = dict(self._batch)
+            for evaluator, names in groups.values():
+                values = evaluator.run_many(names)
+                for name in names:
+                    if name in values:
+                        batch[name] = values[name]
+
+            case = self._derive()
+            case._batch = batch
+            return case
+
+        def with_evaluated(
+            self,
+            values: Dict[str, Any],
+        ) -> "EvalRule.ContextCase":
+            """Derives a context case serving values evaluated beforehand,
+            like prefetched values.
+
+            Args:
+                values (Dict[str, Any]): map of values [eval_name: str, value: Any]
+
+            Returns:
+                EvalRule.ContextCase: The derived context case,
+                    `self` if every name is already served.
+            """
+
+            evaluated = {name: value for name, value in values.items() if name not in self._batch}
+            if not evaluated:
+                return self
+
+            case = self._derive()
+            case._batch = dict(self._batch)
+            case._batch.update(evaluated)
+            return case
+
+        def with_evaluator(
+            self,
+            evaluator: "EvalRule.Evaluable",
+        ) -> "EvalRule.ContextCase":
+            """Derives a context case with an extra evaluator, keeping prefetched values
+            that are not served by `evaluator`.
+
+            Args:
+                evaluator (EvalRule.Evaluable): The evaluator to add.
+
+            Returns:
+                EvalRule.ContextCase: The derived context case.
+            """
+
+            case = self._derive()
+            case._evaluator_list = self._evaluator_list + [evaluator]
+            case._batched = self._batched or evaluator.batched
+            if evaluator.prefix_matching:
+                case._prefix_evaluators = dict(self._prefix_evaluators)
+                case._prefix_evaluators[evaluator.name] = evaluator
+                shadowed = [
+                    name for name in self._batch if name.startswith(evaluator.name)
+                ]
+            else:
+                case._evaluators = dict(self._evaluators)
+                case._evaluators[evaluator.name] = evaluator
+                shadowed = [evaluator.name] if evaluator.name in self._batch else []
+
+            if shadowed:
+                case._batch = dict(self._batch)
+                for name in shadowed:
+                    case._batch.pop(name)
+
+            return case
+
+        def frozen(self) -> "EvalRule.ContextCase":
+            """Gets a copy of the context case owning its evaluator list and a deep
+            copy of its `values`, kept by the context cases derived from it.
+
+            Returns:
+                EvalRule.ContextCase: The copy, `self` if it is already one.
+            """
+
+            if self._frozen:
+                return self
+
+            case = self._derive()
+            case._evaluator_list = list(self._evaluator_list)
+            if self._values is not None:
+                case._values = copy.deepcopy(self._values)
+                case._values_evaluator = EvalRule.DictPathEvaluator("", case._values)
+
+            case._frozen = True
+            return case
+
+        def _derive(self) -> "EvalRule.ContextCase":
+            """Copies the context case, sharing its evaluators."""
+
+            case = EvalRule.ContextCase.__new__(type(self))
+            case.__dict__.update(self.__dict__)
+            return case
+
+        def _observed_eval(
+            self,
+            eval_name: str,
+        ) -> Optional[Any]:
+            """Evaluates value with name, reporting it to the observer."""
+
+            started = time.perf_counter()
+            if self._batch and eval_name in self._batch:
+                value = self._batch[eval_name]
+            else:
+                value = self._run(eval_name)
+
+            self._observer(eval_name, value, time.perf_counter() - started)
+            return value
+
+        def _run(
+            self,
+            eval_name: str,
+        ) -> Optional[Any]:
+            """Evaluates value with name, without prefetched values."""
+
+            eval_rule = self._evaluators.get(eval_name)
+            if not eval_rule and self._prefix_evaluators:
+                eval_rule = self._find_eval_by_prefix(
+                    eval_name=eval_name,
+                )
+
+            if eval_rule:
+                return eval_rule.run(eval_name)
+
+            if self._values is not None:
+                value = self._value(eval_name)
+                if value is not None:
+                    return value
+
+            if self._fallback:
+                return self._fallback.run(eval_name)
+
+            return None
+
+        def _value(
+            self,
+            eval_name: str,
+        ) -> Optional[Any]:
+            """Gets the value of a name, or of a key path, from `values`."""
+
+            value = self._values.get(eval_name)
+            if value is not None or ("." not in eval_name and "[" not in eval_name):
+                return value
+
+            try:
+                return self._values_evaluator.run(eval_name)
+            except InvalidValueException:
+                return None
+
+        def _find_evaluator(
+            self,
+            eval_name: str,
+        ) -> Optional["EvalRule.Evaluable"]:
+            """Finds the evaluator of a name, falling back to `fallback`
+            for names without a value in `values`."""
+
             eval_rule = self._evaluators.get(eval_name)
             if not eval_rule:
                 eval_rule = self._find_eval_by_prefix(
@@ -180,11 +835,12 @@ class EvalRule(Rule):
                 )
 
             if not eval_rule:
-                if self._fallback:
-                    return self._fallback.run(eval_name)
-                return None
+                if self._values is not None and self._value(eval_name) is not None:
+                    return None
 
-            return eval_rule.run(eval_name)
+                return self._fallback or None
+
+            return eval_rule
 
         @lru_cache(maxsize=1024)
         def _find_eval_by_prefix(
@@ -206,6 +862,46 @@ class EvalRule(Rule):
 
             return None
 
+    @staticmethod
+    def context_case(
+        context: Optional[Context],
+    ) -> "EvalRule.ContextCase":
+        """Gets the `EvalRule.ContextCase` of a context.
+
+        Args:
+            context (Optional[Context]): The context.
+
+        Returns:
+            EvalRule.ContextCase: The context case.
+        """
+
+        if context is None:
+            raise NoneValueException("param `context` must not be None")
+
+        context_case = context.get(EvalRule.CONTEXT_NAME)
+        if not isinstance(context_case, EvalRule.ContextCase):
+            raise InvalidTypeException(
+                f"Invalid {type(context_case)} type for {EvalRule.CONTEXT_NAME} in context"
+            )
+
+        return context_case
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """Gets the `eval` name of the rule.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing EvalRule.
+
+        Returns:
+            Optional[List[str]]: The `eval` name.
+        """
+
+        _, eval_rule = self._eval(rule_dict)
+        return [eval_rule] if isinstance(eval_rule, str) else []
+
     def parse(
         self,
         rule_dict: Dict[str, Any],
@@ -254,15 +950,7 @@ class EvalRule(Rule):
         """
 
         _ = rule_callback
-        if context is None:
-            raise NoneValueException("param `context` must not be None")
-
-        context_case: EvalRule.ContextCase = context.get(EvalRule.CONTEXT_NAME)
-
-        if not isinstance(context_case, EvalRule.ContextCase):
-            raise InvalidTypeException(
-                f"Invalid {type(context_case)} type for {EvalRule.CONTEXT_NAME} in context"
-            )
+        context_case = EvalRule.context_case(context)
 
         _, eval_rule = self._eval(rule_dict)
         if not isinstance(eval_rule, str):
@@ -270,3 +958,48 @@ class EvalRule(Rule):
 
         value = context_case.eval(eval_rule)
         return value
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `eval` is a str.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing EvalRule.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        _, eval_rule = self._eval(rule_dict)
+        if not isinstance(eval_rule, str):
+            return ["`eval` must be a str"]
+
+        return []
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing EvalRule.
+            rule_callback (Callable[[Optional[Context], Any], str]): Fallback for other rules.
+            context (Optional[Context], optional): EvalRule's context. Defaults to None.
+
+        Returns:
+            str: Parsed value for `rule_dict`.
+        """
+
+        _ = rule_callback
+        value = EvalRule.context_case(context).eval(rule_dict["eval"])
+        if value is None:
+            raise NoneValueException(
+                f"EvalRule with dict `{rule_dict}` reacts None value"
+            )
+
+        return value
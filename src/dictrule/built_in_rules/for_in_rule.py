@@ -6,6 +6,7 @@ from typing import (
     Iterable,
     Any,
     Callable,
+    Mapping,
     Optional,
 )
 
@@ -14,6 +15,7 @@ from .block_rule import BlockRule
 from ..rule import Rule
 from ..dr_property import dr_property
 from ..context import Context
+from ..eval_object import EvalObject
 from ..exceptions import (
     NoneValueException,
     InvalidTypeException,
@@ -102,6 +104,7 @@ class ForInRule(Rule):
             var_name: str,
             var: Any,
             extra_properties: Dict[str, Any],
+            columns: Optional[Mapping[str, Any]] = None,
         ):
             """Initializes the ForInEval object.
 
@@ -109,11 +112,15 @@ class ForInRule(Rule):
                 var_name (str): The name of the variable in the rule dictionary.
                 var (Any): The name of the executable variable.
                 extra_properties (Dict[str, Any]): A map of variable names and values.
+                columns (Optional[Mapping[str, Any]], optional): Columns of the looped
+                    `EvalObject.Columns`, whose fields are read at the `index` extra
+                    property without going through the row. Defaults to None.
             """
 
             self._var_name = str(var_name)
             self._var = var
             self._extra_properties = dict(extra_properties)
+            self._columns = columns
 
         def run(
             self,
@@ -134,23 +141,74 @@ class ForInRule(Rule):
             if not cmd.startswith(var_prefix):
                 return self._var
 
-            properties = cmd.split(".")
-            property_value = ""
-            extra_prop = ".".join(properties[1:])
+            extra_prop = cmd[len(var_prefix) :]
             if extra_prop in self._extra_properties:
-                property_value = self._extra_properties[extra_prop]
-            else:
-                local_var = self._var
-                for prop in properties[1:]:
-                    callable_var = getattr(local_var, prop)
-                    if callable(callable_var):
-                        local_var = callable_var(local_var)
-                    else:
-                        local_var = callable_var
+                return self._extra_properties[extra_prop]
 
-                property_value = local_var
+            if self._columns is not None and extra_prop in self._columns:
+                return self._columns[extra_prop][self._extra_properties["index"]]
 
-            return property_value
+            local_var = self._var
+            for prop in EvalRule.DictPathEvaluator.parse_path(extra_prop):
+                if isinstance(prop, int) or isinstance(local_var, Mapping):
+                    local_var = EvalRule.NamespaceEvaluator.access(local_var, prop)
+                    continue
+
+                callable_var = getattr(local_var, prop)
+                if callable(callable_var):
+                    local_var = callable_var(local_var)
+                else:
+                    local_var = callable_var
+
+            return local_var
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """Gets the `in` name of the rule.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `ForInRule`.
+
+        Returns:
+            Optional[List[str]]: The `in` name.
+        """
+
+        _, in_var = self._in(rule_dict)
+        return [in_var] if isinstance(in_var, str) else []
+
+    def bound_evals(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Gets the `for` name bound for the rules in `block`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `ForInRule`.
+
+        Returns:
+            List[str]: The `for` name.
+        """
+
+        _, for_var = self._for(rule_dict)
+        return [for_var] if isinstance(for_var, str) else []
+
+    def context_names(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """The rule evaluates `in` from the `EvalRule` context.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `ForInRule`.
+
+        Returns:
+            List[str]: The `EvalRule` case name.
+        """
+
+        _ = rule_dict
+        return [EvalRule.CONTEXT_NAME]
 
     def parse(
         self,
@@ -197,35 +255,22 @@ class ForInRule(Rule):
             raise InvalidTypeException("`in` must return an Iterable value")
 
         blocks: List[str] = []
-        case_map = dict(context.case_map)
-        eval_context_case: EvalRule.ContextCase = case_map.get(EvalRule.CONTEXT_NAME)
+        eval_context_case: EvalRule.ContextCase = context.get(EvalRule.CONTEXT_NAME)
         is_eval_context_case = isinstance(eval_context_case, EvalRule.ContextCase)
-        case_map.pop(EvalRule.CONTEXT_NAME)
-        without_eval_cases = list(case_map.values())
+        columns = eval_in.data if isinstance(eval_in, EvalObject.Columns) else None
         for index, var in enumerate(eval_in):
-            block_context = Context(
-                without_eval_cases
-                + [
-                    EvalRule.ContextCase(
-                        evaluators=(
-                            eval_context_case.evaluator_list
-                            if is_eval_context_case
-                            else []
-                        )
-                        + [
-                            ForInRule.ForInEval(
-                                var_name=for_var,
-                                var=var,
-                                extra_properties={
-                                    "index": index,
-                                },
-                            )
-                        ],
-                        fallback=(
-                            eval_context_case.fallback if is_eval_context_case else None
-                        ),
-                    ),
-                ],
+            for_in_eval = ForInRule.ForInEval(
+                var_name=for_var,
+                var=var,
+                extra_properties={
+                    "index": index,
+                },
+                columns=columns,
+            )
+            block_context = context.with_case(
+                eval_context_case.with_evaluator(for_in_eval)
+                if is_eval_context_case
+                else EvalRule.ContextCase(evaluators=[for_in_eval])
             )
 
             block_parsed = BlockRule().parse(
@@ -239,3 +284,75 @@ class ForInRule(Rule):
             blocks.append(block_parsed)
 
         return "\n".join(blocks)
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `for` and `in` are str and `block` is a list.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `ForInRule`.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        _, for_var = self._for(rule_dict)
+        _, in_var = self._in(rule_dict)
+        _, block = self._block(rule_dict)
+        errors: List[str] = []
+        if not isinstance(for_var, str):
+            errors.append(f"`for:` {for_var} must be a str")
+
+        if not isinstance(in_var, str):
+            errors.append(f"`for:in:` {in_var} must be a str")
+
+        if not isinstance(block, list):
+            errors.append(f"`for:block:` {block} must be a list")
+
+        return errors
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary, joining the block of every item
+        without creating an `EvalRule` and a `BlockRule` per item.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `ForInRule`.
+            rule_callback (Callable[[Optional[Context], Any], str]): Fallback for other rules.
+            context (Optional[Context], optional): `ForInRule` context. Defaults to None.
+
+        Returns:
+            str: Parsed value for `rule_dict`.
+        """
+
+        eval_context_case = EvalRule.context_case(context)
+        for_var = rule_dict["for"]
+        block = rule_dict["block"]
+        eval_in = eval_context_case.eval(rule_dict["in"])
+        if not isinstance(eval_in, Iterable):
+            raise InvalidTypeException("`in` must return an Iterable value")
+
+        blocks: List[str] = []
+        columns = eval_in.data if isinstance(eval_in, EvalObject.Columns) else None
+        for index, var in enumerate(eval_in):
+            block_context = context.with_case(
+                eval_context_case.with_evaluator(
+                    ForInRule.ForInEval(
+                        var_name=for_var,
+                        var=var,
+                        extra_properties={
+                            "index": index,
+                        },
+                        columns=columns,
+                    )
+                )
+            )
+            blocks.append("\n".join([str(rule_callback(block_context, rule)) for rule in block]))
+
+        return "\n".join(blocks)
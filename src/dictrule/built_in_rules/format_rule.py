@@ -2,12 +2,12 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Callable,
     Optional,
 )
 
-import re
 from enum import Enum
 from ..rule import Rule
 from ..dr_property import dr_property
@@ -97,6 +97,8 @@ class FormatRule(Rule):
             if self == FormatRule.Type.UPPER_HEAD:
                 return (text[0].upper() + text[1:]) if len(text) > 0 else ""
 
+            import re  # pylint: disable=import-outside-toplevel
+
             if self == FormatRule.Type.CAMEL_CASE:
                 words = list(filter(None, re.split(r"[^a-zA-Z0-9]+", text)))
                 return (
@@ -125,6 +127,26 @@ class FormatRule(Rule):
 
             return text
 
+    _TYPES: Dict[str, "FormatRule.Type"] = {
+        f"format_{format_type.value}": format_type for format_type in Type
+    }
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
     def parse(
         self,
         rule_dict: Dict[str, Any],
@@ -164,3 +186,59 @@ class FormatRule(Rule):
             )
 
         return format_type.format(format_text)
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that the `format_` key names a `FormatRule.Type`.
+
+        Args:
+            rule_dict (Dict[str, Any]): The dictionary containing the format rule.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        format_name, _ = self._format(rule_dict)
+        if not format_name.startswith("format_"):
+            return [f"Invalid format {format_name}"]
+
+        if format_name not in FormatRule._TYPES:
+            return [f"`format:` type {format_name[len('format_') :]} is invalid"]
+
+        return []
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary, looking the format type up by its key.
+
+        Args:
+            rule_dict (Dict[str, Any]): The dictionary containing the format rule.
+            rule_callback (Callable[[Optional[Context], Any], str]): A callback function
+                for processing rules.
+            context (Optional[Context], optional): The context for the rule. Defaults to None.
+
+        Returns:
+            str: The formatted text.
+        """
+
+        for format_name, format_rule in rule_dict.items():
+            format_type = FormatRule._TYPES.get(format_name)
+            if format_type is not None:
+                break
+
+        format_text = rule_callback(
+            context,
+            format_rule,
+        )
+        if not isinstance(format_text, str):
+            raise InvalidTypeException(
+                f"`format:` text {format_text} for rule {format_rule} must be a str"
+            )
+
+        return format_type.format(format_text)
@@ -0,0 +1,219 @@
+"""Include rule module"""
+
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Any,
+    Callable,
+    Optional,
+)
+
+from ..rule import Rule
+from ..dr_property import dr_property
+from ..context import Context
+from ..exceptions import (
+    InvalidTypeException,
+)
+
+if TYPE_CHECKING:
+    from ..loader import TemplateLoader
+
+
+class IncludeRule(Rule):
+    """This rule includes the rules of a partial template, joined by a new line.
+
+    Partials are resolved through a `TemplateLoader`, so every includer shares
+    the same parsed rules, compiled once in the template of the includer.
+    Include cycles are reported when compiling. Generators render the partial rules
+    compiled in their template, `TemplateLoader.load` compiles the template again
+    when a partial changes.
+
+    Examples:
+    ---------
+    >>> loader = dictrule.TemplateLoader(["partials"])
+    >>> dictrule.Generator(
+    ...     [{"include": "license"}, "import os"],
+    ...     parse_rules=dictrule.Generator.STD_RULES + [dictrule.IncludeRule(loader)],
+    ... ).generate(context)
+    # Copyright (c) 2024 Zooxy Le
+    import os
+    """
+
+    CONTEXT_NAME = "include_rule"
+
+    class ContextCase(Context.Case):
+        """`Context.Case` for `IncludeRule`, injected by `Generator` with the partial
+        rules compiled in the template."""
+
+        @property
+        def name(self) -> str:
+            """Get the `name` property"""
+
+            return IncludeRule.CONTEXT_NAME
+
+        def __init__(
+            self,
+            sub_rules: Dict[int, List[Any]],
+        ):
+            """Initializes the context case.
+
+            Args:
+                sub_rules (Dict[int, List[Any]]): map of `id` of rule dictionaries
+                    to their compiled rules, @see `Template.sub_rules`
+            """
+
+            self._sub_rules = sub_rules
+
+        def partial_rules(
+            self,
+            rule_dict: Dict[str, Any],
+        ) -> Optional[List[Any]]:
+            """Gets the compiled partial rules of an include rule dictionary.
+
+            Args:
+                rule_dict (Dict[str, Any]): The rule dictionary.
+
+            Returns:
+                Optional[List[Any]]: The partial rules, None if not compiled.
+            """
+
+            return self._sub_rules.get(id(rule_dict))
+
+    def __init__(
+        self,
+        loader: "TemplateLoader",
+    ) -> None:
+        """Constructor method of `IncludeRule`
+
+        Args:
+            loader (TemplateLoader): The loader resolving partial names.
+        """
+
+        super().__init__()
+        self._loader = loader
+
+    @property
+    def loader(self) -> "TemplateLoader":
+        """Get the `loader` property"""
+
+        return self._loader
+
+    @dr_property()
+    def _include(self, props: Dict[str, Any]) -> Any:
+        """Property method for retrieving the `include` attribute."""
+
+    def partial_name(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> str:
+        """Gets the name of the included partial.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            str: The partial name.
+        """
+
+        _, include = self._include(rule_dict)
+        if not isinstance(include, str):
+            raise InvalidTypeException("`include` must be a str")
+
+        return include
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
+    def context_names(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """The `IncludeRule.ContextCase` is injected by `Generator`, not read from callers.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
+    def sub_rules(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[Any]:
+        """Gets the rules of the included partial.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[Any]: The partial rules.
+        """
+
+        return self._loader.load_rules(self.partial_name(rule_dict))
+
+    def parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses the rules of the included partial, compiled in the template
+        when `context` has an `IncludeRule.ContextCase`, loaded otherwise.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary to parse.
+            rule_callback (Callable[[Optional[Context], Any], str]): A callback function
+                to apply to each rule.
+            context (Optional[Context], optional): The context to use during parsing.
+                Defaults to None.
+
+        Returns:
+            str: The generated text.
+        """
+
+        include_case = context.get(IncludeRule.CONTEXT_NAME) if context is not None else None
+        rules = None
+        if isinstance(include_case, IncludeRule.ContextCase):
+            rules = include_case.partial_rules(rule_dict)
+
+        if rules is None:
+            rules = self.sub_rules(rule_dict)
+
+        return "\n".join([str(rule_callback(context, rule)) for rule in rules])
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `include` is a str.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        _, include = self._include(rule_dict)
+        if not isinstance(include, str):
+            return ["`include` must be a str"]
+
+        return []
@@ -2,6 +2,7 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Callable,
     Optional,
@@ -70,6 +71,22 @@ class IndentRule(Rule):
     def _indent(self, props: Dict[str, Any]) -> Any:
         """Property method for retrieving the `indent` attribute."""
 
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
     def parse(
         self,
         rule_dict: Dict[str, Any],
@@ -133,3 +150,25 @@ class IndentRule(Rule):
 
         value = indent_prefix + value.replace("\n", f"\n{indent_prefix}")
         return value
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that the `indent_` key ends with a number of indents.
+
+        Args:
+            rule_dict (Dict[str, Any]): The dictionary containing the indent rule.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        indent, _ = self._indent(rule_dict)
+        if not indent.startswith("indent_"):
+            return [f"Invalid indent {indent}"]
+
+        if not indent[len("indent_") :].isdigit():
+            return ["`indent_` suffix must be a digit str"]
+
+        return []
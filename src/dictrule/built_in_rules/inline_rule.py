@@ -2,6 +2,7 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Callable,
     Optional,
@@ -30,6 +31,22 @@ class InlineRule(Rule):
     def _inline(self, props: Dict[str, Any]) -> Any:
         """Property method for retrieving the `inline` attribute."""
 
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
     def parse(
         self,
         rule_dict: Dict[str, Any],
@@ -54,3 +71,43 @@ class InlineRule(Rule):
             raise InvalidTypeException("`inline` must be a list")
 
         return "".join([str(rule_callback(context, rule)) for rule in inline])
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `inline` is a list.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        _, inline = self._inline(rule_dict)
+        if not isinstance(inline, list):
+            return ["`inline` must be a list"]
+
+        return []
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary to parse.
+            rule_callback (Callable[[Optional[Context], Any], str]): A callback function
+                to apply to each rule.
+            context (Optional[Context], optional): The context to use during parsing.
+                Defaults to None.
+
+        Returns:
+            str: The parsed string.
+        """
+
+        return "".join([str(rule_callback(context, rule)) for rule in rule_dict["inline"]])
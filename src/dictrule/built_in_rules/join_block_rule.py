@@ -2,6 +2,7 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Callable,
     Optional,
@@ -66,3 +67,46 @@ class JoinBlockRule(BlockRule):
         )
 
         return block
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `join` is a str and `block` is a list.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        errors = super().validate(rule_dict)
+        _, join = self._join(rule_dict)
+        if not isinstance(join, str):
+            errors.append("`join` must be a str")
+
+        return errors
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary to parse.
+            rule_callback (Callable[[Optional[Context], Any], str]): A callback function
+                to apply to each rule.
+            context (Optional[Context], optional): The context to use during parsing.
+                Defaults to None.
+
+        Returns:
+            str: The parsed block of text.
+        """
+
+        return rule_dict["join"].join(
+            [str(rule_callback(context, rule)) for rule in rule_dict["block"]]
+        )
@@ -2,6 +2,7 @@
 
 from typing import (
     Dict,
+    List,
     Any,
     Callable,
     Iterable,
@@ -78,3 +79,49 @@ class JoinEvalRule(EvalRule):
             raise InvalidTypeException("`join:eval:` must be a Iterable value")
 
         return separator.join(eval_rule)
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `join` and `eval` are str.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        errors = super().validate(rule_dict)
+        _, separator = self._join(rule_dict)
+        if not isinstance(separator, str):
+            errors.append("`join` must be a str")
+
+        return errors
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a validated rule dictionary.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary to parse.
+            rule_callback (Callable[[Optional[Context], Any], str]): A callback function
+                to apply to each rule.
+            context (Optional[Context], optional): The context to use during parsing.
+                Defaults to None.
+
+        Returns:
+            str: The parsed block of text.
+        """
+
+        _ = rule_callback
+        eval_rule = EvalRule.context_case(context).eval(rule_dict["eval"])
+        if not isinstance(eval_rule, Iterable):
+            raise InvalidTypeException("`join:eval:` must be a Iterable value")
+
+        return rule_dict["join"].join(eval_rule)
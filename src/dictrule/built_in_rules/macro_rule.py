@@ -0,0 +1,294 @@
+"""Macro rule module"""
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Any,
+    Callable,
+    Optional,
+)
+
+from ..rule import Rule
+from ..dr_property import dr_property
+from ..context import Context
+from ..exceptions import (
+    InvalidTypeException,
+    InvalidValueException,
+)
+
+
+class MacroRule(Rule):
+    """This rule defines a named, parameterized block of rules, called by `CallRule`.
+
+    Macros are defined at the top level of the generation rules and generate
+    no text themselves. The `block` of a macro is compiled once, and its params
+    are bound for every call the same way as the `for` variable of `ForInRule`.
+
+    Examples:
+    ---------
+    >>> dictrule.Generator([
+    ...     {
+    ...         "define": "getter",
+    ...         "params": ["name"],
+    ...         "block": [{"format_camel_case": {"eval": "name"}}],
+    ...     },
+    ...     {"call": "getter", "with": {"name": "user name"}},
+    ...     {"call": "getter", "with": {"name": "created at"}},
+    ... ]).generate()
+    userName
+    createdAt
+    """
+
+    CONTEXT_NAME = "macro"
+
+    class Macro:
+        """Parameterized block of rules"""
+
+        def __init__(
+            self,
+            name: str,
+            params: Tuple[str, ...],
+            block: List[Any],
+        ):
+            """Constructor method of `MacroRule.Macro`
+
+            Args:
+                name (str): The macro name.
+                params (Tuple[str, ...]): Parameter names.
+                block (List[Any]): Rules generated by each call.
+            """
+
+            self._name = name
+            self._params = params
+            self._block = block
+
+        @property
+        def name(self) -> str:
+            """Get the `name` property"""
+
+            return self._name
+
+        @property
+        def params(self) -> Tuple[str, ...]:
+            """Get the `params` property"""
+
+            return self._params
+
+        @property
+        def block(self) -> List[Any]:
+            """Get the `block` property"""
+
+            return self._block
+
+    class ContextCase(Context.Case):
+        """`Context.Case` for `CallRule`, injected by `Generator` with the macros
+        defined by the template."""
+
+        @property
+        def name(self) -> str:
+            """Get the `name` property"""
+
+            return MacroRule.CONTEXT_NAME
+
+        def __init__(
+            self,
+            macros: List["MacroRule.Macro"],
+        ):
+            """Initializes the context case.
+
+            Args:
+                macros (List[MacroRule.Macro]): Callable macros.
+            """
+
+            self._macros = {macro.name: macro for macro in macros}
+
+        @property
+        def macros(self) -> Dict[str, "MacroRule.Macro"]:
+            """Get the `macros` property"""
+
+            return self._macros
+
+        def macro(
+            self,
+            name: str,
+        ) -> "MacroRule.Macro":
+            """Gets a macro by name.
+
+            Args:
+                name (str): The macro name.
+
+            Returns:
+                MacroRule.Macro: The macro.
+            """
+
+            macro = self._macros.get(name)
+            if macro is None:
+                raise InvalidValueException(f"Not found macro `{name}`")
+
+            return macro
+
+    @dr_property()
+    def _define(self, props: Dict[str, Any]) -> Any:
+        """Property method for retrieving the `define` attribute."""
+
+    @dr_property(optional=True)
+    def _params(self, props: Dict[str, Any]) -> Any:
+        """Property method for retrieving the `params` attribute."""
+
+    @dr_property()
+    def _block(self, props: Dict[str, Any]) -> Any:
+        """Property method for retrieving the `block` attribute."""
+
+    def macro(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> "MacroRule.Macro":
+        """Creates the macro defined by `rule_dict`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `MacroRule`.
+
+        Returns:
+            MacroRule.Macro: The macro.
+        """
+
+        _, name = self._define(rule_dict)
+        _, params = self._params(rule_dict)
+        _, block = self._block(rule_dict)
+
+        if not isinstance(name, str):
+            raise InvalidTypeException(f"`define:` {name} must be a str")
+
+        if params is None:
+            params = []
+
+        if not isinstance(params, list) or not all(isinstance(p, str) for p in params):
+            raise InvalidTypeException(f"`define:params:` {params} must be a list of str")
+
+        if not isinstance(block, list):
+            raise InvalidTypeException(f"`define:block:` {block} must be a list")
+
+        return MacroRule.Macro(
+            name=name,
+            params=tuple(params),
+            block=block,
+        )
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """The rule reads no eval names itself.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[List[str]]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
+    def bound_evals(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Gets the params bound for the rules in `block`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `MacroRule`.
+
+        Returns:
+            List[str]: The params.
+        """
+
+        return list(self.macro(rule_dict).params)
+
+    def context_names(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """The rule reads no context case.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            List[str]: An empty list.
+        """
+
+        _ = rule_dict
+        return []
+
+    def rule_values(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[Tuple[str, Any]]:
+        """Gets the `block` of the macro.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `MacroRule`.
+
+        Returns:
+            List[Tuple[str, Any]]: The `block` key and value.
+        """
+
+        _, block = self._block(rule_dict)
+        return [("block", block)]
+
+    def definition_name(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[str]:
+        """Gets the macro name.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `MacroRule`.
+
+        Returns:
+            Optional[str]: The macro name.
+        """
+
+        return self.macro(rule_dict).name
+
+    def parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """A definition generates no text.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `MacroRule`.
+            rule_callback (Callable[[Optional[Context], Any], str]): Fallback for other rules.
+            context (Optional[Context], optional): Context for the rule. Defaults to None.
+
+        Returns:
+            str: An empty string.
+        """
+
+        _ = rule_dict, rule_callback, context
+        return ""
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks that `define` is a str, `params` a list of str and `block` a list.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules containing `MacroRule`.
+
+        Returns:
+            List[str]: Error messages.
+        """
+
+        try:
+            self.macro(rule_dict)
+        except InvalidTypeException as error:
+            return [str(error)]
+
+        return []
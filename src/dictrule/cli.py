@@ -0,0 +1,372 @@
+"""Command-line interface module
+
+Usage:
+    dictrule render TEMPLATE [TEMPLATE ...] [--context FILE] [--jobs N]
+        [--search-path DIR] [--output-dir DIR] [--timings]
+    dictrule watch TEMPLATE [TEMPLATE ...] --output-dir DIR [--context FILE]
+        [--search-path DIR] [--interval SECONDS]
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+    Optional,
+    TextIO,
+)
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .__version__ import __version__
+from .loader import TemplateLoader
+from .project import Project
+from .watcher import Watcher
+from .context import Context
+from .exceptions import (
+    NoneValueException,
+    InvalidTypeException,
+    InvalidValueException,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser of the `dictrule` command.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="dictrule",
+        description="Generates text from dictrule templates.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    render = commands.add_parser(
+        "render",
+        help="render templates",
+        description="Renders YAML or JSON templates with a context.",
+    )
+    render.add_argument("templates", nargs="+", type=Path, help="template files")
+    render.add_argument(
+        "-c",
+        "--context",
+        type=Path,
+        help="JSON or YAML file whose values are served to every `eval` name",
+    )
+    render.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes rendering templates in parallel (default: 1)",
+    )
+    render.add_argument(
+        "-I",
+        "--search-path",
+        type=Path,
+        action="append",
+        default=[],
+        help="directory of included partials, can be repeated (default: .)",
+    )
+    render.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help="write each template to this directory, named after the template "
+        "without its last suffix, instead of stdout; unchanged files are not rewritten",
+    )
+    render.add_argument(
+        "--timings",
+        action="store_true",
+        help="print load and render time of each template to stderr",
+    )
+    render.set_defaults(handler=run_render)
+
+    watch = commands.add_parser(
+        "watch",
+        help="re-render templates when files change",
+        description="Renders templates, then re-renders only the outputs affected "
+        "by changed templates, partials and context files.",
+    )
+    watch.add_argument("templates", nargs="+", type=Path, help="template files")
+    watch.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        required=True,
+        help="directory of outputs, named after each template without its last suffix",
+    )
+    watch.add_argument(
+        "-c",
+        "--context",
+        type=Path,
+        help="JSON or YAML file whose values are served to every `eval` name",
+    )
+    watch.add_argument(
+        "-I",
+        "--search-path",
+        type=Path,
+        action="append",
+        default=[],
+        help="directory of included partials, can be repeated (default: .)",
+    )
+    watch.add_argument(
+        "--interval",
+        type=float,
+        default=0.05,
+        help="seconds between polls (default: 0.05)",
+    )
+    watch.set_defaults(handler=run_watch)
+    return parser
+
+
+def output_paths(
+    templates: List[Path],
+    output_dir: Path,
+) -> List[Path]:
+    """Gets the output files of templates, named after each template without its last suffix.
+
+    Args:
+        templates (List[Path]): The template files.
+        output_dir (Path): The output directory.
+
+    Returns:
+        List[Path]: The output file of each template.
+
+    Raises:
+        InvalidValueException: If different templates have the same output file,
+            like `a/config.py.yml` and `b/config.py.yml`.
+    """
+
+    outputs: Dict[Path, Path] = {}
+    paths: List[Path] = []
+    for template in templates:
+        path = output_dir / template.stem
+        other = outputs.setdefault(path, template)
+        if other.resolve() != template.resolve():
+            raise InvalidValueException(
+                f"Templates {other} and {template} are both written to {path}"
+            )
+
+        paths.append(path)
+
+    return paths
+
+
+def load_context(
+    path: Optional[Path],
+) -> Optional[Context]:
+    """Loads a context from a JSON or YAML file.
+
+    Args:
+        path (Optional[Path]): The context file.
+
+    Returns:
+        Optional[Context]: A context evaluating names as key paths of the file data,
+            None without a file.
+    """
+
+    if path is None:
+        return None
+
+    return TemplateLoader.data_context(TemplateLoader.parse_data(path.read_bytes(), path.suffix))
+
+
+def render_template(
+    loader: TemplateLoader,
+    context: Optional[Context],
+    template: Path,
+) -> Tuple[str, float, float]:
+    """Loads and renders a template.
+
+    Args:
+        loader (TemplateLoader): Loads the template and its partials.
+        context (Optional[Context]): The context.
+        template (Path): The template file.
+
+    Returns:
+        Tuple[str, float, float]: The text, and the seconds spent loading and rendering.
+    """
+
+    started = time.perf_counter()
+    generator = loader.load(template)
+    loaded = time.perf_counter()
+    text = generator.generate(context)
+    return text, loaded - started, time.perf_counter() - loaded
+
+
+# Loader and context of a `--jobs` worker process, set by `_init_worker`.
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(
+    search_paths: List[Path],
+    context_path: Optional[Path],
+):
+    """Loads the context and creates the loader of a worker process."""
+
+    _WORKER["loader"] = TemplateLoader(search_paths)
+    _WORKER["context"] = load_context(context_path)
+
+
+def _render_in_worker(
+    template: Path,
+) -> Tuple[str, float, float]:
+    """Renders a template in a worker process."""
+
+    return render_template(_WORKER["loader"], _WORKER["context"], template)
+
+
+def run_render(
+    args: argparse.Namespace,
+    stdout: TextIO,
+    stderr: TextIO,
+) -> int:
+    """Runs the `render` command.
+
+    With `--jobs` above 1, templates are rendered by worker processes, each loading
+    the context and the templates itself, since rendering holds the GIL.
+    Outputs are written in the order of templates, each one as soon as it and
+    every template before it are rendered.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+        stdout (TextIO): Output stream of rendered text.
+        stderr (TextIO): Output stream of timings.
+
+    Returns:
+        int: The exit code.
+    """
+
+    if args.jobs < 1:
+        raise InvalidValueException("--jobs must be at least 1")
+
+    context = load_context(args.context)
+    search_paths = args.search_path or [Path(".")]
+    templates: List[Path] = [template.resolve() for template in args.templates]
+    outputs: List[Optional[Path]] = (
+        [None] * len(templates)
+        if args.output_dir is None
+        else output_paths(args.templates, args.output_dir)
+    )
+
+    def write(results: Iterable[Tuple[str, float, float]]):
+        for template, output, (text, load_time, render_time) in zip(
+            args.templates, outputs, results
+        ):
+            if output is None:
+                stdout.write(text)
+                stdout.write("\n")
+                stdout.flush()
+                status = ""
+            else:
+                status = " " + Project.write_if_changed(output, text.encode("utf-8")).value
+
+            if args.timings:
+                stderr.write(
+                    f"{template}: load {load_time * 1000:.2f} ms, "
+                    f"render {render_time * 1000:.2f} ms{status}\n"
+                )
+
+    if args.jobs == 1 or len(templates) == 1:
+        loader = TemplateLoader(search_paths)
+        write(render_template(loader, context, template) for template in templates)
+        return 0
+
+    with ProcessPoolExecutor(
+        max_workers=min(args.jobs, len(templates)),
+        initializer=_init_worker,
+        initargs=(search_paths, args.context),
+    ) as executor:
+        write(executor.map(_render_in_worker, templates))
+
+    return 0
+
+
+def run_watch(
+    args: argparse.Namespace,
+    stdout: TextIO,
+    stderr: TextIO,
+) -> int:
+    """Runs the `watch` command until interrupted.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+        stdout (TextIO): Unused, outputs are written to files.
+        stderr (TextIO): Output stream of render reports.
+
+    Returns:
+        int: The exit code.
+    """
+
+    _ = stdout
+    watcher = Watcher(
+        loader=TemplateLoader(
+            args.search_path or [Path(".")],
+            max_entries=len(args.templates) + 128,
+        ),
+        targets=list(zip(args.templates, output_paths(args.templates, args.output_dir))),
+        context_path=args.context,
+        interval=args.interval,
+    )
+
+    def report(
+        results: Dict[Path, Union[Project.Status, Exception]],
+        seconds: float,
+    ):
+        written = 0
+        for path, result in results.items():
+            if isinstance(result, Exception):
+                stderr.write(f"{path}: error: {result}\n")
+            elif result == Project.Status.WRITTEN:
+                written += 1
+
+        stderr.write(
+            f"rendered {len(results)} outputs, {written} written, "
+            f"in {seconds * 1000:.1f} ms\n"
+        )
+        stderr.flush()
+
+    try:
+        watcher.run(on_render=report)
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def main(
+    argv: Optional[List[str]] = None,
+) -> int:
+    """Entry point of the `dictrule` command.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit code.
+    """
+
+    args: Any = build_parser().parse_args(argv)
+    try:
+        return args.handler(args, sys.stdout, sys.stderr)
+    except (
+        OSError,
+        ValueError,
+        ImportError,
+        NoneValueException,
+        InvalidTypeException,
+        InvalidValueException,
+    ) as error:
+        sys.stderr.write(f"dictrule: error: {error}\n")
+        return 1
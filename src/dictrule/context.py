@@ -1,16 +1,22 @@
 """Module defines context for rule generation"""
 
 from typing import (
+    Any,
     List,
     Dict,
+    Tuple,
+    Mapping,
     Optional,
 )
 
 from abc import (
     ABC,
 )
+from types import MappingProxyType
 
+from .render_cache import RenderCache
 from .exceptions import (
+    InvalidTypeException,
     InvalidValueException,
 )
 
@@ -31,6 +37,16 @@ class Context:
 
             return ""
 
+        def frozen(self) -> "Context.Case":
+            """Gets a copy of the case which later changes of this case do not reach,
+            used by `FrozenContext`.
+
+            Returns:
+                Context.Case: The case itself, for cases not changed once created.
+            """
+
+            return self
+
     def __init__(
         self,
         cases: List[Case],
@@ -84,3 +100,183 @@ class Context:
         """
 
         return self._case_map.get(name)
+
+    def with_case(
+        self,
+        case: Case,
+    ) -> "Context":
+        """Derives a context where `case` replaces the case of the same name,
+        or is added when there is none.
+
+        Args:
+            case (Case): The case to set.
+
+        Returns:
+            Context: The derived context, `self` is left unchanged.
+        """
+
+        case_map = dict(self._case_map)
+        case_map[case.name] = case
+        return self._derive(case_map)
+
+    def without_case(
+        self,
+        name: str,
+    ) -> "Context":
+        """Derives a context without the case named `name`.
+
+        Args:
+            name (str): Name of the `Context.Case` to remove.
+
+        Returns:
+            Context: The derived context, `self` is left unchanged.
+        """
+
+        if name not in self._case_map:
+            return self
+
+        case_map = dict(self._case_map)
+        case_map.pop(name)
+        return self._derive(case_map)
+
+    def freeze(self) -> "FrozenContext":
+        """Creates an immutable snapshot of the context.
+
+        Returns:
+            FrozenContext: The snapshot.
+        """
+
+        return FrozenContext(self._cases)
+
+    def _derive(
+        self,
+        case_map: Dict[str, Case],
+    ) -> "Context":
+        """Copies the context with a validated case map, keeping the attributes
+        set by subclasses."""
+
+        context = self._copy()
+        context._cases = list(case_map.values())
+        context._case_map = case_map
+        return context
+
+    def _copy(self) -> "Context":
+        """Copies the context and its instance attributes without calling `__init__`,
+        like `copy.copy` but without its per-call dispatch, since contexts are
+        derived for every looped item."""
+
+        context = object.__new__(type(self))
+        context.__dict__.update(self.__dict__)
+        return context
+
+
+class FrozenContext(Context):
+    """Immutable, hashable snapshot of a `Context`.
+
+    Snapshots are safe to share between threads and can be used as cache keys.
+    Cases are replaced by `Context.Case.frozen` copies, and two snapshots are equal
+    when their cases have the same names and the same state, fingerprinted by
+    `RenderCache.state_key` on first comparison. Cases without a fingerprint are
+    compared by identity. Objects the cases refer to, such as evaluators, are
+    shared with the original cases and must not be changed.
+    Derived snapshots from `with_case` and `without_case` share the unchanged cases.
+    """
+
+    def __init__(
+        self,
+        cases: List[Context.Case],
+    ) -> None:
+        """Constructor method of `FrozenContext` class
+
+        Args:
+            cases (List[Case]): List of `Context.Case` to build the case map
+        """
+
+        context = Context(cases)
+        self._set_case_map(context.case_map)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{FrozenContext.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{FrozenContext.__name__} is immutable")
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FrozenContext):
+            return NotImplemented
+
+        return self is other or self.fingerprint == other.fingerprint
+
+    @property
+    def cases(self) -> Tuple[Context.Case, ...]:
+        """Get the `cases` property
+
+        Returns:
+            Tuple[Case, ...]: tuple of cases
+        """
+
+        return self._cases
+
+    @property
+    def case_map(self) -> Mapping[str, Context.Case]:
+        """Get the `case_map` property
+
+        Returns:
+            Mapping[str, Case]: read-only map of cases [name: str, case: Context.Case]
+        """
+
+        return self._case_map
+
+    @property
+    def fingerprint(self) -> Tuple[Tuple[str, Any], ...]:
+        """Get the `fingerprint` property
+
+        Returns:
+            Tuple[Tuple[str, Any], ...]: pairs of case name and case state, sorted by name
+        """
+
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            fingerprint = tuple(
+                (name, FrozenContext._state(self._case_map[name]))
+                for name in sorted(self._case_map)
+            )
+            object.__setattr__(self, "_fingerprint", fingerprint)
+
+        return fingerprint
+
+    def freeze(self) -> "FrozenContext":
+        return self
+
+    def _derive(
+        self,
+        case_map: Dict[str, Context.Case],
+    ) -> "FrozenContext":
+        context = self._copy()
+        context._set_case_map(case_map)
+        return context
+
+    def _set_case_map(
+        self,
+        case_map: Dict[str, Context.Case],
+    ):
+        """Sets the immutable state from a validated case map, freezing its cases."""
+
+        case_map = {name: case.frozen() for name, case in case_map.items()}
+        object.__setattr__(self, "_cases", tuple(case_map.values()))
+        object.__setattr__(self, "_case_map", MappingProxyType(case_map))
+        object.__setattr__(self, "_fingerprint", None)
+
+    @staticmethod
+    def _state(
+        case: Context.Case,
+    ) -> Any:
+        """Gets the fingerprint of the case state, otherwise its identity."""
+
+        try:
+            return RenderCache.state_key(case)
+        except InvalidTypeException:
+            return (type(case), id(case))
@@ -4,27 +4,45 @@ from typing import (
     Any,
     List,
     Dict,
+    Iterator,
+    Tuple,
     Set,
+    Union,
     Optional,
 )
 
+from array import array
+from collections.abc import (
+    Iterable,
+    Iterator as IteratorABC,
+    Mapping,
+)
+from enum import Enum
 from .eo_property import eo_property
+from .exceptions import (
+    InvalidValueException,
+)
 
 
 class EvalObject:
     """Parses instances with nested values.
 
     Supported value types:
-    - An item in EvalObject.PRIMITIVE_TYPES: [
+    - An instance of EvalObject.PRIMITIVE_TYPES, str enums and other subclasses included: [
         int,
         float,
         str,
     ]
-    - list
-    - set
-    - dict
+    - list, tuple, range and other iterables, parsed as a list
+    - set and frozenset, parsed as a set
+    - dict and other mappings, parsed as a dict
+    - one-shot iterators such as generators, parsed lazily item by item
     - EvalObject
 
+    Each source object is converted once per conversion: shared references
+    stay shared in the parsed result, and back-references are handled
+    according to `EvalObject.CyclePolicy`.
+
     Examples:
     ---------
     >>> class Sample:
@@ -48,20 +66,215 @@ class EvalObject:
         ]
     )
 
+    UNSUPPORTED_ITERABLE_TYPES = (
+        bytes,
+        bytearray,
+        memoryview,
+    )
+
+    class CyclePolicy(Enum):
+        """Enumeration defining how back-references are converted"""
+
+        PRESERVE = "preserve"
+        CUT = "cut"
+
     @staticmethod
     def from_eo_property_object(
         obj: Any,
+        cycle_policy: "EvalObject.CyclePolicy" = CyclePolicy.PRESERVE,
+        max_depth: Optional[int] = None,
     ) -> "EvalObject":
         """Parses a EvalObject from obj where properties are decorated with @eo_property.
 
         Args:
             obj (Any): The object to parse from @eo_property and supported values.
+            cycle_policy (EvalObject.CyclePolicy, optional): `PRESERVE` keeps
+                back-references pointing at the parsed ancestor, `CUT` drops them.
+                Defaults to `EvalObject.CyclePolicy.PRESERVE`.
+            max_depth (Optional[int], optional): Maximum nesting depth of containers,
+                deeper values are dropped. Defaults to None (unlimited).
 
         Returns:
             EvalObject: The parsed object.
         """
 
-        return EvalObject._parse_value(obj)
+        return EvalObject._Converter(
+            cycle_policy=cycle_policy,
+            max_depth=max_depth,
+        ).convert(obj)
+
+    @staticmethod
+    def from_homogeneous_list(
+        records: List[Any],
+    ) -> "EvalObject.Columns":
+        """Parses a list of same-shaped records into columns.
+
+        Records are either instances of one class decorated with @eo_property
+        or dictionaries sharing the same keys.
+
+        Args:
+            records (List[Any]): The list of records.
+
+        Returns:
+            EvalObject.Columns: The columnar list.
+        """
+
+        return EvalObject.Columns(records)
+
+    class Columns:
+        """Struct-of-arrays list of records.
+
+        Each field is stored in one column: `array` for integers and floats,
+        `list` for other values. Items are lightweight `EvalObject.Columns.Row`
+        views that read their fields by index. `ForInRule` reads the fields of
+        looped items from the columns directly.
+
+        Examples:
+        ---------
+        >>> columns = EvalObject.from_homogeneous_list([
+        ...     {"name": "Train", "speed": 300},
+        ...     {"name": "Ship", "speed": 60},
+        ... ])
+        >>> print(columns[1].name)
+        Ship
+        >>> print(columns.column("speed"))
+        array('q', [300, 60])
+        """
+
+        class Row:
+            """Read-only view of a record in `EvalObject.Columns`"""
+
+            __slots__ = ("_columns", "_index")
+
+            def __init__(
+                self,
+                columns: "EvalObject.Columns",
+                index: int,
+            ):
+                self._columns = columns
+                self._index = index
+
+            def __getattr__(
+                self,
+                name: str,
+            ) -> Any:
+                column = self._columns.data.get(name)
+                if column is None:
+                    raise AttributeError(name)
+
+                return column[self._index]
+
+        def __init__(
+            self,
+            records: List[Any],
+        ):
+            """Constructor method of `EvalObject.Columns`
+
+            Args:
+                records (List[Any]): The list of same-shaped records.
+            """
+
+            records = list(records)
+            self._length = len(records)
+            self._data: Dict[str, Union[array, List[Any]]] = {}
+            if not records:
+                return
+
+            first = records[0]
+            if isinstance(first, dict):
+                fields = list(first.keys())
+                for record in records:
+                    if not isinstance(record, dict) or record.keys() != first.keys():
+                        raise InvalidValueException(
+                            f"Record {record} does not match fields {fields}"
+                        )
+
+                values = {
+                    field: [record[field] for record in records] for field in fields
+                }
+            else:
+                record_type = type(first)
+                attrs = eo_property.properties(first)
+                if not attrs:
+                    raise InvalidValueException(
+                        f"Record {first} has no @eo_property properties"
+                    )
+
+                for record in records:
+                    if type(record) is not record_type:
+                        raise InvalidValueException(
+                            f"Record {record} is not an instance of {record_type.__name__}"
+                        )
+
+                values = {
+                    attr.__name__: [attr.__get__(record) for record in records]
+                    for attr in attrs
+                }
+
+            for field, column in values.items():
+                self._data[field] = EvalObject.Columns._pack(column)
+
+        @staticmethod
+        def _pack(
+            column: List[Any],
+        ) -> Union[array, List[Any]]:
+            """Packs numeric columns into arrays."""
+
+            if all(type(v) is int for v in column):
+                try:
+                    return array("q", column)
+                except OverflowError:
+                    return column
+
+            if all(type(v) is float for v in column):
+                return array("d", column)
+
+            return column
+
+        @property
+        def data(self) -> Dict[str, Union[array, List[Any]]]:
+            """Get the `data` property
+
+            Returns:
+                Dict[str, Union[array, List[Any]]]: map of columns [field: str, column]
+            """
+
+            return self._data
+
+        def column(
+            self,
+            field: str,
+        ) -> Union[array, List[Any]]:
+            """Gets the column of a field.
+
+            Args:
+                field (str): The field name.
+
+            Returns:
+                Union[array, List[Any]]: The values of the field.
+            """
+
+            return self._data[field]
+
+        def __len__(self) -> int:
+            return self._length
+
+        def __getitem__(
+            self,
+            index: int,
+        ) -> "EvalObject.Columns.Row":
+            if index < 0:
+                index += self._length
+
+            if not 0 <= index < self._length:
+                raise IndexError(index)
+
+            return EvalObject.Columns.Row(self, index)
+
+        def __iter__(self) -> Iterator["EvalObject.Columns.Row"]:
+            row = EvalObject.Columns.Row
+            for index in range(self._length):
+                yield row(self, index)
 
     def add_object(
         self,
@@ -91,101 +304,234 @@ class EvalObject:
             Optional[Any]: The parsed value.
         """
 
-        if value is None:
-            return
-
-        parsed_value = None
-        if type(value) in EvalObject.PRIMITIVE_TYPES or isinstance(value, EvalObject):
-            parsed_value = value
-        elif isinstance(value, list):
-            parsed_value = EvalObject._parse_list(
-                value=value,
-            )
-        elif isinstance(value, set):
-            parsed_value = EvalObject._parse_set(
-                value=value,
-            )
-        elif isinstance(value, dict):
-            parsed_value = EvalObject._parse_dict(
-                value=value,
-            )
-        else:
-            attrs = eo_property.properties(value)
-            if not attrs:
-                return None
-
-            parsed_value = EvalObject()
-            for attr in attrs:
-                setattr(parsed_value, attr.__name__, attr.__get__(value))
-
-        return parsed_value
-
-    @staticmethod
-    def _parse_list(
-        value: List[Any],
-    ):
-        """Parses a list value.
-
-        Args:
-            value (List[Any]): The list of values.
-
-        Returns:
-            Optional[List[Any]]: The parsed list.
-        """
-
-        new_list: List[Any] = []
-        for v in value:
-            parsed_value = EvalObject._parse_value(v)
-            if parsed_value:
-                new_list.append(parsed_value)
-        return new_list
-
-    @staticmethod
-    def _parse_set(
-        value: Set[Any],
-    ):
-        """Parses a set value.
-
-        Args:
-            value (Set[Any]): The set of values.
-
-        Returns:
-            Optional[Set[Any]]: The parsed set.
-        """
-
-        new_set: Set[Any] = set()
-        for v in value:
-            parsed_value = EvalObject._parse_value(v)
-            if not parsed_value:
-                continue
-
-            new_set.add(parsed_value)
-
-        return new_set
-
-    @staticmethod
-    def _parse_dict(
-        value: Dict[Any, Any],
-    ):
-        """Parses a dictionary value.
-
-        Args:
-            value (Dict[Any, Any]): The dictionary of values.
-
-        Returns:
-            Optional[Dict[str, Any]]: The parsed dictionary.
+        return EvalObject._Converter().convert(value)
+
+    class _Frame:
+        """A container being filled by `EvalObject._Converter`"""
+
+        __slots__ = ("source", "target", "items", "depth", "key")
+
+        def __init__(
+            self,
+            source: Any,
+            target: Any,
+            items: Iterator[Tuple[Any, Any]],
+            depth: int,
+        ):
+            self.source = source
+            self.target = target
+            self.items = items
+            self.depth = depth
+            self.key = None
+
+        def attach(
+            self,
+            key: Any,
+            value: Any,
+            force: bool = False,
+        ):
+            """Attaches a parsed child, skipping empty values unless `force` is set."""
+
+            if not value and not force:
+                return
+
+            target = self.target
+            if isinstance(target, list):
+                target.append(value)
+            elif isinstance(target, set):
+                value = EvalObject._Frame._frozen(value, set())
+                try:
+                    target.add(value)
+                except TypeError:
+                    pass
+            else:
+                target[key] = value
+
+        @staticmethod
+        def _frozen(
+            value: Any,
+            visiting: Set[int],
+        ) -> Any:
+            """Converts parsed lists and sets to tuples and frozensets, so that parsed
+            tuples and frozensets can be set items again. Values containing
+            dictionaries or themselves stay unhashable and are skipped."""
+
+            if not isinstance(value, (list, set)) or id(value) in visiting:
+                return value
+
+            visiting.add(id(value))
+            items = [EvalObject._Frame._frozen(item, visiting) for item in value]
+            visiting.discard(id(value))
+            return tuple(items) if isinstance(value, list) else frozenset(items)
+
+    class _Converter:
+        """Converts values with an identity memo and an explicit stack.
+
+        The memo maps `id(source)` to `(source, parsed)`, keeping the source alive
+        so that ids cannot be reused while the conversion is running.
         """
 
-        new_dict: Dict[str, Any] = {}
-        for k, v in value.items():
-            parsed_key = EvalObject._parse_value(k)
-            if not parsed_key:
-                continue
-
-            parsed_value = EvalObject._parse_value(v)
-            if not parsed_value:
-                continue
-
-            new_dict[parsed_key] = parsed_value
-
-        return new_dict
+        _DONE = object()
+
+        def __init__(
+            self,
+            cycle_policy: Optional["EvalObject.CyclePolicy"] = None,
+            max_depth: Optional[int] = None,
+        ):
+            self._cycle_policy = cycle_policy or EvalObject.CyclePolicy.PRESERVE
+            self._max_depth = max_depth
+            self._memo: Dict[int, Tuple[Any, Any]] = {}
+            self._active: Set[int] = set()
+
+        def convert(
+            self,
+            value: Any,
+        ) -> Optional[Any]:
+            """Converts `value` and all of its nested containers.
+
+            Args:
+                value (Any): The supported value.
+
+            Returns:
+                Optional[Any]: The parsed value.
+            """
+
+            parsed, frame, _ = self._begin(value, 0)
+            if frame is None:
+                return parsed
+
+            done = EvalObject._Converter._DONE
+            stack = [frame]
+            while stack:
+                frame = stack[-1]
+                child = next(frame.items, done)
+                if child is done:
+                    stack.pop()
+                    self._active.discard(id(frame.source))
+                    if stack:
+                        stack[-1].attach(frame.key, frame.target)
+                    continue
+
+                key, child_value = child
+                child_parsed, child_frame, force = self._begin(
+                    child_value,
+                    frame.depth + 1,
+                )
+                if child_frame is not None:
+                    child_frame.key = key
+                    stack.append(child_frame)
+                    continue
+
+                frame.attach(key, child_parsed, force)
+
+            return parsed
+
+        def _begin(
+            self,
+            value: Any,
+            depth: int,
+        ) -> Tuple[Optional[Any], Optional["EvalObject._Frame"], bool]:
+            """Starts converting `value`.
+
+            Returns:
+                Tuple[Optional[Any], Optional[EvalObject._Frame], bool]: The parsed value,
+                    the frame to fill when `value` is a container, and whether the value
+                    is a back-reference that must be kept even if it is still empty.
+            """
+
+            if value is None:
+                return None, None, False
+
+            if type(value) in EvalObject.PRIMITIVE_TYPES or isinstance(
+                value, (EvalObject, *EvalObject.PRIMITIVE_TYPES)
+            ):
+                return value, None, False
+
+            if self._max_depth is not None and depth > self._max_depth:
+                return None, None, False
+
+            value_id = id(value)
+            memo = self._memo.get(value_id)
+            if memo is not None:
+                if value_id not in self._active:
+                    return memo[1], None, False
+
+                if self._cycle_policy == EvalObject.CyclePolicy.CUT:
+                    return None, None, False
+
+                return memo[1], None, True
+
+            if isinstance(value, list):
+                parsed: Any = []
+                items = ((None, v) for v in value)
+            elif isinstance(value, (set, frozenset)):
+                parsed = set()
+                items = ((None, v) for v in value)
+            elif isinstance(value, dict):
+                parsed = {}
+                items = self._dict_items(value)
+            else:
+                attrs = eo_property.properties(value)
+                if attrs:
+                    parsed = EvalObject()
+                    for attr in attrs:
+                        setattr(parsed, attr.__name__, attr.__get__(value))
+
+                    self._memo[value_id] = (value, parsed)
+                    return parsed, None, False
+
+                if isinstance(value, EvalObject.UNSUPPORTED_ITERABLE_TYPES):
+                    return None, None, False
+
+                if isinstance(value, Mapping):
+                    parsed = {}
+                    items = self._dict_items(value)
+                elif isinstance(value, IteratorABC):
+                    parsed = self._stream(value, depth)
+                    self._memo[value_id] = (value, parsed)
+                    return parsed, None, False
+                elif isinstance(value, Iterable):
+                    parsed = []
+                    items = ((None, v) for v in value)
+                else:
+                    return None, None, False
+
+            self._memo[value_id] = (value, parsed)
+            self._active.add(value_id)
+            return parsed, EvalObject._Frame(value, parsed, items, depth), False
+
+        def _stream(
+            self,
+            value: Iterator[Any],
+            depth: int,
+        ) -> Iterator[Any]:
+            """Lazily parses the items of a one-shot iterator.
+
+            Each item is parsed with its own memo, so consumed items are not kept
+            alive by the conversion.
+            """
+
+            max_depth = None
+            if self._max_depth is not None:
+                max_depth = self._max_depth - depth - 1
+
+            for item in value:
+                parsed = EvalObject._Converter(
+                    cycle_policy=self._cycle_policy,
+                    max_depth=max_depth,
+                ).convert(item)
+                if parsed:
+                    yield parsed
+
+        def _dict_items(
+            self,
+            value: Mapping,
+        ) -> Iterator[Tuple[Any, Any]]:
+            """Yields dictionary items with parsed keys, skipping empty keys."""
+
+            for k, v in value.items():
+                parsed_key = k if isinstance(k, (tuple, frozenset)) else self.convert(k)
+                if not parsed_key:
+                    continue
+
+                yield parsed_key, v
@@ -1,5 +1,10 @@
 """Exception module"""
 
+from typing import (
+    List,
+    Tuple,
+)
+
 
 class InvalidValueException(Exception):
     """Invalid value exception"""
@@ -11,3 +16,25 @@ class NoneValueException(Exception):
 
 class InvalidTypeException(Exception):
     """Invalid type exception"""
+
+
+class TemplateValidationException(InvalidValueException, InvalidTypeException):
+    """Invalid template exception, listing every error found when compiling"""
+
+    def __init__(
+        self,
+        errors: List[Tuple[str, str]],
+    ):
+        """Constructor method of `TemplateValidationException`
+
+        Args:
+            errors (List[Tuple[str, str]]): Node paths and error messages.
+        """
+
+        self.errors = list(errors)
+        super().__init__(
+            "\n".join(
+                [f"Found {len(self.errors)} invalid rules"]
+                + [f"  {path}: {message}" for path, message in self.errors]
+            )
+        )
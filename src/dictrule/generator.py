@@ -12,51 +12,581 @@ from typing import (
     List,
     Dict,
     Set,
+    Tuple,
+    Iterable,
+    Mapping,
     Union,
     Optional,
 )
 
+import threading
+import time
+from pathlib import Path
+
 from .built_in_rules import (
-    BlockRule,
-    CommentRule,
     EvalRule,
-    InlineRule,
-    IndentRule,
-    ForInRule,
-    JoinBlockRule,
-    JoinEvalRule,
-    FormatRule,
-    StringifyRule,
+    IncludeRule,
+    MacroRule,
 )
 
 from .rule import Rule
 from .context import Context
+from .template import Template
+from .hooks import Hooks
+from .profiler import Profiler
+from .render_cache import RenderCache
 from .exceptions import (
     InvalidTypeException,
     NoneValueException,
+    TemplateValidationException,
 )
 
 
+class _StdRules:
+    """`Generator.STD_RULES`, created on first access
+
+    Importing and instantiating every built-in rule is deferred until
+    the standard rules are used, keeping `import dictrule` fast.
+    """
+
+    def __init__(self):
+        self._rules: Optional[List[Rule]] = None
+        self._lock = threading.Lock()
+
+    def __get__(
+        self,
+        instance: Any,
+        owner: Any,
+    ) -> List[Rule]:
+        rules = self._rules
+        if rules is not None:
+            return rules
+
+        with self._lock:
+            if self._rules is None:
+                from .built_in_rules import (  # pylint: disable=import-outside-toplevel
+                    BlockRule,
+                    CommentRule,
+                    InlineRule,
+                    IndentRule,
+                    ForInRule,
+                    JoinBlockRule,
+                    JoinEvalRule,
+                    FormatRule,
+                    StringifyRule,
+                    CallRule,
+                )
+
+                self._rules = [
+                    BlockRule(),
+                    CommentRule(),
+                    EvalRule(),
+                    InlineRule(),
+                    IndentRule(),
+                    ForInRule(),
+                    JoinBlockRule(),
+                    JoinEvalRule(),
+                    FormatRule(),
+                    StringifyRule(),
+                    MacroRule(),
+                    CallRule(),
+                ]
+
+            return self._rules
+
+
 class Generator:
-    """Manage rules and a generator for rules by dictionary"""
-
-    STD_RULES = [
-        BlockRule(),
-        CommentRule(),
-        EvalRule(),
-        InlineRule(),
-        IndentRule(),
-        ForInRule(),
-        JoinBlockRule(),
-        JoinEvalRule(),
-        FormatRule(),
-        StringifyRule(),
-    ]
+    """Manage rules and a generator for rules by dictionary
+
+    `generate` is reentrant and thread-safe: one `Generator` can render
+    concurrently from many threads. Rule lists are replaced copy-on-write by
+    `add_parse_rule`, and per-render state lives in a `Generator.Render` object.
+    """
+
+    STD_RULES = _StdRules()
+
+    class Result:
+        """Result of `Generator.generate_result`, reusable by `Generator.rerender`"""
+
+        def __init__(
+            self,
+            text: str,
+            context: Optional[Context],
+            outputs: Dict[int, str],
+        ):
+            """Constructor method of `Generator.Result`
+
+            Args:
+                text (str): Generated text.
+                context (Optional[Context]): The context used to generate the text.
+                outputs (Dict[int, str]): Outputs of reusable template nodes,
+                    keyed by the identity of their rule dictionaries.
+            """
+
+            self._text = text
+            self._context = context
+            self._outputs = outputs
+
+        @property
+        def text(self) -> str:
+            """Get the `text` property"""
+
+            return self._text
+
+        @property
+        def context(self) -> Optional[Context]:
+            """Get the `context` property"""
+
+            return self._context
+
+        @property
+        def outputs(self) -> Dict[int, str]:
+            """Get the `outputs` property"""
+
+            return self._outputs
+
+        def __str__(self) -> str:
+            return self._text
+
+    class Render:
+        """Per-render state of `Generator.generate`
+
+        Holds an immutable snapshot of the parse rules and the compiled template,
+        so rules added while rendering do not affect the running render.
+        """
+
+        def __init__(
+            self,
+            parse_rules: Tuple[Rule, ...],
+            template: Template,
+        ):
+            """Constructor method of `Generator.Render`
+
+            Args:
+                parse_rules (Tuple[Rule, ...]): Parse rules sorted for detection.
+                template (Template): The compiled template.
+            """
+
+            self._parse_rules = parse_rules
+            self._template = template
+
+        @property
+        def template(self) -> Template:
+            """Get the `template` property"""
+
+            return self._template
+
+        def prepare(
+            self,
+            context: Optional[Context],
+        ) -> Optional[Context]:
+            """Prepares the context of the render, before any rule is parsed
+
+            Args:
+                context (Optional[Context]): The context passed to `Generator.generate`.
+
+            Returns:
+                Optional[Context]: The context to render with.
+            """
+
+            return context
+
+        def finish(self):
+            """Called once the render finished or failed"""
+
+        def parse(
+            self,
+            context: Optional[Context],
+            rule: Any,
+        ) -> str:
+            """Parses a rule, used as `rule_callback` of every `Rule.parse`
+
+            Args:
+                context (Optional[Context]): The context to parse the rule.
+                rule (Any): A text or a dictionary of rules.
+
+            Returns:
+                str: Generated text
+            """
+
+            if not rule:
+                return ""
+
+            if isinstance(rule, str):
+                return rule
+
+            if not isinstance(rule, Dict):
+                raise InvalidTypeException(f"Rule {rule} must be a dict")
+
+            found_rule = self.rule_from_dict(rule)
+            parsed = found_rule.parse(
+                rule_dict=rule,
+                context=context,
+                rule_callback=self.parse,
+            )
+
+            return parsed
+
+        def rule_from_dict(
+            self,
+            rule_dict: Dict[str, Any],
+        ) -> Rule:
+            """Gets the rule handling `rule_dict`, compiled or detected
+
+            Args:
+                rule_dict (Dict[str, Any]): Dictionary of rules
+
+            Returns:
+                Rule: The rule
+            """
+
+            node = self._template.node(rule_dict)
+            rule = node.rule if node is not None else None
+            if rule is None:
+                rule = Generator.detect_rule(rule_dict, self._parse_rules)
+
+            if rule is None:
+                raise NoneValueException(f"Not found any rule in dict {rule_dict}")
+
+            return rule
+
+    class RecordingRender(Render):
+        """Render recording the outputs of reusable template nodes.
+
+        Outputs of a previous render are reused for nodes that do not depend
+        on any of the changed eval names.
+        """
+
+        def __init__(
+            self,
+            parse_rules: Tuple[Rule, ...],
+            template: Template,
+            previous_outputs: Optional[Dict[int, str]] = None,
+            changed_names: Iterable[str] = (),
+        ):
+            """Constructor method of `Generator.RecordingRender`
+
+            Args:
+                parse_rules (Tuple[Rule, ...]): Parse rules sorted for detection.
+                template (Template): The compiled template.
+                previous_outputs (Optional[Dict[int, str]], optional): Outputs
+                    of a previous render. Defaults to None.
+                changed_names (Iterable[str], optional): Eval names changed since
+                    the previous render. Defaults to ().
+            """
+
+            super().__init__(parse_rules, template)
+            self._previous_outputs = previous_outputs or {}
+            self._changed_names = list(changed_names)
+            self._outputs: Dict[int, str] = {}
+
+        @property
+        def outputs(self) -> Dict[int, str]:
+            """Get the `outputs` property"""
+
+            return self._outputs
+
+        def parse(
+            self,
+            context: Optional[Context],
+            rule: Any,
+        ) -> str:
+            node = self._template.node(rule) if isinstance(rule, dict) else None
+            if node is None or not node.reusable:
+                return super().parse(context, rule)
+
+            previous = self._previous_outputs.get(id(rule))
+            if previous is not None and not node.depends_on(self._changed_names):
+                for descendant in node.descendants():
+                    output = self._previous_outputs.get(id(descendant.rule_dict))
+                    if output is not None:
+                        self._outputs[id(descendant.rule_dict)] = output
+
+                return previous
+
+            parsed = super().parse(context, rule)
+            self._outputs[id(rule)] = parsed
+            return parsed
+
+    class TrustedRender(Render):
+        """Render of a validated template, used by trusted generators
+
+        Compiled rule dictionaries are parsed by `Rule.trusted_parse` of their
+        compiled rule, skipping rule detection and the checks done by
+        `Rule.validate`. Other rules are parsed like `Generator.Render`.
+        """
+
+        def parse(
+            self,
+            context: Optional[Context],
+            rule: Any,
+        ) -> str:
+            if not rule:
+                return ""
+
+            if isinstance(rule, str):
+                return rule
+
+            node = self._template.node(rule) if isinstance(rule, dict) else None
+            if node is None:
+                return super().parse(context, rule)
+
+            return node.rule.trusted_parse(rule, self.parse, context)
+
+    class InstrumentedRender(Render):
+        """Render calling `Hooks` around every rule dictionary and evaluation
+
+        Only used when hooks are installed, so renders without hooks
+        do not pay for the instrumentation.
+        """
+
+        def __init__(
+            self,
+            parse_rules: Tuple[Rule, ...],
+            template: Template,
+            hooks: Tuple[Hooks, ...],
+        ):
+            """Constructor method of `Generator.InstrumentedRender`
+
+            Args:
+                parse_rules (Tuple[Rule, ...]): Parse rules sorted for detection.
+                template (Template): The compiled template.
+                hooks (Tuple[Hooks, ...]): Installed hooks, `Hooks.render_hooks`
+                    is called once for each.
+            """
+
+            super().__init__(parse_rules, template)
+            self._hooks = tuple(hook.render_hooks() for hook in hooks)
+            self._exit_hooks = tuple(reversed(self._hooks))
+
+        def prepare(
+            self,
+            context: Optional[Context],
+        ) -> Optional[Context]:
+            for hook in self._hooks:
+                hook.on_render_start()
+
+            if context is None:
+                return None
+
+            eval_case = context.get(EvalRule.CONTEXT_NAME)
+            if not isinstance(eval_case, EvalRule.ContextCase):
+                return context
+
+            return context.with_case(eval_case.with_observer(self._on_eval))
+
+        def finish(self):
+            for hook in self._exit_hooks:
+                hook.on_render_end()
+
+        def parse(
+            self,
+            context: Optional[Context],
+            rule: Any,
+        ) -> str:
+            if not rule or not isinstance(rule, dict):
+                return super().parse(context, rule)
+
+            node = self._template.node(rule)
+            found_rule = self.rule_from_dict(rule)
+            for hook in self._hooks:
+                hook.on_node_enter(node, found_rule, rule)
+
+            parsed = None
+            try:
+                parsed = self._parse_rule(node, found_rule, rule, context)
+            finally:
+                for hook in self._exit_hooks:
+                    hook.on_node_exit(node, found_rule, rule, parsed)
+
+            return parsed
+
+        def _parse_rule(
+            self,
+            node: Optional[Template.Node],
+            found_rule: Rule,
+            rule: Dict[str, Any],
+            context: Optional[Context],
+        ) -> str:
+            """Parses a rule dictionary between the hooks around it."""
+
+            _ = node
+            return found_rule.parse(
+                rule_dict=rule,
+                context=context,
+                rule_callback=self.parse,
+            )
+
+        def _on_eval(
+            self,
+            eval_name: str,
+            value: Any,
+            seconds: float,
+        ):
+            """Calls `on_eval` of every hook."""
+
+            for hook in self._hooks:
+                hook.on_eval(eval_name, value, seconds)
+
+    class TrustedInstrumentedRender(InstrumentedRender):
+        """`Generator.InstrumentedRender` parsing compiled rule dictionaries
+        with `Rule.trusted_parse`, used when a trusted generator has hooks"""
+
+        def _parse_rule(
+            self,
+            node: Optional[Template.Node],
+            found_rule: Rule,
+            rule: Dict[str, Any],
+            context: Optional[Context],
+        ) -> str:
+            if node is None:
+                return super()._parse_rule(node, found_rule, rule, context)
+
+            return found_rule.trusted_parse(rule, self.parse, context)
+
+    class CachingRender(Render):
+        """Render reusing outputs of reusable template nodes from a `RenderCache`
+
+        Outputs are keyed by the node, the fingerprints of the other context cases
+        and the values of the eval names the node depends on. The values evaluated
+        for a key are served to the render of the node and of its children,
+        so each name is evaluated once per render of the outermost reusable node.
+        Nodes depending on values without a fingerprint are rendered without the cache.
+        """
+
+        def __init__(
+            self,
+            parse_rules: Tuple[Rule, ...],
+            template: Template,
+            cache: RenderCache,
+        ):
+            """Constructor method of `Generator.CachingRender`
+
+            Args:
+                parse_rules (Tuple[Rule, ...]): Parse rules sorted for detection.
+                template (Template): The compiled template.
+                cache (RenderCache): The cache shared by renders.
+            """
+
+            super().__init__(parse_rules, template)
+            self._cache = cache
+            self._cases_key: Optional[Tuple[Any, ...]] = ()
+
+        def prepare(
+            self,
+            context: Optional[Context],
+        ) -> Optional[Context]:
+            context = super().prepare(context)
+            if context is not None:
+                try:
+                    self._cases_key = tuple(
+                        (name, RenderCache.state_key(case))
+                        for name, case in sorted(context.case_map.items())
+                        if name != EvalRule.CONTEXT_NAME
+                    )
+                except InvalidTypeException:
+                    self._cases_key = None
+
+            return context
+
+        def parse(
+            self,
+            context: Optional[Context],
+            rule: Any,
+        ) -> str:
+            node = self._template.node(rule) if isinstance(rule, dict) else None
+            if node is None or not node.reusable or self._cases_key is None:
+                return super().parse(context, rule)
+
+            eval_case = context.get(EvalRule.CONTEXT_NAME) if context is not None else None
+            if not isinstance(eval_case, EvalRule.ContextCase):
+                eval_case = None
+
+            values = (
+                {eval_name: eval_case.eval(eval_name) for eval_name in node.dependencies}
+                if eval_case is not None
+                else {}
+            )
+            key = self._key(node, values)
+            if key is not None:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+
+            if eval_case is not None:
+                evaluated = eval_case.with_evaluated(values)
+                if evaluated is not eval_case:
+                    context = context.with_case(evaluated)
+
+            parsed = super().parse(context, rule)
+            if key is not None:
+                self._cache.put(key, parsed)
+
+            return parsed
+
+        def _key(
+            self,
+            node: Template.Node,
+            values: Dict[str, Any],
+        ) -> Optional[Tuple[Any, ...]]:
+            """Gets the cache key of a node from the values of its dependencies,
+            None if a value has no fingerprint."""
+
+            value_keys: List[Any] = []
+            for eval_name in sorted(node.dependencies):
+                try:
+                    value_keys.append(RenderCache.value_key(values.get(eval_name)))
+                except InvalidTypeException:
+                    return None
+
+            return (node, self._cases_key, tuple(value_keys))
+
+    class InstrumentedCachingRender(CachingRender, InstrumentedRender):
+        """`Generator.CachingRender` calling `Hooks`, used when a generator
+        has both a cache and hooks
+
+        Reused outputs are not parsed, so hooks are not called for their subtrees.
+        """
+
+        def __init__(
+            self,
+            parse_rules: Tuple[Rule, ...],
+            template: Template,
+            cache: RenderCache,
+            hooks: Tuple[Hooks, ...],
+        ):
+            """Constructor method of `Generator.InstrumentedCachingRender`
+
+            Args:
+                parse_rules (Tuple[Rule, ...]): Parse rules sorted for detection.
+                template (Template): The compiled template.
+                cache (RenderCache): The cache shared by renders.
+                hooks (Tuple[Hooks, ...]): Installed hooks.
+            """
+
+            Generator.InstrumentedRender.__init__(self, parse_rules, template, hooks)
+            self._cache = cache
+            self._cases_key = ()
+
+    class TrustedCachingRender(CachingRender, TrustedRender):
+        """`Generator.CachingRender` parsing with `Generator.TrustedRender`,
+        used when a trusted generator has a cache"""
+
+    class TrustedInstrumentedCachingRender(
+        InstrumentedCachingRender,
+        TrustedInstrumentedRender,
+    ):
+        """`Generator.InstrumentedCachingRender` parsing with
+        `Generator.TrustedInstrumentedRender`, used when a trusted generator
+        has both a cache and hooks"""
 
     def __init__(
         self,
         gen_rules: List[Union[str, Dict[str, Any]]],
         parse_rules: Optional[List[Rule]] = None,
+        profile: bool = False,
+        cache: Optional[RenderCache] = None,
+        trusted: bool = False,
     ):
         """Constructor method for DictRule.
 
@@ -65,27 +595,118 @@ class Generator:
             parse_rules (Optional[List[Rule]], optional):
                 List of rule parsers bases on `Rule`.
                 Defaults to `DictRule.STD_RULES`.
+            profile (bool, optional): Installs a `Profiler` as `profiler` and hooks,
+                profiling every `generate` call. Defaults to False.
+            cache (Optional[RenderCache], optional): Caches outputs of template nodes
+                across `generate` calls. Defaults to None.
+            trusted (bool, optional): Raises `TemplateValidationException` with every
+                error when the template is compiled, and renders without the checks
+                of `Rule.validate`. Defaults to False.
         """
         if parse_rules is None:
             parse_rules = Generator.STD_RULES
 
-        self._cache_rules: Dict[str, Rule] = {}
-        self._gen_rules = list(gen_rules)
-        self._parse_rules: List[Rule] = []
+        self._profiler = Profiler() if profile else None
+        self._hooks: Tuple[Hooks, ...] = (self._profiler,) if self._profiler else ()
+        self._cache = cache
+        self._trusted = trusted
+        self._lock = threading.Lock()
+        self._gen_rules = tuple(gen_rules)
+        self._parse_rules: Tuple[Rule, ...] = ()
+        self._compiled: Optional[Tuple[Tuple[Rule, ...], Template]] = None
         self.add_parse_rules(parse_rules)
 
     @property
-    def parse_rules(self) -> List[Rule]:
+    def parse_rules(self) -> Tuple[Rule, ...]:
         """Get the `parse_rules` property"""
 
         return self._parse_rules
 
     @property
-    def gen_rules(self) -> List[Union[str, Dict[str, Any]]]:
-        """Get the `gen_rules` property"""
+    def gen_rules(self) -> Tuple[Union[str, Dict[str, Any]], ...]:
+        """Get the `gen_rules` property
+
+        The rules are compiled on the first render, call `invalidate`
+        after changing a rule dict in place.
+        """
 
         return self._gen_rules
 
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        """Get the `profiler` property, None unless created with `profile=True`"""
+
+        return self._profiler
+
+    @property
+    def cache(self) -> Optional[RenderCache]:
+        """Get the `cache` property"""
+
+        return self._cache
+
+    @property
+    def trusted(self) -> bool:
+        """Get the `trusted` property"""
+
+        return self._trusted
+
+    @property
+    def template(self) -> Template:
+        """Get the `template` property, compiled from `gen_rules` and `parse_rules`"""
+
+        _, template = self._compile()
+        return template
+
+    def referenced_evals(self) -> Template.References:
+        """Statically lists every eval name and context case the template can reference
+
+        Returns:
+            Template.References: The references of the compiled template
+        """
+
+        return self.template.references
+
+    def validate(self):
+        """Compiles the template, raising `TemplateValidationException` with every
+        invalid rule dictionary and its path, such as a `block` that is not a list.
+        """
+
+        errors = self.template.errors
+        if errors:
+            raise TemplateValidationException(errors)
+
+    @property
+    def hooks(self) -> Tuple[Hooks, ...]:
+        """Get the `hooks` property"""
+
+        return self._hooks
+
+    def add_hooks(
+        self,
+        hooks: Hooks,
+    ):
+        """Installs hooks called by every following render.
+
+        Args:
+            hooks (Hooks): The hooks.
+        """
+
+        with self._lock:
+            self._hooks = self._hooks + (hooks,)
+
+    def remove_hooks(
+        self,
+        hooks: Hooks,
+    ):
+        """Removes installed hooks.
+
+        Args:
+            hooks (Hooks): The hooks.
+        """
+
+        with self._lock:
+            self._hooks = tuple(hook for hook in self._hooks if hook is not hooks)
+
     def add_parse_rule(
         self,
         rule: Rule,
@@ -96,7 +717,7 @@ class Generator:
             rule (Rule): The rule subclass to add.
         """
 
-        self._parse_rules.append(rule)
+        self.add_parse_rules([rule])
 
     def add_parse_rules(
         self,
@@ -107,64 +728,276 @@ class Generator:
         Args:
             rules (List[Rule]): List of rules, each being a subclass of Rule.
         """
-        for rule in rules:
-            self.add_parse_rule(rule)
+
+        with self._lock:
+            self._parse_rules = self._parse_rules + tuple(rules)
+            self._compiled = None
+
+    def invalidate(self):
+        """Drops the compiled template, compiling `gen_rules` again on the next render"""
+
+        with self._lock:
+            self._compiled = None
+
+    def dumps(self) -> bytes:
+        """Serializes the compiled template, restored by `Generator.loads`
+        without parsing or compiling the rules again
+
+        Returns:
+            bytes: The compiled template, @see `Template.dumps`
+        """
+
+        parse_rules, template = self._compile()
+        return template.dumps(parse_rules)
+
+    @staticmethod
+    def loads(
+        data: Union[bytes, bytearray, memoryview],
+        parse_rules: Optional[List[Rule]] = None,
+        trusted: bool = False,
+    ) -> "Generator":
+        """Creates a generator from a template serialized by `Generator.dumps`
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The compiled template.
+            parse_rules (Optional[List[Rule]], optional): Rules of the same classes
+                as the rules of the serialized generator. Defaults to `Generator.STD_RULES`.
+            trusted (bool, optional): Creates a trusted generator, raising
+                `TemplateValidationException` if the template has errors. Defaults to False.
+
+        Returns:
+            Generator: The generator, rendering without compiling.
+        """
+
+        generator = Generator([], parse_rules, trusted=trusted)
+        sorted_rules = Generator._sorted_rules(generator._parse_rules)
+        template = Template.loads(
+            data,
+            parse_rules=sorted_rules,
+            detect_rule=lambda rule_dict: Generator.detect_rule(rule_dict, sorted_rules),
+        )
+        if trusted and template.errors:
+            raise TemplateValidationException(template.errors)
+
+        generator._gen_rules = tuple(template.gen_rules)
+        generator._compiled = (sorted_rules, template)
+        return generator
+
+    @staticmethod
+    def load(
+        path: Union[str, Path],
+        parse_rules: Optional[List[Rule]] = None,
+        trusted: bool = False,
+    ) -> "Generator":
+        """Creates a generator from a file written with `Generator.dumps`
+
+        Args:
+            path (Union[str, Path]): The compiled template file.
+            parse_rules (Optional[List[Rule]], optional): Rules of the same classes
+                as the rules of the serialized generator. Defaults to `Generator.STD_RULES`.
+            trusted (bool, optional): Creates a trusted generator, @see `Generator.loads`.
+                Defaults to False.
+
+        Returns:
+            Generator: The generator, rendering without compiling.
+        """
+
+        return Generator.loads(Path(path).read_bytes(), parse_rules, trusted)
 
     def generate(
         self,
-        context: Optional[Context] = None,
+        context: Optional[Union[Context, Mapping[str, Any]]] = None,
+        profiler: Optional[Profiler] = None,
+        hooks: Optional[List[Hooks]] = None,
     ) -> str:
         """Generate text based on `gen_rules`, `parse_rules` and `context`
 
         Args:
-            context (Optional[Context], optional): The context to parse the rule.
-                Defaults to None.
-                @see `dicturle.Context`
+            context (Optional[Union[Context, Mapping[str, Any]]], optional): The context
+                to parse the rule, or plain values of eval names, optionally nested,
+                such as `{"gen": {"title": "Sample"}}`. Defaults to None.
+                @see `dicturle.Context`, `Generator.values_context`
+            profiler (Optional[Profiler], optional): Collects statistics of the render,
+                in addition to the installed `hooks`. Defaults to None.
+            hooks (Optional[List[Hooks]], optional): Hooks called by this render only,
+                like a `MemoryReport`. Defaults to None.
 
         Returns:
             str: Generated text
         """
 
-        def _rule_from_dict(rule_dict: Dict[str, Any]) -> Rule:
-            rule = self._parse_rule_from_dict(rule_dict)
-            if not rule:
-                pass
+        parse_rules, template = self._compile()
+        render_hooks = self._hooks
+        for hook in ([profiler] if profiler is not None else []) + list(hooks or []):
+            if hook not in render_hooks:
+                render_hooks = render_hooks + (hook,)
 
-            if rule is None:
-                raise NoneValueException(f"Not found any rule in dict {rule_dict}")
+        cache = self._cache
+        if render_hooks and cache is not None and self._trusted:
+            render = Generator.TrustedInstrumentedCachingRender(
+                parse_rules, template, cache, render_hooks
+            )
+        elif render_hooks and cache is not None:
+            render = Generator.InstrumentedCachingRender(
+                parse_rules, template, cache, render_hooks
+            )
+        elif render_hooks and self._trusted:
+            render = Generator.TrustedInstrumentedRender(parse_rules, template, render_hooks)
+        elif render_hooks:
+            render = Generator.InstrumentedRender(parse_rules, template, render_hooks)
+        elif cache is not None and self._trusted:
+            render = Generator.TrustedCachingRender(parse_rules, template, cache)
+        elif cache is not None:
+            render = Generator.CachingRender(parse_rules, template, cache)
+        elif self._trusted:
+            render = Generator.TrustedRender(parse_rules, template)
+        else:
+            render = Generator.Render(parse_rules, template)
 
-            return rule
+        return self._render(
+            render=render,
+            context=Generator.values_context(context),
+        )
 
-        def _internal_parse_rule(
-            context: Optional[Context],
-            rule: Any,
-        ) -> str:
-            if not rule:
-                return ""
+    def generate_result(
+        self,
+        context: Optional[Union[Context, Mapping[str, Any]]] = None,
+    ) -> "Generator.Result":
+        """Generate text like `generate`, recording the outputs of template nodes
+        for `rerender`
 
-            if isinstance(rule, str):
-                return rule
+        Args:
+            context (Optional[Union[Context, Mapping[str, Any]]], optional): The context
+                to parse the rule, or plain values. Defaults to None.
 
-            if not isinstance(rule, Dict):
-                raise InvalidTypeException(f"Rule {rule} must be a dict")
+        Returns:
+            Generator.Result: The generated result
+        """
 
-            found_rule = _rule_from_dict(rule)
-            parsed = found_rule.parse(
-                rule_dict=rule,
-                context=context,
-                rule_callback=_internal_parse_rule,
-            )
+        return self.rerender(
+            previous_result=None,
+            changed_names=(),
+            context=context,
+        )
 
-            return parsed
+    def rerender(
+        self,
+        previous_result: Optional["Generator.Result"],
+        changed_names: Iterable[str],
+        context: Optional[Union[Context, Mapping[str, Any]]] = None,
+    ) -> "Generator.Result":
+        """Re-renders only the subtrees depending on `changed_names`,
+        reusing the output of `previous_result` for every other subtree
+
+        Subtrees inside loops are re-rendered with their loop,
+        and subtrees of rules with unknown dependencies are always re-rendered.
 
-        self._parse_rules.sort(
-            key=lambda r: len(r.dr_non_optional_props),
-            reverse=True,
+        Args:
+            previous_result (Optional[Generator.Result]): Result of a previous render
+                of this generator, None to render everything.
+            changed_names (Iterable[str]): Eval names whose values changed. A name also
+                covers its key paths, so `gen` covers `gen.title`.
+            context (Optional[Union[Context, Mapping[str, Any]]], optional): The context
+                to parse the rule, or plain values. Defaults to the context of `previous_result`.
+
+        Returns:
+            Generator.Result: The generated result
+        """
+
+        context = Generator.values_context(context)
+        if context is None and previous_result is not None:
+            context = previous_result.context
+
+        parse_rules, template = self._compile()
+        render = Generator.RecordingRender(
+            parse_rules=parse_rules,
+            template=template,
+            previous_outputs=(
+                previous_result.outputs if previous_result is not None else None
+            ),
+            changed_names=changed_names,
         )
+        text = self._render(
+            render=render,
+            context=context,
+        )
+
+        return Generator.Result(
+            text=text,
+            context=context,
+            outputs=render.outputs,
+        )
+
+    @staticmethod
+    def values_context(
+        context: Optional[Union[Context, Mapping[str, Any]]],
+    ) -> Optional[Context]:
+        """Gets the context of plain values, served to eval names by an
+        `EvalRule.ContextCase` looking the mapping up directly.
+
+        Args:
+            context (Optional[Union[Context, Mapping[str, Any]]]): A context,
+                returned as is, or plain values.
 
+        Returns:
+            Optional[Context]: The context.
+        """
+
+        if context is None or isinstance(context, Context) or not isinstance(context, Mapping):
+            return context
+
+        return Context([EvalRule.ContextCase(evaluators=[], values=context)])
+
+    def _render(
+        self,
+        render: "Generator.Render",
+        context: Optional[Context],
+    ) -> str:
+        """Renders every item of the template with `render`."""
+
+        try:
+            return self._render_rules(render, render.prepare(context))
+        finally:
+            render.finish()
+
+    def _render_rules(
+        self,
+        render: "Generator.Render",
+        context: Optional[Context],
+    ) -> str:
+        """Renders every item of the template with a prepared context."""
+
+        if context is not None:
+            eval_case = context.get(EvalRule.CONTEXT_NAME)
+            if isinstance(eval_case, EvalRule.ContextCase) and eval_case.batched:
+                context = context.with_case(
+                    eval_case.prefetch(render.template.references.evals)
+                )
+
+        definitions = render.template.definitions
+        if definitions:
+            macros = [
+                node.rule.macro(node.rule_dict)
+                for node in definitions.values()
+                if isinstance(node.rule, MacroRule)
+            ]
+            context = (context if context is not None else Context([])).with_case(
+                MacroRule.ContextCase(macros)
+            )
+
+        sub_rules = render.template.sub_rules
+        if sub_rules:
+            context = (context if context is not None else Context([])).with_case(
+                IncludeRule.ContextCase(sub_rules)
+            )
+
+        defined = {id(node.rule_dict) for node in definitions.values()}
         output: List[str] = []
-        for rule in self._gen_rules:
-            parsed = _internal_parse_rule(
+        for rule in render.template.gen_rules:
+            if id(rule) in defined:
+                continue
+
+            parsed = render.parse(
                 context=context,
                 rule=rule,
             )
@@ -172,17 +1005,64 @@ class Generator:
 
         return "\n".join(output)
 
-    def _parse_rule_from_dict(
-        self,
+    def _compile(self) -> Tuple[Tuple[Rule, ...], Template]:
+        """Gets the parse rules sorted for detection and the compiled template,
+        compiling them once after changes."""
+
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+
+        with self._lock:
+            compiled = self._compiled
+            if compiled is None:
+                parse_rules = Generator._sorted_rules(self._parse_rules)
+                template = Template(
+                    gen_rules=self._gen_rules,
+                    detect_rule=lambda rule_dict: Generator.detect_rule(
+                        rule_dict,
+                        parse_rules,
+                    ),
+                )
+                if self._trusted and template.errors:
+                    raise TemplateValidationException(template.errors)
+
+                compiled = (parse_rules, template)
+                self._compiled = compiled
+
+        return compiled
+
+    @staticmethod
+    def _sorted_rules(
+        rules: Iterable[Rule],
+    ) -> Tuple[Rule, ...]:
+        """Sorts parse rules for detection, rules with more non-optional properties first."""
+
+        return tuple(
+            sorted(
+                rules,
+                key=lambda r: len(r.dr_non_optional_props),
+                reverse=True,
+            )
+        )
+
+    @staticmethod
+    def detect_rule(
         rule_dict: Dict[str, Any],
+        parse_rules: Iterable[Rule],
     ) -> Optional[Rule]:
-        dict_keys = set(rule_dict.keys())
-        key = self._key_from_keys(dict_keys)
-        rule = self._cache_rules.get(key)
-        if rule:
-            return rule
+        """Detects the first rule of `parse_rules` whose non-optional properties
+        all have values in `rule_dict`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionary of rules
+            parse_rules (Iterable[Rule]): Rules sorted for detection
 
-        for rule in self._parse_rules:
+        Returns:
+            Optional[Rule]: The detected rule
+        """
+
+        for rule in parse_rules:
             props: Set[str] = set()
             for prop in rule.dr_non_optional_props:
                 prop_name, prop_value = prop(rule_dict)
@@ -198,9 +1078,3 @@ class Generator:
             return rule
 
         return None
-
-    def _key_from_keys(
-        self,
-        keys: Set[str],
-    ) -> str:
-        return ".".join(sorted(keys))
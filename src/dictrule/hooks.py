@@ -0,0 +1,92 @@
+"""Render hooks module"""
+
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from .rule import Rule
+from .template import Template
+
+
+class Hooks:
+    """Callbacks around rule execution and evaluations of `Generator` renders.
+
+    Subclasses override the callbacks they need. Install hooks with
+    `Generator.add_hooks`; renders of a generator without hooks are not
+    instrumented at all, so the callbacks cost nothing when unused.
+
+    One `Hooks` object can be called by concurrent renders. Override `render_hooks`
+    to keep per-render state.
+
+    Examples:
+    ---------
+    >>> class Counter(dictrule.Hooks):
+    ...     def __init__(self):
+    ...         self.count = 0
+    ...     def on_node_enter(self, node, rule, rule_dict):
+    ...         self.count += 1
+    >>> generator.add_hooks(Counter())
+    """
+
+    def render_hooks(self) -> "Hooks":
+        """Gets the hooks called by one render, once per render.
+
+        Returns:
+            Hooks: The hooks of the render. Defaults to `self`.
+        """
+
+        return self
+
+    def on_render_start(self):
+        """Called once before the render starts."""
+
+    def on_render_end(self):
+        """Called once the render finished or failed."""
+
+    def on_node_enter(
+        self,
+        node: Optional[Template.Node],
+        rule: Rule,
+        rule_dict: Dict[str, Any],
+    ):
+        """Called before a rule dictionary is parsed.
+
+        Args:
+            node (Optional[Template.Node]): The compiled node, None if `rule_dict`
+                is not part of the template.
+            rule (Rule): The rule parsing `rule_dict`.
+            rule_dict (Dict[str, Any]): The rule dictionary.
+        """
+
+    def on_node_exit(
+        self,
+        node: Optional[Template.Node],
+        rule: Rule,
+        rule_dict: Dict[str, Any],
+        output: Optional[str],
+    ):
+        """Called after a rule dictionary is parsed, in reverse order of `on_node_enter`.
+
+        Args:
+            node (Optional[Template.Node]): The compiled node, None if `rule_dict`
+                is not part of the template.
+            rule (Rule): The rule parsing `rule_dict`.
+            rule_dict (Dict[str, Any]): The rule dictionary.
+            output (Optional[str]): The generated text, None if parsing raised.
+        """
+
+    def on_eval(
+        self,
+        eval_name: str,
+        value: Any,
+        seconds: float,
+    ):
+        """Called after an eval name is evaluated from the `EvalRule` context.
+
+        Args:
+            eval_name (str): The eval name.
+            value (Any): The evaluated value.
+            seconds (float): Seconds spent evaluating.
+        """
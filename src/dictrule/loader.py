@@ -0,0 +1,384 @@
+"""Template loader module"""
+
+from typing import (
+    Any,
+    List,
+    Dict,
+    Mapping,
+    Union,
+    Optional,
+)
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+
+from .rule import Rule
+from .generator import Generator
+from .template import Template
+from .context import Context
+from .built_in_rules import IncludeRule
+from .exceptions import (
+    InvalidTypeException,
+    InvalidValueException,
+)
+
+
+class TemplateLoader:
+    """Loads templates by name from search paths, caching parsed and compiled results.
+
+    Templates are YAML or JSON files. A name is resolved against each search path,
+    as is and then with each of `TemplateLoader.EXTENSIONS`.
+    Cached templates are revalidated on every load, see `TemplateLoader.Validation`.
+
+    Examples:
+    ---------
+    >>> loader = dictrule.TemplateLoader(["templates"])
+    >>> generator = loader.load("sample")  # templates/sample.yml
+    >>> generator.generate(context)
+    """
+
+    EXTENSIONS = (".yml", ".yaml", ".json")
+
+    class Validation(Enum):
+        """Enumeration defining how cached templates are revalidated"""
+
+        MTIME = "mtime"
+        HASH = "hash"
+
+    class Entry:
+        """Cached template"""
+
+        def __init__(
+            self,
+            path: Path,
+            stat_key: Any,
+            digest: Optional[str],
+            rules: List[Any],
+        ):
+            self.path = path
+            self.stat_key = stat_key
+            self.digest = digest
+            self.rules = rules
+            self.generator: Optional[Generator] = None
+            self.partials: Dict[str, List[Any]] = {}
+
+    def __init__(
+        self,
+        search_paths: List[Union[str, Path]],
+        max_entries: int = 128,
+        validation: "TemplateLoader.Validation" = Validation.MTIME,
+        parse_rules: Optional[List[Rule]] = None,
+        trusted: bool = False,
+    ):
+        """Constructor method of `TemplateLoader`
+
+        Args:
+            search_paths (List[Union[str, Path]]): Directories to resolve template names.
+            max_entries (int, optional): Maximum number of cached templates. Defaults to 128.
+            validation (TemplateLoader.Validation, optional): `MTIME` compares
+                modification time and size, costing one `stat()` per load.
+                `HASH` compares the content hash when they differ, so touched but
+                unchanged files are not parsed again. Defaults to `Validation.MTIME`.
+            parse_rules (Optional[List[Rule]], optional): Parse rules of loaded generators.
+                Defaults to `Generator.STD_RULES` and an `IncludeRule` of this loader.
+            trusted (bool, optional): Loads trusted generators, so `load` raises
+                `TemplateValidationException` with every error of the template
+                and its partials. Defaults to False.
+        """
+
+        self._search_paths = [Path(path) for path in search_paths]
+        self._max_entries = max_entries
+        self._validation = validation
+        self._parse_rules = parse_rules
+        self._trusted = trusted
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, TemplateLoader.Entry]" = OrderedDict()
+        self._paths: Dict[str, Path] = {}
+
+    @property
+    def search_paths(self) -> List[Path]:
+        """Get the `search_paths` property"""
+
+        return self._search_paths
+
+    @property
+    def trusted(self) -> bool:
+        """Get the `trusted` property"""
+
+        return self._trusted
+
+    @property
+    def parse_rules(self) -> List[Rule]:
+        """Get the `parse_rules` property
+
+        Returns:
+            List[Rule]: Parse rules of loaded generators, including an `IncludeRule`
+                resolving partials through this loader unless custom rules were provided.
+        """
+
+        if self._parse_rules is None:
+            self._parse_rules = Generator.STD_RULES + [IncludeRule(self)]
+
+        return self._parse_rules
+
+    def resolve(
+        self,
+        name: Union[str, Path],
+    ) -> Path:
+        """Resolves a template name to a file path.
+
+        Args:
+            name (Union[str, Path]): Template name or path.
+
+        Returns:
+            Path: The template file path.
+        """
+
+        name = str(name)
+        path = Path(name)
+        candidates: List[Path] = []
+        if path.is_absolute():
+            candidates.append(path)
+        else:
+            for search_path in self._search_paths or [Path(".")]:
+                candidates.append(search_path / name)
+                candidates.extend(
+                    search_path / (name + extension)
+                    for extension in TemplateLoader.EXTENSIONS
+                )
+
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+
+        raise InvalidValueException(f"Not found template `{name}`")
+
+    def load_rules(
+        self,
+        name: Union[str, Path],
+    ) -> List[Any]:
+        """Loads the parsed rules of a template.
+
+        The same list is returned while the file is unchanged,
+        so rule dictionaries are shared between every user of the template.
+
+        Args:
+            name (Union[str, Path]): Template name or path.
+
+        Returns:
+            List[Any]: Parsed rules.
+        """
+
+        return self._entry(name).rules
+
+    def load(
+        self,
+        name: Union[str, Path],
+    ) -> Generator:
+        """Loads a compiled generator of a template.
+
+        Args:
+            name (Union[str, Path]): Template name or path.
+
+        Returns:
+            Generator: The generator, compiled once while the file
+                and the partials it includes are unchanged.
+        """
+
+        entry = self._entry(name)
+        generator = entry.generator
+        if generator is not None:
+            for partial, rules in entry.partials.items():
+                if self.load_rules(partial) is not rules:
+                    generator = None
+                    break
+
+        if generator is None:
+            generator = Generator(
+                gen_rules=entry.rules,
+                parse_rules=self.parse_rules,
+                trusted=self._trusted,
+            )
+            entry.partials = {
+                partial: self.load_rules(partial)
+                for partial in self._included_names(generator.template)
+            }
+            entry.generator = generator
+
+        return generator
+
+    def dependencies(
+        self,
+        name: Union[str, Path],
+    ) -> List[Path]:
+        """Gets the files a template is generated from.
+
+        Args:
+            name (Union[str, Path]): Template name or path.
+
+        Returns:
+            List[Path]: The template file, then the files of the partials it includes,
+                directly or not.
+        """
+
+        self.load(name)
+        entry = self._entry(name)
+        return [entry.path] + [self.resolve(partial) for partial in entry.partials]
+
+    def clear(self):
+        """Removes all cached templates."""
+
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+
+    def _included_names(
+        self,
+        template: Template,
+    ) -> List[str]:
+        """Gets the names of the partials included through this loader by a template."""
+
+        names: List[str] = []
+        for node in template.nodes:
+            rule = node.rule
+            if isinstance(rule, IncludeRule) and rule.loader is self:
+                name = rule.partial_name(node.rule_dict)
+                if name not in names:
+                    names.append(name)
+
+        return names
+
+    def _entry(
+        self,
+        name: Union[str, Path],
+    ) -> "TemplateLoader.Entry":
+        """Gets the valid cache entry of a template, loading it when needed."""
+
+        key = str(name)
+        with self._lock:
+            entry = self._entries.get(key)
+            path = self._paths.get(key)
+
+        if path is None:
+            path = self.resolve(key)
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._paths.pop(key, None)
+                self._entries.pop(key, None)
+            path = self.resolve(key)
+            stat = os.stat(path)
+            entry = None
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if entry is not None and entry.path == path and entry.stat_key == stat_key:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return entry
+
+        content = path.read_bytes()
+        digest = None
+        if self._validation == TemplateLoader.Validation.HASH:
+            digest = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry.path == path and entry.digest == digest:
+                entry.stat_key = stat_key
+                return entry
+
+        entry = TemplateLoader.Entry(
+            path=path,
+            stat_key=stat_key,
+            digest=digest,
+            rules=TemplateLoader.parse(content, path.suffix),
+        )
+        with self._lock:
+            self._paths[key] = path
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._paths.pop(evicted, None)
+
+        return entry
+
+    @staticmethod
+    def parse(
+        content: Union[bytes, str],
+        suffix: str = ".yml",
+    ) -> List[Any]:
+        """Parses template content, using `json` for `.json` files and YAML otherwise.
+
+        Args:
+            content (Union[bytes, str]): The template content.
+            suffix (str, optional): The file suffix. Defaults to ".yml".
+
+        Returns:
+            List[Any]: Parsed rules, a single rule dictionary is wrapped in a list.
+        """
+
+        rules = TemplateLoader.parse_data(content, suffix)
+        if isinstance(rules, dict):
+            rules = [rules]
+
+        if not isinstance(rules, list):
+            raise InvalidTypeException(f"Template rules must be a list, not {type(rules)}")
+
+        return rules
+
+    @staticmethod
+    def parse_data(
+        content: Union[bytes, str],
+        suffix: str = ".yml",
+    ) -> Any:
+        """Parses JSON content for `.json` files and YAML content otherwise.
+
+        Args:
+            content (Union[bytes, str]): The content.
+            suffix (str, optional): The file suffix. Defaults to ".yml".
+
+        Returns:
+            Any: Parsed data.
+        """
+
+        if suffix == ".json":
+            return json.loads(content)
+
+        try:
+            import yaml  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError(
+                "PyYAML is required to load YAML files: pip install PyYAML"
+            ) from error
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(content, Loader=loader)  # nosec B506
+
+    @staticmethod
+    def data_context(
+        data: Any,
+    ) -> Context:
+        """Creates a context serving parsed context file data to `eval` names
+        as key paths, like `gen.title`.
+
+        Args:
+            data (Any): Data parsed by `TemplateLoader.parse_data`, a mapping
+                or None for an empty file.
+
+        Returns:
+            Context: The context, see `Generator.values_context`.
+        """
+
+        if data is None:
+            data = {}
+
+        if not isinstance(data, Mapping):
+            raise InvalidTypeException("Context data must be a mapping")
+
+        return Generator.values_context(data)
@@ -0,0 +1,133 @@
+"""Render memory report module"""
+
+from typing import (
+    Any,
+    List,
+    Dict,
+    Optional,
+)
+
+import sys
+import tracemalloc
+
+from .rule import Rule
+from .template import Template
+from .hooks import Hooks
+
+
+class MemoryReport(Hooks):
+    """Measures the memory of one render: the peak of traced memory and
+    the intermediate strings produced by rules.
+
+    Every rule dictionary produces a string that its parent rule copies,
+    so a rule wrapping a large subtree, like a `comment` around a long
+    `for`/`in`, shows up as a large intermediate string volume.
+    `tracemalloc` is started for the render if it is not tracing yet,
+    which slows the render down, so pass a report to the `generate` calls
+    to measure only. If it is already tracing, the peak is reset for the render,
+    which needs Python 3.9; on older versions `peak` is None in that case,
+    since the traced peak covers everything since tracing started.
+
+    Examples:
+    ---------
+    >>> report = dictrule.MemoryReport()
+    >>> generator.generate(context, hooks=[report])
+    >>> print(report.report())
+    """
+
+    def __init__(self):
+        """Constructor method of `MemoryReport`"""
+
+        self.peak: Optional[int] = 0
+        self.string_bytes: Dict[str, int] = {}
+        self.string_counts: Dict[str, int] = {}
+        self.largest_size = 0
+        self.largest_rule: Optional[str] = None
+        self.largest_path: Optional[str] = None
+        self._started_tracing = False
+        self._traced_at_start = 0
+        self._peak_reset = False
+
+    @property
+    def total_string_bytes(self) -> int:
+        """Get the `total_string_bytes` property"""
+
+        return sum(self.string_bytes.values())
+
+    def on_render_start(self):
+        self.peak = 0
+        self.string_bytes = {}
+        self.string_counts = {}
+        self.largest_size = 0
+        self.largest_rule = None
+        self.largest_path = None
+
+        self._started_tracing = not tracemalloc.is_tracing()
+        self._peak_reset = self._started_tracing or hasattr(tracemalloc, "reset_peak")
+        if self._started_tracing:
+            tracemalloc.start()
+        elif self._peak_reset:
+            tracemalloc.reset_peak()
+
+        self._traced_at_start = tracemalloc.get_traced_memory()[0]
+
+    def on_render_end(self):
+        if not tracemalloc.is_tracing():
+            return
+
+        if not self._peak_reset:
+            self.peak = None
+            return
+
+        self.peak = max(0, tracemalloc.get_traced_memory()[1] - self._traced_at_start)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def on_node_exit(
+        self,
+        node: Optional[Template.Node],
+        rule: Rule,
+        rule_dict: Dict[str, Any],
+        output: Optional[str],
+    ):
+        if not isinstance(output, str):
+            return
+
+        size = sys.getsizeof(output)
+        rule_name = type(rule).__name__
+        self.string_bytes[rule_name] = self.string_bytes.get(rule_name, 0) + size
+        self.string_counts[rule_name] = self.string_counts.get(rule_name, 0) + 1
+        if size > self.largest_size:
+            self.largest_size = size
+            self.largest_rule = rule_name
+            self.largest_path = node.path if node is not None else "<dynamic>"
+
+    def report(self) -> str:
+        """Formats the measurements as text.
+
+        Returns:
+            str: The report.
+        """
+
+        peak = "unavailable" if self.peak is None else f"{self.peak} bytes"
+        lines: List[str] = [
+            f"peak traced memory: {peak}",
+            f"intermediate strings: {self.total_string_bytes} bytes",
+        ]
+        if self.largest_rule is not None:
+            lines.append(
+                f"largest string: {self.largest_size} bytes "
+                f"from {self.largest_rule} at {self.largest_path}"
+            )
+
+        lines.append("")
+        lines.append(f"{'strings':>10} {'bytes':>14}  rule")
+        for rule_name, size in sorted(
+            self.string_bytes.items(),
+            key=lambda item: item[1],
+            reverse=True,
+        ):
+            lines.append(f"{self.string_counts[rule_name]:>10} {size:>14}  {rule_name}")
+
+        return "\n".join(lines)
@@ -0,0 +1,297 @@
+"""Render profiler module"""
+
+from typing import (
+    Any,
+    List,
+    Dict,
+    Tuple,
+    Optional,
+)
+
+import threading
+import time
+from enum import Enum
+
+from .rule import Rule
+from .template import Template
+from .hooks import Hooks
+from .exceptions import InvalidValueException
+
+
+class Profiler(Hooks):
+    """Collects call counts, times and output sizes of renders.
+
+    Statistics are grouped by `Rule` class, by template node path
+    and by eval name. Pass a profiler to `Generator.generate`, install it
+    with `Generator.add_hooks`, or create the generator with `profile=True`,
+    and read the statistics with `report`.
+
+    Examples:
+    ---------
+    >>> profiler = dictrule.Profiler()
+    >>> generator.generate(context, profiler=profiler)
+    >>> print(profiler.report(sort_by="self_time", limit=10))
+    """
+
+    SORT_KEYS = ("calls", "cumulative", "self_time", "output_size")
+
+    class Group(Enum):
+        """Enumeration defining how statistics are grouped"""
+
+        RULE = "rule"
+        NODE = "node"
+        EVAL = "eval"
+
+    class Stats:
+        """Statistics of a rule class, a template node or an eval name"""
+
+        __slots__ = (
+            "calls",
+            "cumulative",
+            "self_time",
+            "output_size",
+        )
+
+        def __init__(self):
+            self.calls = 0
+            self.cumulative = 0.0
+            self.self_time = 0.0
+            self.output_size = 0
+
+        def add(
+            self,
+            cumulative: float,
+            self_time: float,
+            output_size: int,
+        ):
+            """Adds a call.
+
+            Args:
+                cumulative (float): Seconds spent, including sub-rules.
+                self_time (float): Seconds spent, excluding sub-rules.
+                output_size (int): Number of characters produced.
+            """
+
+            self.calls += 1
+            self.cumulative += cumulative
+            self.self_time += self_time
+            self.output_size += output_size
+
+        def merge(
+            self,
+            other: "Profiler.Stats",
+        ):
+            """Adds the calls of other statistics.
+
+            Args:
+                other (Profiler.Stats): The statistics to add.
+            """
+
+            self.calls += other.calls
+            self.cumulative += other.cumulative
+            self.self_time += other.self_time
+            self.output_size += other.output_size
+
+    class Recording(Hooks):
+        """Hooks recording the statistics of one render"""
+
+        def __init__(
+            self,
+            profiler: "Profiler",
+        ):
+            """Constructor method of `Profiler.Recording`
+
+            Args:
+                profiler (Profiler): The profiler merging the statistics.
+            """
+
+            self._profiler = profiler
+            self._tables = Profiler.new_tables()
+            self._stack: List[List[float]] = []
+
+        def on_render_end(self):
+            self._profiler.merge(self._tables)
+
+        def on_node_enter(
+            self,
+            node: Optional[Template.Node],
+            rule: Rule,
+            rule_dict: Dict[str, Any],
+        ):
+            self._stack.append([time.perf_counter(), 0.0])
+
+        def on_node_exit(
+            self,
+            node: Optional[Template.Node],
+            rule: Rule,
+            rule_dict: Dict[str, Any],
+            output: Optional[str],
+        ):
+            elapsed = time.perf_counter()
+            started, child_time = self._stack.pop()
+            elapsed -= started
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+            output_size = len(output) if isinstance(output, str) else 0
+            for group, key in (
+                (Profiler.Group.RULE, type(rule).__name__),
+                (Profiler.Group.NODE, node.path if node is not None else "<dynamic>"),
+            ):
+                self._record(group, key, elapsed, elapsed - child_time, output_size)
+
+        def on_eval(
+            self,
+            eval_name: str,
+            value: Any,
+            seconds: float,
+        ):
+            output_size = len(value) if isinstance(value, str) else 0
+            self._record(Profiler.Group.EVAL, eval_name, seconds, seconds, output_size)
+
+        def _record(
+            self,
+            group: "Profiler.Group",
+            key: str,
+            cumulative: float,
+            self_time: float,
+            output_size: int,
+        ):
+            """Adds a call to the statistics of a key."""
+
+            table = self._tables[group]
+            stats = table.get(key)
+            if stats is None:
+                stats = table[key] = Profiler.Stats()
+            stats.add(cumulative, self_time, output_size)
+
+    def __init__(self):
+        """Constructor method of `Profiler`"""
+
+        self._lock = threading.Lock()
+        self._tables = Profiler.new_tables()
+
+    def render_hooks(self) -> "Profiler.Recording":
+        """Gets a recording of one render, merged into the profiler when it ends.
+
+        Returns:
+            Profiler.Recording: The recording.
+        """
+
+        return Profiler.Recording(self)
+
+    @staticmethod
+    def new_tables() -> Dict["Profiler.Group", Dict[str, "Profiler.Stats"]]:
+        """Creates empty statistics tables, one per group.
+
+        Returns:
+            Dict[Profiler.Group, Dict[str, Profiler.Stats]]: The tables.
+        """
+
+        return {group: {} for group in Profiler.Group}
+
+    def merge(
+        self,
+        tables: Dict["Profiler.Group", Dict[str, "Profiler.Stats"]],
+    ):
+        """Adds the statistics of a render.
+
+        Renders record into their own tables and merge them once finished,
+        so one profiler can collect concurrent renders.
+
+        Args:
+            tables (Dict[Profiler.Group, Dict[str, Profiler.Stats]]): The statistics.
+        """
+
+        with self._lock:
+            for group, table in tables.items():
+                own_table = self._tables[group]
+                for key, stats in table.items():
+                    own_stats = own_table.get(key)
+                    if own_stats is None:
+                        own_stats = own_table[key] = Profiler.Stats()
+                    own_stats.merge(stats)
+
+    def reset(self):
+        """Removes all statistics."""
+
+        with self._lock:
+            self._tables = Profiler.new_tables()
+
+    def stats(
+        self,
+        group: "Profiler.Group",
+    ) -> Dict[str, "Profiler.Stats"]:
+        """Gets the statistics of a group.
+
+        Args:
+            group (Profiler.Group): The group.
+
+        Returns:
+            Dict[str, Profiler.Stats]: map of rule class names, node paths
+                or eval names to their statistics
+        """
+
+        with self._lock:
+            return dict(self._tables[group])
+
+    def rows(
+        self,
+        group: "Profiler.Group",
+        sort_by: str = "cumulative",
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, "Profiler.Stats"]]:
+        """Gets the statistics of a group, sorted in descending order.
+
+        Args:
+            group (Profiler.Group): The group.
+            sort_by (str, optional): One of `Profiler.SORT_KEYS`. Defaults to "cumulative".
+            limit (Optional[int], optional): Maximum number of rows. Defaults to None.
+
+        Returns:
+            List[Tuple[str, Profiler.Stats]]: Keys and statistics.
+        """
+
+        if sort_by not in Profiler.SORT_KEYS:
+            raise InvalidValueException(f"`sort_by` must be one of {Profiler.SORT_KEYS}")
+
+        rows = sorted(
+            self.stats(group).items(),
+            key=lambda row: getattr(row[1], sort_by),
+            reverse=True,
+        )
+        return rows[:limit] if limit is not None else rows
+
+    def report(
+        self,
+        sort_by: str = "cumulative",
+        limit: Optional[int] = 20,
+    ) -> str:
+        """Formats the statistics of every group as text tables.
+
+        Args:
+            sort_by (str, optional): One of `Profiler.SORT_KEYS`. Defaults to "cumulative".
+            limit (Optional[int], optional): Maximum number of rows per group.
+                Defaults to 20.
+
+        Returns:
+            str: The report.
+        """
+
+        lines: List[str] = []
+        for group in Profiler.Group:
+            rows = self.rows(group, sort_by=sort_by, limit=limit)
+            if lines:
+                lines.append("")
+
+            lines.append(
+                f"{'calls':>10} {'cumulative ms':>14} {'self ms':>10} "
+                f"{'output size':>12}  {group.value}"
+            )
+            for key, stats in rows:
+                lines.append(
+                    f"{stats.calls:>10} {stats.cumulative * 1000:>14.3f} "
+                    f"{stats.self_time * 1000:>10.3f} {stats.output_size:>12}  {key}"
+                )
+
+        return "\n".join(lines)
@@ -0,0 +1,282 @@
+"""Project generation module"""
+
+from typing import (
+    List,
+    Dict,
+    Union,
+    Optional,
+)
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+
+from .generator import Generator
+from .loader import TemplateLoader
+from .context import Context
+from .exceptions import (
+    NoneValueException,
+    InvalidValueException,
+)
+
+
+class Project:
+    """Generates many output files, each from a template and a context.
+
+    Entries are rendered by a thread pool, since `Generator.generate` is thread-safe
+    and entries hold contexts that cannot always be sent to other processes.
+    Threads overlap evaluators waiting on I/O and the file writes, but rendering
+    itself holds the GIL, so CPU-bound entries do not render faster with more
+    workers, @see `benchmarks/bench_project.py`. A file is written only when its
+    content changed, atomically through a temporary file in the same directory,
+    so unchanged files keep their modification time.
+
+    Examples:
+    ---------
+    >>> project = dictrule.Project(loader=dictrule.TemplateLoader(["templates"]))
+    >>> project.add("model", user_context, "out/user.py")
+    >>> project.add("model", post_context, "out/post.py")
+    >>> report = project.generate()
+    >>> report.written
+    [PosixPath('out/post.py')]
+    """
+
+    class Status(Enum):
+        """Enumeration defining the result of writing an output file"""
+
+        WRITTEN = "written"
+        UNCHANGED = "unchanged"
+
+    class Entry:
+        """Output file generated from a template and a context"""
+
+        def __init__(
+            self,
+            template: Union[str, Path, Generator],
+            context: Optional[Context],
+            output_path: Union[str, Path],
+        ):
+            """Constructor method of `Project.Entry`
+
+            Args:
+                template (Union[str, Path, Generator]): A generator, or a template name
+                    loaded by the `TemplateLoader` of the project.
+                context (Optional[Context]): The context to generate the file.
+                output_path (Union[str, Path]): The output file path.
+            """
+
+            self.template = template
+            self.context = context
+            self.output_path = Path(output_path)
+
+    class Report:
+        """Result of `Project.generate`"""
+
+        def __init__(
+            self,
+            statuses: Dict[Path, "Project.Status"],
+        ):
+            """Constructor method of `Project.Report`
+
+            Args:
+                statuses (Dict[Path, Project.Status]): map of output paths to their status
+            """
+
+            self._statuses = statuses
+
+        @property
+        def statuses(self) -> Dict[Path, "Project.Status"]:
+            """Get the `statuses` property"""
+
+            return self._statuses
+
+        @property
+        def written(self) -> List[Path]:
+            """Get the `written` property
+
+            Returns:
+                List[Path]: Output paths whose content changed
+            """
+
+            return [p for p, s in self._statuses.items() if s == Project.Status.WRITTEN]
+
+        @property
+        def unchanged(self) -> List[Path]:
+            """Get the `unchanged` property
+
+            Returns:
+                List[Path]: Output paths left untouched
+            """
+
+            return [p for p, s in self._statuses.items() if s == Project.Status.UNCHANGED]
+
+    def __init__(
+        self,
+        entries: Optional[List["Project.Entry"]] = None,
+        loader: Optional[TemplateLoader] = None,
+        max_workers: Optional[int] = None,
+        encoding: str = "utf-8",
+    ):
+        """Constructor method of `Project`
+
+        Args:
+            entries (Optional[List[Project.Entry]], optional): Output files. Defaults to None.
+            loader (Optional[TemplateLoader], optional): Loads the entries given
+                by template name. Defaults to None.
+            max_workers (Optional[int], optional): Maximum number of rendering threads.
+                Defaults to the `ThreadPoolExecutor` default.
+            encoding (str, optional): Encoding of output files. Defaults to "utf-8".
+        """
+
+        self._entries: List[Project.Entry] = list(entries or [])
+        self._loader = loader
+        self._max_workers = max_workers
+        self._encoding = encoding
+
+    @property
+    def entries(self) -> List["Project.Entry"]:
+        """Get the `entries` property"""
+
+        return self._entries
+
+    def add(
+        self,
+        template: Union[str, Path, Generator],
+        context: Optional[Context],
+        output_path: Union[str, Path],
+    ) -> "Project.Entry":
+        """Adds an output file.
+
+        Args:
+            template (Union[str, Path, Generator]): A generator or a template name.
+            context (Optional[Context]): The context to generate the file.
+            output_path (Union[str, Path]): The output file path.
+
+        Returns:
+            Project.Entry: The added entry.
+        """
+
+        entry = Project.Entry(
+            template=template,
+            context=context,
+            output_path=output_path,
+        )
+        self._entries.append(entry)
+        return entry
+
+    def generate(self) -> "Project.Report":
+        """Renders every entry and writes the output files whose content changed.
+
+        Returns:
+            Project.Report: Status of every output file, in the order of entries.
+        """
+
+        paths = [entry.output_path.resolve() for entry in self._entries]
+        if len(set(paths)) != len(paths):
+            raise InvalidValueException("Output paths of project entries must be unique")
+
+        mode = Project.default_mode()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            statuses = list(
+                executor.map(
+                    lambda entry: self._generate_entry(entry, mode),
+                    self._entries,
+                )
+            )
+
+        return Project.Report(
+            {entry.output_path: status for entry, status in zip(self._entries, statuses)}
+        )
+
+    def _generate_entry(
+        self,
+        entry: "Project.Entry",
+        mode: int,
+    ) -> "Project.Status":
+        """Renders an entry and writes its output file if changed."""
+
+        generator = entry.template
+        if not isinstance(generator, Generator):
+            if self._loader is None:
+                raise NoneValueException(
+                    f"A `TemplateLoader` is required to load template `{generator}`"
+                )
+
+            generator = self._loader.load(generator)
+
+        text = generator.generate(entry.context)
+        return Project.write_if_changed(
+            path=entry.output_path,
+            content=text.encode(self._encoding),
+            mode=mode,
+        )
+
+    @staticmethod
+    def write_if_changed(
+        path: Union[str, Path],
+        content: bytes,
+        mode: Optional[int] = None,
+    ) -> "Project.Status":
+        """Writes `content` to `path` atomically, unless the file already has
+        the same content.
+
+        Args:
+            path (Union[str, Path]): The output file path.
+            content (bytes): The file content.
+            mode (Optional[int], optional): Permissions of a new file, an existing file
+                keeps its own. Defaults to `Project.default_mode()`.
+
+        Returns:
+            Project.Status: `WRITTEN` if the file was written, `UNCHANGED` otherwise.
+        """
+
+        path = Path(path)
+        try:
+            if os.stat(path).st_size == len(content) and path.read_bytes() == content:
+                return Project.Status.UNCHANGED
+            exists = True
+        except FileNotFoundError:
+            exists = False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+
+            if exists:
+                shutil.copymode(path, temp_path)
+            else:
+                os.chmod(temp_path, Project.default_mode() if mode is None else mode)
+
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        return Project.Status.WRITTEN
+
+    @staticmethod
+    def default_mode() -> int:
+        """Gets the permissions of new files under the process umask.
+
+        Reading the umask briefly changes it, so it is read once per `generate`
+        before rendering starts.
+
+        Returns:
+            int: The file mode.
+        """
+
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
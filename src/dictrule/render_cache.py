@@ -0,0 +1,377 @@
+"""Render cache module"""
+
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+    Hashable,
+    Optional,
+    Set,
+)
+
+import sys
+import threading
+import types
+from collections import OrderedDict
+
+from .exceptions import (
+    InvalidTypeException,
+    InvalidValueException,
+)
+
+
+class RenderCache:
+    """LRU cache of rendered subtrees, shared by `Generator.generate` calls.
+
+    Outputs of reusable template nodes are cached by the compiled node and
+    a fingerprint of the values of the eval names the node depends on, and
+    of the other context cases. Later renders reuse the output of every node
+    whose inputs did not change, so evaluators must return the same value
+    for the same name while their output is cached.
+
+    The cache is bounded both in entries and in bytes of cached text, and
+    can be shared by generators and threads.
+
+    Examples:
+    ---------
+    >>> generator = dictrule.Generator(rules, cache=dictrule.RenderCache(max_bytes=1 << 20))
+    >>> generator.generate(context)
+    >>> print(generator.cache.stats())
+    """
+
+    class Stats:
+        """Counters of a `RenderCache`"""
+
+        __slots__ = (
+            "hits",
+            "misses",
+            "evictions",
+            "entries",
+            "size",
+        )
+
+        def __init__(
+            self,
+            hits: int = 0,
+            misses: int = 0,
+            evictions: int = 0,
+            entries: int = 0,
+            size: int = 0,
+        ):
+            self.hits = hits
+            self.misses = misses
+            self.evictions = evictions
+            self.entries = entries
+            self.size = size
+
+        def __repr__(self) -> str:
+            return (
+                f"RenderCache.Stats(hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions}, entries={self.entries}, size={self.size})"
+            )
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+    ):
+        """Constructor method of `RenderCache`
+
+        Args:
+            max_entries (int, optional): Maximum number of cached outputs. Defaults to 1024.
+            max_bytes (int, optional): Maximum memory of cached outputs, in bytes.
+                Defaults to 16 MiB.
+        """
+
+        if max_entries <= 0:
+            raise InvalidValueException("`max_entries` must be positive")
+
+        if max_bytes <= 0:
+            raise InvalidValueException("`max_bytes` must be positive")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Get the `max_entries` property"""
+
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        """Get the `max_bytes` property"""
+
+        return self._max_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+    ) -> Optional[str]:
+        """Gets a cached output, marking it as recently used.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            Optional[str]: The output, None if not cached.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        key: Hashable,
+        output: str,
+    ):
+        """Caches an output, evicting the least recently used outputs over the bounds.
+
+        Outputs larger than `max_bytes` are not cached.
+
+        Args:
+            key (Hashable): The key.
+            output (str): The output.
+        """
+
+        size = sys.getsizeof(output)
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            self._entries[key] = (output, size)
+            self._size += size
+            while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self):
+        """Removes every cached output, keeping the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> "RenderCache.Stats":
+        """Gets a snapshot of the counters.
+
+        Returns:
+            RenderCache.Stats: Hits, misses, evictions, number of entries
+                and bytes of cached outputs.
+        """
+
+        with self._lock:
+            return RenderCache.Stats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    @staticmethod
+    def value_key(
+        value: Any,
+    ) -> Hashable:
+        """Gets a hashable fingerprint of an evaluated value.
+
+        Strings, numbers, booleans and None, and lists, tuples, sets and
+        dictionaries of them are supported. Values of different types get
+        different fingerprints, since they render differently.
+
+        Args:
+            value (Any): The value.
+
+        Returns:
+            Hashable: The fingerprint.
+
+        Raises:
+            InvalidTypeException: If the value, or a value it contains,
+                has no fingerprint or contains itself.
+        """
+
+        return RenderCache._value_key(value, set())
+
+    @staticmethod
+    def state_key(
+        value: Any,
+    ) -> Hashable:
+        """Gets a hashable fingerprint of an object, such as a `Context.Case`,
+        from its attributes.
+
+        Values supported by `value_key` get their fingerprint, lists, tuples, sets
+        and dictionaries of other objects the fingerprints of their items,
+        objects defining their own equality are used as they are, functions, classes, modules and
+        objects without attributes are compared by identity, and other objects
+        are compared by the fingerprints of their attributes.
+
+        Args:
+            value (Any): The object.
+
+        Returns:
+            Hashable: The fingerprint.
+
+        Raises:
+            InvalidTypeException: If the object has no fingerprint
+                or refers back to itself.
+        """
+
+        return RenderCache._state_key(value, set())
+
+    @staticmethod
+    def _value_key(
+        value: Any,
+        visiting: Set[int],
+    ) -> Hashable:
+        """Gets the fingerprint of a value, `visiting` holding the ids
+        of the containers being fingerprinted."""
+
+        value_type = type(value)
+        if value_type is str:
+            return value
+
+        if value is None or value_type in (int, float, bool, bytes):
+            return (value_type, value)
+
+        if value_type not in (list, tuple, set, frozenset, dict):
+            raise InvalidTypeException(
+                f"Value of type {value_type.__name__} has no fingerprint"
+            )
+
+        value_id = id(value)
+        if value_id in visiting:
+            raise InvalidTypeException(f"Value of type {value_type.__name__} contains itself")
+
+        visiting.add(value_id)
+        try:
+            if value_type in (list, tuple):
+                return (
+                    value_type,
+                    tuple(RenderCache._value_key(item, visiting) for item in value),
+                )
+
+            if value_type in (set, frozenset):
+                return (
+                    value_type,
+                    frozenset(RenderCache._value_key(item, visiting) for item in value),
+                )
+
+            items: Dict[Hashable, Hashable] = {}
+            for key, item in value.items():
+                items[RenderCache._value_key(key, visiting)] = RenderCache._value_key(
+                    item, visiting
+                )
+            return (dict, tuple(items.items()))
+        finally:
+            visiting.discard(value_id)
+
+    @staticmethod
+    def _state_key(
+        value: Any,
+        visiting: Set[int],
+    ) -> Hashable:
+        """Gets the fingerprint of an object, `visiting` holding the ids
+        of the objects being fingerprinted."""
+
+        try:
+            return RenderCache.value_key(value)
+        except InvalidTypeException:
+            pass
+
+        value_type = type(value)
+        if value_type in (list, tuple, set, frozenset, dict):
+            return RenderCache._items_state_key(value, visiting)
+
+        if value_type.__eq__ is not object.__eq__:
+            if value_type.__hash__ is None:
+                raise InvalidTypeException(
+                    f"Value of type {value_type.__name__} has no fingerprint"
+                )
+            return (value_type, value)
+
+        attributes = getattr(value, "__dict__", None)
+        if not attributes or isinstance(
+            value,
+            (
+                type,
+                types.FunctionType,
+                types.MethodType,
+                types.BuiltinFunctionType,
+                types.ModuleType,
+            ),
+        ):
+            return value
+
+        value_id = id(value)
+        if value_id in visiting:
+            raise InvalidTypeException(f"Value of type {value_type.__name__} refers to itself")
+
+        visiting.add(value_id)
+        try:
+            return (
+                value_type,
+                tuple(
+                    (name, RenderCache._state_key(attribute, visiting))
+                    for name, attribute in sorted(attributes.items())
+                ),
+            )
+        finally:
+            visiting.discard(value_id)
+
+    @staticmethod
+    def _items_state_key(
+        value: Any,
+        visiting: Set[int],
+    ) -> Hashable:
+        """Gets the fingerprint of a container of objects from the fingerprints
+        of its items, `visiting` holding the ids of the objects being fingerprinted."""
+
+        value_type = type(value)
+        value_id = id(value)
+        if value_id in visiting:
+            raise InvalidTypeException(f"Value of type {value_type.__name__} contains itself")
+
+        visiting.add(value_id)
+        try:
+            if value_type in (list, tuple):
+                return (
+                    value_type,
+                    tuple(RenderCache._state_key(item, visiting) for item in value),
+                )
+
+            if value_type in (set, frozenset):
+                return (
+                    value_type,
+                    frozenset(RenderCache._state_key(item, visiting) for item in value),
+                )
+
+            return (
+                dict,
+                tuple(
+                    (RenderCache._state_key(key, visiting), RenderCache._state_key(item, visiting))
+                    for key, item in value.items()
+                ),
+            )
+        finally:
+            visiting.discard(value_id)
@@ -3,6 +3,8 @@
 from typing import (
     Set,
     Dict,
+    List,
+    Tuple,
     Any,
     Callable,
     Optional,
@@ -64,3 +66,167 @@ class Rule(ABC):
         """
 
         return ""
+
+    def eval_dependencies(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """Eval names the rule reads itself from the `EvalRule` context,
+        excluding the ones read by sub-rules through `rule_callback`.
+
+        Used by `dictrule.Template` to track which eval names each subtree depends on.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            Optional[List[str]]: Eval names, None if the rule cannot tell statically.
+        """
+
+        _ = rule_dict
+        return None
+
+    def bound_evals(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Eval names the rule binds for its sub-rules, such as a loop variable.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            List[str]: Bound eval names
+        """
+
+        _ = rule_dict
+        return []
+
+    def context_names(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Names of the `Context.Case` the rule reads while parsing `rule_dict`.
+
+        Defaults to the `CONTEXT_NAME` of the rule class when it defines one.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            List[str]: Case names
+        """
+
+        _ = rule_dict
+        context_name = getattr(self, "CONTEXT_NAME", None)
+        return [context_name] if isinstance(context_name, str) else []
+
+    def sub_rules(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[Any]:
+        """Rules the rule parses through `rule_callback` besides the values of `rule_dict`,
+        such as the rules of an included partial.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            List[Any]: Extra rules compiled along with `rule_dict`
+        """
+
+        _ = rule_dict
+        return []
+
+    def rule_values(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[Tuple[str, Any]]:
+        """Keys and values of `rule_dict` holding rules parsed through `rule_callback`.
+
+        Used by `dictrule.Template` to compile sub-rules. Defaults to every item.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            List[Tuple[str, Any]]: Keys and values
+        """
+
+        return list(rule_dict.items())
+
+    def definition_name(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[str]:
+        """Name defined by `rule_dict` at the top level of a template, such as a macro.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            Optional[str]: The defined name, None if `rule_dict` defines nothing
+        """
+
+        _ = rule_dict
+        return None
+
+    def called_definition(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional[str]:
+        """Name of the definition generated by `rule_dict`, such as a called macro.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            Optional[str]: The called name, None if `rule_dict` calls nothing
+        """
+
+        _ = rule_dict
+        return None
+
+    def validate(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> List[str]:
+        """Checks the values of `rule_dict` statically, once when compiling.
+
+        Rules validating a check here can skip it in `trusted_parse`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+
+        Returns:
+            List[str]: Error messages, empty if `rule_dict` is valid
+        """
+
+        _ = rule_dict
+        return []
+
+    def trusted_parse(
+        self,
+        rule_dict: Dict[str, Any],
+        rule_callback: Callable[[Optional[Context], Any], str],
+        context: Optional[Context] = None,
+    ) -> str:
+        """Parses a rule dictionary that passed `validate`, skipping its checks.
+
+        Used by trusted renders of `dictrule.Generator`. Defaults to `parse`.
+
+        Args:
+            rule_dict (Dict[str, Any]): Dictionay of rules to generate
+            rule_callback (Callable[[Optional[Context], Any], str]): rule callback
+                for rules not handled by the current rule
+            context (Optional[Context], optional): Context for the rule. Defaults to None.
+
+        Returns:
+            str: Generated text
+        """
+
+        return self.parse(
+            rule_dict=rule_dict,
+            rule_callback=rule_callback,
+            context=context,
+        )
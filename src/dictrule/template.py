@@ -0,0 +1,924 @@
+"""Compiled template module"""
+
+from typing import (
+    Any,
+    List,
+    Dict,
+    Set,
+    Tuple,
+    Union,
+    FrozenSet,
+    Iterable,
+    Sequence,
+    Optional,
+    Callable,
+)
+
+import marshal
+import struct
+import sys
+from array import array
+
+from .rule import Rule
+from .exceptions import (
+    InvalidTypeException,
+    InvalidValueException,
+    TemplateValidationException,
+)
+
+
+class Template:
+    """Compiled form of generation rules.
+
+    Compiling walks the rules once, detects the `Rule` of every rule dictionary
+    and records which eval names each subtree depends on. Eval names bound by
+    a rule for its sub-rules, such as the `for` variable of `ForInRule`,
+    are resolved to the names they are bound from.
+
+    Rule dictionaries are looked up by identity while rendering, so the rules
+    must not be mutated after compiling.
+
+    Top-level rule dictionaries defining a name, such as macros of `MacroRule`,
+    are compiled once and listed in `definitions`. Rules calling a definition
+    depend on the eval names of its body.
+
+    Examples:
+    ---------
+    >>> template = Template(
+    ...     gen_rules=[{"for": "item", "in": "items", "block": [{"eval": "item.name"}]}],
+    ...     detect_rule=lambda rule_dict: Generator.detect_rule(rule_dict, rules),
+    ... )
+    >>> template.nodes[0].dependencies
+    frozenset({'items'})
+
+    Compiling also validates every rule dictionary with `Rule.validate`, listing
+    the errors with their node paths in `errors` instead of raising on the first.
+    Invalid nodes are compiled like rule dictionaries without a rule.
+
+    Templates which cannot be rendered at all, with duplicate or missing definitions,
+    recursive calls, or a rule dictionary reached from itself such as a partial
+    including itself, raise `TemplateValidationException` with every error once
+    compiling ends.
+
+    `dumps` serializes a compiled template into a versioned binary format,
+    restored by `loads` without compiling again. The payload is written with
+    `marshal`, whose format may change between Python versions, so templates
+    are only loaded by the Python version which serialized them.
+    """
+
+    FORMAT_MAGIC = b"DRTPL"
+    FORMAT_VERSION = 4
+    _HEADER = struct.Struct("<5sHBB")
+
+    class References:
+        """Eval names and context cases a template can reference"""
+
+        def __init__(self):
+            self._evals: Set[str] = set()
+            self._bound_names: Set[str] = set()
+            self._bound_evals: Set[str] = set()
+            self._context_cases: Dict[str, Set[str]] = {}
+            self._complete = True
+
+        @property
+        def evals(self) -> Set[str]:
+            """Get the `evals` property
+
+            Returns:
+                Set[str]: `eval`/`in` names read from the context
+            """
+
+            return self._evals
+
+        @property
+        def bound_names(self) -> Set[str]:
+            """Get the `bound_names` property
+
+            Returns:
+                Set[str]: Names bound by rules, such as `for` loop variables
+            """
+
+            return self._bound_names
+
+        @property
+        def bound_evals(self) -> Set[str]:
+            """Get the `bound_evals` property
+
+            Returns:
+                Set[str]: `eval`/`in` names served by bound names, such as `item.name`
+            """
+
+            return self._bound_evals
+
+        @property
+        def context_cases(self) -> Dict[str, Set[str]]:
+            """Get the `context_cases` property
+
+            Returns:
+                Dict[str, Set[str]]: map of case names to the names of the rule classes
+                    reading them [case_name: str, rule_names: Set[str]]
+            """
+
+            return self._context_cases
+
+        @property
+        def complete(self) -> bool:
+            """Get the `complete` property
+
+            Returns:
+                bool: False if a rule was not detected or cannot list its eval names
+            """
+
+            return self._complete
+
+    class Node:
+        """Compiled rule dictionary"""
+
+        __slots__ = (
+            "rule_dict",
+            "rule",
+            "path",
+            "children",
+            "bound_names",
+            "scoped",
+            "dynamic",
+            "dependencies",
+        )
+
+        def __init__(
+            self,
+            rule_dict: Dict[str, Any],
+            rule: Optional[Rule],
+            path: str,
+        ):
+            """Constructor method of `Template.Node`
+
+            Args:
+                rule_dict (Dict[str, Any]): The rule dictionary.
+                rule (Optional[Rule]): The detected rule, None if not found.
+                path (str): Path of the node from the template root, such as `[3].indent_3`.
+            """
+
+            self.rule_dict = rule_dict
+            self.rule = rule
+            self.path = path
+            self.children: List["Template.Node"] = []
+            self.bound_names: List[str] = []
+            self.scoped = False
+            self.dynamic = rule is None
+            self.dependencies: FrozenSet[str] = frozenset()
+
+        @property
+        def reusable(self) -> bool:
+            """Whether the rendered output only depends on `dependencies`.
+
+            Nodes rendered under a bound scope, such as a loop body, and nodes
+            with statically unknown dependencies are not reusable.
+            """
+
+            return not self.scoped and not self.dynamic
+
+        def depends_on(
+            self,
+            names: Iterable[str],
+        ) -> bool:
+            """Checks if the node depends on any of `names`.
+
+            A dependency matches a name when one is a key path prefix of the other,
+            so both `gen` and `gen.contents.first` match `gen.contents`.
+
+            Args:
+                names (Iterable[str]): Eval names.
+
+            Returns:
+                bool: True if the node depends on any name.
+            """
+
+            if self.dynamic:
+                return True
+
+            for name in names:
+                for dependency in self.dependencies:
+                    if Template.is_path_prefix(name, dependency) or (
+                        Template.is_path_prefix(dependency, name)
+                    ):
+                        return True
+
+            return False
+
+        def descendants(self) -> List["Template.Node"]:
+            """Gets the node and all of its sub-nodes.
+
+            Returns:
+                List[Template.Node]: Nodes, each one listed once.
+            """
+
+            nodes: List[Template.Node] = []
+            visited: Set[int] = set()
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if id(node) in visited:
+                    continue
+
+                visited.add(id(node))
+                nodes.append(node)
+                stack.extend(reversed(node.children))
+
+            return nodes
+
+    def __init__(
+        self,
+        gen_rules: List[Any],
+        detect_rule: Callable[[Dict[str, Any]], Optional[Rule]],
+    ):
+        """Constructor method of `Template`
+
+        Args:
+            gen_rules (List[Any]): List of rules.
+            detect_rule (Callable[[Dict[str, Any]], Optional[Rule]]): Detects the rule
+                of a rule dictionary.
+        """
+
+        self._gen_rules = list(gen_rules)
+        self._detect_rule = detect_rule
+        self._nodes: Dict[int, Template.Node] = {}
+        self._compiling: Set[int] = set()
+        self._definitions: Dict[str, Template.Node] = {}
+        self._defined_rules: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._roots: List[Optional[Template.Node]] = []
+        self._references = Template.References()
+        self._errors: List[Tuple[str, str]] = []
+        self._invalid: Set[int] = set()
+        self._sub_rules: Dict[int, List[Any]] = {}
+        self._unrenderable = False
+        for index, rule in enumerate(self._gen_rules):
+            if not isinstance(rule, dict):
+                continue
+
+            detected = detect_rule(rule)
+            if detected is None or detected.validate(rule):
+                continue
+
+            name = detected.definition_name(rule)
+            if name is None:
+                continue
+
+            if name in self._defined_rules:
+                self._fail(f"[{index}]", f"Found a duplicate definition `{name}`")
+                continue
+
+            self._defined_rules[name] = (index, rule)
+
+        for name in self._defined_rules:
+            self._definition(name, path=f"[{self._defined_rules[name][0]}]")
+
+        defined = {id(rule_dict) for _, rule_dict in self._defined_rules.values()}
+        for index, rule in enumerate(self._gen_rules):
+            if id(rule) in defined:
+                self._roots.append(self.node(rule))
+                continue
+
+            self._compile_value(
+                value=rule,
+                path=f"[{index}]",
+                scope=(),
+                scoped=False,
+                parent=None,
+            )
+            self._roots.append(self.node(rule) if isinstance(rule, dict) else None)
+
+        if self._unrenderable:
+            raise TemplateValidationException(self._errors)
+
+    @property
+    def gen_rules(self) -> List[Any]:
+        """Get the `gen_rules` property"""
+
+        return self._gen_rules
+
+    @property
+    def roots(self) -> List[Optional["Template.Node"]]:
+        """Get the `roots` property
+
+        Returns:
+            List[Optional[Template.Node]]: Node of each item of `gen_rules`,
+                None for items that are not rule dictionaries.
+        """
+
+        return self._roots
+
+    @property
+    def references(self) -> "Template.References":
+        """Get the `references` property
+
+        Returns:
+            Template.References: Eval names and context cases the template references.
+        """
+
+        return self._references
+
+    @property
+    def definitions(self) -> Dict[str, "Template.Node"]:
+        """Get the `definitions` property
+
+        Returns:
+            Dict[str, Template.Node]: map of defined names to their top-level nodes
+        """
+
+        return self._definitions
+
+    @property
+    def sub_rules(self) -> Dict[int, List[Any]]:
+        """Get the `sub_rules` property
+
+        Returns:
+            Dict[int, List[Any]]: map of `id` of rule dictionaries to the extra rules
+                compiled with them, @see `Rule.sub_rules`
+        """
+
+        return self._sub_rules
+
+    @property
+    def errors(self) -> List[Tuple[str, str]]:
+        """Get the `errors` property
+
+        Returns:
+            List[Tuple[str, str]]: Paths and messages of the invalid rule dictionaries,
+                in template order, empty if the template is valid.
+        """
+
+        return self._errors
+
+    @property
+    def nodes(self) -> List["Template.Node"]:
+        """Get the `nodes` property
+
+        Returns:
+            List[Template.Node]: All nodes in compile order.
+        """
+
+        return list(self._nodes.values())
+
+    def node(
+        self,
+        rule_dict: Dict[str, Any],
+    ) -> Optional["Template.Node"]:
+        """Gets the compiled node of a rule dictionary of the template.
+
+        Args:
+            rule_dict (Dict[str, Any]): The rule dictionary.
+
+        Returns:
+            Optional[Template.Node]: The node, None if `rule_dict` is not part of the template.
+        """
+
+        return self._nodes.get(id(rule_dict))
+
+    def dumps(
+        self,
+        parse_rules: Sequence[Rule],
+    ) -> bytes:
+        """Serializes the compiled template.
+
+        The format is a header of `FORMAT_MAGIC`, `FORMAT_VERSION` and the major and
+        minor Python version, followed by a `marshal` payload of `gen_rules`, an interned string table, and node
+        columns referencing rules by index in `parse_rules`, parent nodes and
+        strings, and the extra rules compiled with some nodes, such as included
+        partials. Shared rule dictionaries stay shared once loaded.
+
+        Args:
+            parse_rules (Sequence[Rule]): The rules the template was compiled with,
+                in the order passed to `loads`.
+
+        Returns:
+            bytes: The serialized template.
+        """
+
+        rule_indexes = {id(rule): index for index, rule in enumerate(parse_rules)}
+        strings: Dict[str, int] = {}
+        dependency_sets: Dict[FrozenSet[str], int] = {}
+        nodes = list(self._nodes.values())
+        node_indexes = {id(node): index for index, node in enumerate(nodes)}
+        parents = [-1] * len(nodes)
+        for index, node in enumerate(nodes):
+            for child in node.children:
+                child_index = node_indexes[id(child)]
+                if parents[child_index] < 0 and child_index > index and (
+                    Template.is_path_prefix(node.path, child.path)
+                ):
+                    parents[child_index] = index
+
+        rules = array("i")
+        paths = array("i")
+        flags = array("i")
+        dependencies = array("i")
+        bound_names = array("i")
+        bound_name_counts = array("i")
+        children = array("i")
+        children_counts = array("i")
+        for node, parent in zip(nodes, parents):
+            rule_index = -1
+            if node.rule is not None:
+                rule_index = rule_indexes.get(id(node.rule), -1)
+                if rule_index < 0:
+                    raise InvalidValueException(
+                        f"Rule of `{node.path}` is not one of `parse_rules`"
+                    )
+
+            path = node.path[len(nodes[parent].path) :] if parent >= 0 else node.path
+            rules.append(rule_index)
+            paths.append(strings.setdefault(path, len(strings)))
+            flags.append(int(node.scoped) | int(node.dynamic) << 1)
+            dependencies.append(
+                dependency_sets.setdefault(node.dependencies, len(dependency_sets))
+            )
+            bound_names.extend(strings.setdefault(name, len(strings)) for name in node.bound_names)
+            bound_name_counts.append(len(node.bound_names))
+            children.extend(node_indexes[id(child)] for child in node.children)
+            children_counts.append(len(node.children))
+
+        references = self._references
+        payload = (
+            tuple(Template._rule_name(rule) for rule in parse_rules),
+            self._gen_rules,
+            [node.rule_dict for node in nodes],
+            tuple(strings),
+            tuple(tuple(sorted(names)) for names in dependency_sets),
+            tuple(
+                Template._column_bytes(column)
+                for column in (
+                    rules,
+                    array("i", parents),
+                    paths,
+                    flags,
+                    dependencies,
+                    bound_names,
+                    bound_name_counts,
+                    children,
+                    children_counts,
+                )
+            ),
+            Template._column_bytes(
+                array(
+                    "i",
+                    (node_indexes[id(root)] if root is not None else -1 for root in self._roots),
+                )
+            ),
+            tuple((name, node_indexes[id(node)]) for name, node in self._definitions.items()),
+            tuple((name, index) for name, (index, _) in self._defined_rules.items()),
+            tuple(self._errors),
+            tuple(
+                (index, self._sub_rules[rule_id])
+                for index, rule_id in enumerate(self._nodes)
+                if rule_id in self._sub_rules
+            ),
+            (
+                tuple(sorted(references.evals)),
+                tuple(sorted(references.bound_names)),
+                tuple(sorted(references.bound_evals)),
+                tuple(
+                    (name, tuple(sorted(rule_names)))
+                    for name, rule_names in sorted(references.context_cases.items())
+                ),
+                references.complete,
+            ),
+        )
+        try:
+            body = marshal.dumps(payload, 4)
+        except ValueError as error:
+            raise InvalidTypeException(
+                f"Rules of the template cannot be serialized: {error}"
+            ) from error
+
+        return (
+            Template._HEADER.pack(
+                Template.FORMAT_MAGIC,
+                Template.FORMAT_VERSION,
+                *sys.version_info[:2],
+            )
+            + body
+        )
+
+    @staticmethod
+    def loads(
+        data: Union[bytes, bytearray, memoryview],
+        parse_rules: Sequence[Rule],
+        detect_rule: Callable[[Dict[str, Any]], Optional[Rule]],
+    ) -> "Template":
+        """Restores a template serialized by `dumps`, without compiling it.
+
+        The payload is unmarshaled into new objects, so `data` is not used once
+        the template is restored.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The serialized template.
+            parse_rules (Sequence[Rule]): Rules of the same classes, in the same order,
+                as the rules passed to `dumps`.
+            detect_rule (Callable[[Dict[str, Any]], Optional[Rule]]): Detects the rule
+                of a rule dictionary.
+
+        Returns:
+            Template: The template.
+        """
+
+        with memoryview(data) as view:
+            if len(view) < Template._HEADER.size:
+                raise InvalidValueException("Data is not a compiled template")
+
+            magic, version, major, minor = Template._HEADER.unpack_from(view)
+            if magic != Template.FORMAT_MAGIC:
+                raise InvalidValueException("Data is not a compiled template")
+
+            if version != Template.FORMAT_VERSION:
+                raise InvalidValueException(
+                    f"Unsupported compiled template version {version}, "
+                    f"expected {Template.FORMAT_VERSION}"
+                )
+
+            if (major, minor) != sys.version_info[:2]:
+                raise InvalidValueException(
+                    f"Compiled template was serialized by Python {major}.{minor}, "
+                    f"serialize it again with Python {sys.version_info[0]}.{sys.version_info[1]}"
+                )
+
+            with view[Template._HEADER.size :] as body:
+                try:
+                    payload = marshal.loads(body)
+                except (EOFError, ValueError, TypeError) as error:
+                    raise InvalidValueException(
+                        f"Corrupted compiled template: {error}"
+                    ) from error
+
+        (
+            rule_names,
+            gen_rules,
+            rule_dicts,
+            strings,
+            dependency_sets,
+            columns,
+            roots,
+            definitions,
+            defined_rules,
+            errors,
+            sub_rules,
+            (evals, bound_evals_names, bound_evals, context_cases, complete),
+        ) = payload
+        parse_rules = tuple(parse_rules)
+        if tuple(Template._rule_name(rule) for rule in parse_rules) != rule_names:
+            raise InvalidValueException(
+                f"Template was compiled with other parse rules: {', '.join(rule_names)}"
+            )
+
+        (
+            rules,
+            parents,
+            paths,
+            flags,
+            dependencies,
+            bound_names,
+            bound_name_counts,
+            children,
+            children_counts,
+        ) = (Template._column(column) for column in columns)
+        node_rules = parse_rules + (None,)
+        frozen_sets = [frozenset(names) for names in dependency_sets]
+        new_node = Template.Node.__new__
+        node_type = Template.Node
+        nodes: List[Template.Node] = []
+        bound_name_index = 0
+        for rule_dict, rule_index, parent, path, flag, dependency_set, count in zip(
+            rule_dicts, rules, parents, paths, flags, dependencies, bound_name_counts
+        ):
+            node = new_node(node_type)
+            node.rule_dict = rule_dict
+            node.rule = node_rules[rule_index]
+            node.path = nodes[parent].path + strings[path] if parent >= 0 else strings[path]
+            node.scoped = bool(flag & 1)
+            node.dynamic = bool(flag & 2)
+            node.dependencies = frozen_sets[dependency_set]
+            node.bound_names = []
+            if count:
+                node.bound_names = [
+                    strings[name]
+                    for name in bound_names[bound_name_index : bound_name_index + count]
+                ]
+                bound_name_index += count
+            nodes.append(node)
+
+        child_index = 0
+        for node, count in zip(nodes, children_counts):
+            node.children = []
+            if count:
+                node.children = [
+                    nodes[index] for index in children[child_index : child_index + count]
+                ]
+                child_index += count
+
+        template = Template.__new__(Template)
+        template._gen_rules = gen_rules
+        template._detect_rule = detect_rule
+        template._nodes = dict(zip(map(id, rule_dicts), nodes))
+        template._compiling = set()
+        template._definitions = {name: nodes[index] for name, index in definitions}
+        template._defined_rules = {name: (index, gen_rules[index]) for name, index in defined_rules}
+        template._roots = [
+            nodes[index] if index >= 0 else None for index in Template._column(roots)
+        ]
+        template._errors = [tuple(error) for error in errors]
+        template._invalid = set()
+        template._sub_rules = {id(rule_dicts[index]): rules for index, rules in sub_rules}
+        references = Template.References()
+        references._evals.update(evals)
+        references._bound_names.update(bound_evals_names)
+        references._bound_evals.update(bound_evals)
+        for name, case_rule_names in context_cases:
+            references._context_cases[name] = set(case_rule_names)
+        references._complete = complete
+        template._references = references
+        return template
+
+    @staticmethod
+    def _column_bytes(
+        column: "array[int]",
+    ) -> Tuple[str, bytes]:
+        """Gets the smallest typecode fitting an integer column and its little-endian bytes."""
+
+        low = min(column, default=0)
+        high = max(column, default=0)
+        typecode = "i"
+        for candidate in ("b", "h"):
+            bits = array(candidate).itemsize * 8 - 1
+            if -(1 << bits) <= low and high < 1 << bits:
+                typecode = candidate
+                break
+
+        column = array(typecode, column)
+        if sys.byteorder == "big":
+            column.byteswap()
+
+        return typecode, column.tobytes()
+
+    @staticmethod
+    def _column(
+        typecode_and_data: Tuple[str, bytes],
+    ) -> "array[int]":
+        """Reads an integer column from its typecode and little-endian bytes."""
+
+        typecode, data = typecode_and_data
+        column = array(typecode)
+        column.frombytes(data)
+        if sys.byteorder == "big":
+            column.byteswap()
+
+        return column
+
+    @staticmethod
+    def _rule_name(
+        rule: Rule,
+    ) -> str:
+        """Gets the qualified class name of a rule, checked when loading a template."""
+
+        return f"{type(rule).__module__}.{type(rule).__qualname__}"
+
+    @staticmethod
+    def is_path_prefix(
+        prefix: str,
+        name: str,
+    ) -> bool:
+        """Checks if `prefix` is `name` or one of its parent key paths.
+
+        Args:
+            prefix (str): The parent key path.
+            name (str): The key path.
+
+        Returns:
+            bool: True if `name` is under `prefix`.
+        """
+
+        if not name.startswith(prefix):
+            return False
+
+        return len(name) == len(prefix) or name[len(prefix)] in ".["
+
+    def _compile_value(
+        self,
+        value: Any,
+        path: str,
+        scope: Tuple[Tuple[str, FrozenSet[str]], ...],
+        scoped: bool,
+        parent: Optional["Template.Node"],
+    ) -> Tuple[Set[str], bool]:
+        """Compiles the rule dictionaries found in `value`.
+
+        Returns:
+            Tuple[Set[str], bool]: Dependencies of `value`, and whether they are unknown.
+        """
+
+        if isinstance(value, dict):
+            return self._compile_node(
+                rule_dict=value,
+                path=path,
+                scope=scope,
+                scoped=scoped,
+                parent=parent,
+            )
+
+        dependencies: Set[str] = set()
+        dynamic = False
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                item_dependencies, item_dynamic = self._compile_value(
+                    value=item,
+                    path=f"{path}[{index}]",
+                    scope=scope,
+                    scoped=scoped,
+                    parent=parent,
+                )
+                dependencies |= item_dependencies
+                dynamic = dynamic or item_dynamic
+
+        return dependencies, dynamic
+
+    def _compile_node(
+        self,
+        rule_dict: Dict[str, Any],
+        path: str,
+        scope: Tuple[Tuple[str, FrozenSet[str]], ...],
+        scoped: bool,
+        parent: Optional["Template.Node"],
+    ) -> Tuple[Set[str], bool]:
+        """Compiles a rule dictionary.
+
+        A dictionary reached more than once, such as a shared partial, keeps one node
+        whose dependencies are the union of every occurrence.
+        """
+
+        if id(rule_dict) in self._compiling:
+            self._fail(path, "Found a cycle of rules")
+            return set(), True
+
+        node = self._nodes.get(id(rule_dict))
+        if node is None:
+            node = Template.Node(
+                rule_dict=rule_dict,
+                rule=self._detect_rule(rule_dict),
+                path=path,
+            )
+            self._nodes[id(rule_dict)] = node
+            self._validate(node)
+
+        if parent is not None and node not in parent.children:
+            parent.children.append(node)
+
+        node.scoped = node.scoped or scoped
+        rule = node.rule if id(rule_dict) not in self._invalid else None
+        dependencies: Set[str] = set()
+        dynamic = rule is None
+        bound_names: List[str] = []
+        references = self._references
+        if rule is None:
+            references._complete = False
+        else:
+            names = rule.eval_dependencies(rule_dict)
+            if names is None:
+                dynamic = True
+                references._complete = False
+            else:
+                for name in names:
+                    dependencies |= Template._resolve(name, scope)
+                    if Template._is_bound(name, scope):
+                        references._bound_evals.add(name)
+                    else:
+                        references._evals.add(name)
+
+            bound_names = rule.bound_evals(rule_dict)
+            references._bound_names.update(bound_names)
+            for context_name in rule.context_names(rule_dict):
+                references._context_cases.setdefault(context_name, set()).add(
+                    type(rule).__name__
+                )
+
+        child_scope = scope
+        for name in bound_names:
+            if name not in node.bound_names:
+                node.bound_names.append(name)
+            child_scope = child_scope + ((name, frozenset(dependencies)),)
+
+        items = rule.rule_values(rule_dict) if rule is not None else rule_dict.items()
+        values = [(f"{path}.{key}", value) for key, value in items]
+        called_name = None
+        if rule is not None:
+            sub_rules = rule.sub_rules(rule_dict)
+            if sub_rules:
+                self._sub_rules[id(rule_dict)] = sub_rules
+            values.append((f"{path}.sub_rules", sub_rules))
+            called_name = rule.called_definition(rule_dict)
+
+        self._compiling.add(id(rule_dict))
+        try:
+            for value_path, value in values:
+                value_dependencies, value_dynamic = self._compile_value(
+                    value=value,
+                    path=value_path,
+                    scope=child_scope,
+                    scoped=scoped or bool(bound_names),
+                    parent=node,
+                )
+                dependencies |= value_dependencies
+                dynamic = dynamic or value_dynamic
+        finally:
+            self._compiling.discard(id(rule_dict))
+
+        if called_name is not None:
+            definition = self._definition(called_name, path)
+            if definition is None:
+                dynamic = True
+            else:
+                dependencies |= definition.dependencies
+                dynamic = dynamic or definition.dynamic
+
+        node.dependencies = node.dependencies | dependencies
+        node.dynamic = node.dynamic or dynamic
+        return dependencies, dynamic
+
+    def _validate(
+        self,
+        node: "Template.Node",
+    ):
+        """Records the errors of a new node, marking it invalid if any."""
+
+        if node.rule is None:
+            messages = [f"Not found any rule in dict {node.rule_dict}"]
+        else:
+            messages = node.rule.validate(node.rule_dict)
+
+        if messages:
+            self._invalid.add(id(node.rule_dict))
+            node.dynamic = True
+            self._errors.extend((node.path, message) for message in messages)
+
+    def _fail(
+        self,
+        path: str,
+        message: str,
+    ):
+        """Records an error making the template unrenderable."""
+
+        self._unrenderable = True
+        self._errors.append((path, message))
+
+    def _definition(
+        self,
+        name: str,
+        path: str,
+    ) -> Optional["Template.Node"]:
+        """Gets the node of a definition, compiling it on first use,
+        or records the error and returns None if it cannot be called."""
+
+        node = self._definitions.get(name)
+        if node is not None:
+            return node
+
+        if name not in self._defined_rules:
+            self._fail(path, f"Not found definition `{name}`")
+            return None
+
+        index, rule_dict = self._defined_rules[name]
+        if id(rule_dict) in self._compiling:
+            self._fail(path, f"Found a recursive call of `{name}`")
+            return None
+
+        self._compile_value(
+            value=rule_dict,
+            path=f"[{index}]",
+            scope=(),
+            scoped=False,
+            parent=None,
+        )
+        node = self._nodes[id(rule_dict)]
+        self._definitions[name] = node
+        return node
+
+    @staticmethod
+    def _resolve(
+        name: str,
+        scope: Tuple[Tuple[str, FrozenSet[str]], ...],
+    ) -> Set[str]:
+        """Resolves an eval name to the context names it depends on,
+        looking up bound names from the innermost scope."""
+
+        for bound_name, dependencies in reversed(scope):
+            if Template.is_path_prefix(bound_name, name):
+                return set(dependencies)
+
+        return {name}
+
+    @staticmethod
+    def _is_bound(
+        name: str,
+        scope: Tuple[Tuple[str, FrozenSet[str]], ...],
+    ) -> bool:
+        """Checks if an eval name is served by a bound name of the scope."""
+
+        return any(Template.is_path_prefix(bound_name, name) for bound_name, _ in scope)
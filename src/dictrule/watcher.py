@@ -0,0 +1,307 @@
+"""Watcher module"""
+
+from typing import (
+    Any,
+    List,
+    Dict,
+    Set,
+    Tuple,
+    Union,
+    Callable,
+    Optional,
+)
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from .loader import TemplateLoader
+from .project import Project
+from .template import Template
+from .context import Context
+
+
+class Watcher:
+    """Polls template, partial and context files, re-rendering only the outputs
+    affected by changed files.
+
+    An output is affected by its template file and the partials it includes,
+    and by the key paths of the context data its template references.
+    Templates are loaded through a `TemplateLoader`, so unchanged templates
+    are not parsed or compiled again.
+
+    Examples:
+    ---------
+    >>> watcher = dictrule.Watcher(
+    ...     loader=dictrule.TemplateLoader(["partials"]),
+    ...     targets=[("templates/model.py.yml", "out/model.py")],
+    ...     context_path="context.yml",
+    ... )
+    >>> watcher.run()
+    """
+
+    class Target:
+        """Output file of a template"""
+
+        def __init__(
+            self,
+            template: Path,
+            output_path: Path,
+        ):
+            """Constructor method of `Watcher.Target`
+
+            Args:
+                template (Path): The template file.
+                output_path (Path): The output file.
+            """
+
+            self.template = template
+            self.output_path = output_path
+            self.dependencies: List[Path] = []
+            self.references: Optional[Template.References] = None
+
+    def __init__(
+        self,
+        loader: TemplateLoader,
+        targets: List[Tuple[Union[str, Path], Union[str, Path]]],
+        context_path: Optional[Union[str, Path]] = None,
+        interval: float = 0.05,
+    ):
+        """Constructor method of `Watcher`
+
+        Args:
+            loader (TemplateLoader): Loads templates and their partials.
+            targets (List[Tuple[Union[str, Path], Union[str, Path]]]): Template files
+                and their output files.
+            context_path (Optional[Union[str, Path]], optional): JSON or YAML file
+                of context data. Defaults to None.
+            interval (float, optional): Seconds between polls. Defaults to 0.05.
+        """
+
+        self._loader = loader
+        self._targets = [
+            Watcher.Target(Path(template).resolve(), Path(output_path))
+            for template, output_path in targets
+        ]
+        self._context_path = Path(context_path) if context_path is not None else None
+        self._interval = interval
+        self._data: Any = None
+        self._context: Optional[Context] = None
+        self._stats: Dict[Path, Any] = {}
+
+    @property
+    def targets(self) -> List["Watcher.Target"]:
+        """Get the `targets` property"""
+
+        return self._targets
+
+    def render_all(self) -> Dict[Path, Union[Project.Status, Exception]]:
+        """Loads the context and renders every target.
+
+        Returns:
+            Dict[Path, Union[Project.Status, Exception]]: map of output paths
+                to their status, or to the error raised while rendering,
+                and of the context path to the error raised while loading it
+        """
+
+        error = self._load_context()
+        results = self._render(self._targets)
+        if error is not None and self._context_path is not None:
+            results[self._context_path] = error
+
+        return results
+
+    def poll(self) -> Dict[Path, Union[Project.Status, Exception]]:
+        """Checks watched files once, re-rendering the affected targets.
+
+        A context file which cannot be read or parsed, such as a half-saved
+        or deleted file, is reported and the last loaded context is kept.
+
+        Returns:
+            Dict[Path, Union[Project.Status, Exception]]: map of re-rendered output paths
+                to their status, or to the error raised while rendering,
+                and of the context path to the error raised while loading it
+        """
+
+        changed: Set[Path] = set()
+        for path, stat_key in list(self._stats.items()):
+            if Watcher._stat_key(path) != stat_key:
+                changed.add(path)
+
+        if not changed:
+            return {}
+
+        affected: List[Watcher.Target] = []
+        context_names: Optional[List[str]] = []
+        error: Optional[Exception] = None
+        if self._context_path is not None and self._context_path in changed:
+            previous = self._data
+            error = self._load_context()
+            if error is None:
+                context_names = Watcher.changed_names(previous, self._data)
+
+        for target in self._targets:
+            if changed.intersection(target.dependencies) or Watcher._depends_on(
+                target, context_names
+            ):
+                affected.append(target)
+
+        for path in changed:
+            self._stats[path] = Watcher._stat_key(path)
+
+        results = self._render(affected)
+        if error is not None and self._context_path is not None:
+            results[self._context_path] = error
+
+        return results
+
+    def run(
+        self,
+        stop: Optional[threading.Event] = None,
+        on_render: Optional[
+            Callable[[Dict[Path, Union[Project.Status, Exception]], float], None]
+        ] = None,
+    ):
+        """Renders every target, then polls until `stop` is set.
+
+        Args:
+            stop (Optional[threading.Event], optional): Stops watching when set.
+                Defaults to None, watching forever.
+            on_render (Optional[Callable[[Dict[Path, Union[Project.Status, Exception]],
+                float], None]], optional): Called with the results and the seconds
+                spent after each render. Defaults to None.
+        """
+
+        stop = stop or threading.Event()
+        started = time.perf_counter()
+        results = self.render_all()
+        if on_render is not None:
+            on_render(results, time.perf_counter() - started)
+
+        while not stop.wait(self._interval):
+            started = time.perf_counter()
+            results = self.poll()
+            if results and on_render is not None:
+                on_render(results, time.perf_counter() - started)
+
+    @staticmethod
+    def changed_names(
+        previous: Any,
+        current: Any,
+        prefix: str = "",
+    ) -> Optional[List[str]]:
+        """Lists the key paths whose values differ between two context data.
+
+        Args:
+            previous (Any): The previous data.
+            current (Any): The current data.
+            prefix (str, optional): Key path of the data. Defaults to "".
+
+        Returns:
+            Optional[List[str]]: Changed key paths, None if the whole data changed.
+        """
+
+        if not isinstance(previous, dict) or not isinstance(current, dict):
+            if previous == current:
+                return []
+
+            return [prefix] if prefix else None
+
+        names: List[str] = []
+        for key in list(previous) + [key for key in current if key not in previous]:
+            value = previous.get(key)
+            other = current.get(key)
+            if key in previous and key in current and value == other:
+                continue
+
+            name = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, dict) and isinstance(other, dict):
+                names.extend(Watcher.changed_names(value, other, name) or [])
+            else:
+                names.append(name)
+
+        return names
+
+    def _load_context(self) -> Optional[Exception]:
+        """Loads the context data, keeping the last loaded data and returning
+        the error if the file cannot be read or parsed."""
+
+        if self._context_path is None:
+            return None
+
+        self._stats[self._context_path] = Watcher._stat_key(self._context_path)
+        try:
+            data = TemplateLoader.parse_data(
+                self._context_path.read_bytes(),
+                self._context_path.suffix,
+            )
+            context = TemplateLoader.data_context(data)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return error
+
+        self._data = data
+        self._context = context
+        return None
+
+    def _render(
+        self,
+        targets: List["Watcher.Target"],
+    ) -> Dict[Path, Union[Project.Status, Exception]]:
+        """Renders targets, tracking the files they are generated from."""
+
+        results: Dict[Path, Union[Project.Status, Exception]] = {}
+        for target in targets:
+            try:
+                generator = self._loader.load(target.template)
+                target.references = generator.template.references
+                target.dependencies = self._loader.dependencies(target.template)
+                results[target.output_path] = Project.write_if_changed(
+                    path=target.output_path,
+                    content=generator.generate(self._context).encode("utf-8"),
+                )
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                results[target.output_path] = error
+                target.dependencies = [target.template]
+
+            for path in target.dependencies:
+                if path not in self._stats:
+                    self._stats[path] = Watcher._stat_key(path)
+
+        return results
+
+    @staticmethod
+    def _depends_on(
+        target: "Watcher.Target",
+        names: Optional[List[str]],
+    ) -> bool:
+        """Checks if the template of a target references any of the changed key paths."""
+
+        if names is None:
+            return True
+
+        if not names:
+            return False
+
+        references = target.references
+        if references is None or not references.complete:
+            return True
+
+        return any(
+            Template.is_path_prefix(name, eval_name) or Template.is_path_prefix(eval_name, name)
+            for eval_name in references.evals
+            for name in names
+        )
+
+    @staticmethod
+    def _stat_key(
+        path: Path,
+    ) -> Any:
+        """Gets the modification time and size of a file, None if it does not exist."""
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
@@ -4,6 +4,10 @@ import unittest
 from typing import Any
 from dictrule.context import Context
 from dictrule.built_in_rules import EvalRule
+from dictrule.exceptions import (
+    InvalidValueException,
+    NoneValueException,
+)
 
 
 class TestEvalRule(unittest.TestCase):
@@ -240,6 +244,164 @@ class TestEvalRule(unittest.TestCase):
                 rule_callback=lambda x, y: y if y else "",
             )
 
+    def test_dict_path_evaluator(self):
+        """Test method"""
+
+        rule = EvalRule()
+        evaluator = EvalRule.DictPathEvaluator(
+            prefix="doc",
+            document={
+                "a": {"b": [0, 1, 2, {"c": "value"}]},
+                "title": "Title",
+            },
+        )
+        context = Context([EvalRule.ContextCase(evaluators=[evaluator])])
+
+        for eval_name, expected in [
+            ("doc.a.b[3].c", "value"),
+            ("doc.a.b[-1].c", "value"),
+            ("doc.title", "Title"),
+            ("doc.a.b[1]", 1),
+        ]:
+            parsed = rule.parse(
+                rule_dict={"eval": eval_name},
+                context=context,
+                rule_callback=lambda x, y: y if y else "",
+            )
+            self.assertEqual(parsed, expected)
+
+        for eval_name in ["doc.a.b[4]", "doc.a.x", "doc.title[0]"]:
+            self.assertIsNone(evaluator.run(eval_name))
+
+        for eval_name in ["doc.a.b[4]", "doc.a.x", "doc.title[0]", "document.title"]:
+            with self.assertRaises(NoneValueException):
+                _ = rule.parse(
+                    rule_dict={"eval": eval_name},
+                    context=context,
+                    rule_callback=lambda x, y: y if y else "",
+                )
+
+    def test_dict_path_parse(self):
+        """Test method"""
+
+        parse_path = EvalRule.DictPathEvaluator.parse_path
+        self.assertTupleEqual(parse_path(""), ())
+        self.assertTupleEqual(parse_path("a.b[3].c"), ("a", "b", 3, "c"))
+        self.assertTupleEqual(parse_path("[1][2]"), (1, 2))
+        self.assertIs(parse_path("a.b[3].c"), parse_path("a.b[3].c"))
+        for path in ["a..b", "a.", ".a", "a[x]", "a[1]b", "a.[1]"]:
+            with self.assertRaises(InvalidValueException):
+                _ = parse_path(path)
+
+        evaluator = EvalRule.DictPathEvaluator(prefix="", document=[{"a": 1}])
+        self.assertEqual(evaluator.run("[0].a"), 1)
+        self.assertListEqual(evaluator.run(""), [{"a": 1}])
+
+    def test_eval_values(self):
+        """Test method"""
+
+        case = EvalRule.ContextCase(
+            evaluators=[TestEvalRule.LoremEvaluator("test")],
+            fallback=TestEvalRule.LoremEvaluator("dummy"),
+            values={
+                "title": "Title",
+                "test": "shadowed",
+                "flat.key": "flat",
+                "gen": {"contents": ["Train", "Ship"]},
+            },
+        )
+        self.assertEqual(case.eval("title"), "Title")
+        self.assertEqual(case.eval("test"), "lorem")
+        self.assertEqual(case.eval("flat.key"), "flat")
+        self.assertEqual(case.eval("gen.contents[1]"), "Ship")
+        self.assertEqual(case.eval("gen.missing"), "lorem")
+        self.assertEqual(case.eval("gen..contents"), "lorem")
+        case = case.with_evaluator(TestEvalRule.LoremEvaluator("title"))
+        self.assertEqual(case.eval("title"), "lorem")
+
+    def test_namespace_evaluator(self):
+        """Test method"""
+
+        class Owner:
+            """Test class"""
+
+            def __init__(self):
+                self.name = "Zooxy"
+                self.accesses = 0
+                self._secret = "secret"
+
+            @property
+            def profile(self):
+                """Test method"""
+                self.accesses += 1
+                return {"email": "zooxy@example.com", "tags": ["a", "b"]}
+
+        class PrefixEvaluator(EvalRule.Evaluable):
+            """Test class"""
+
+            @property
+            def name(self) -> str:
+                """Test method"""
+                return "git."
+
+            @property
+            def prefix_matching(self) -> bool:
+                """Test method"""
+                return True
+
+            def run(self, cmd: str) -> Any:
+                """Test method"""
+                return cmd.upper()
+
+        owner = Owner()
+        evaluator = EvalRule.NamespaceEvaluator(
+            evaluators=[PrefixEvaluator(), TestEvalRule.LoremEvaluator("gen.lorem")],
+            values={"gen": {"title": "Title", "items": [1, 2]}},
+        )
+        evaluator.mount("gen.owner", owner)
+        for eval_name, expected in [
+            ("gen.title", "Title"),
+            ("gen.items[1]", 2),
+            ("gen.owner.name", "Zooxy"),
+            ("gen.owner.profile.email", "zooxy@example.com"),
+            ("gen.owner.profile.tags[0]", "a"),
+            ("gen.lorem", "lorem"),
+            ("git.author", "GIT.AUTHOR"),
+            ("gen.owner._secret", None),
+            ("gen.lorem.x", None),
+            ("gen.items[2]", None),
+            ("gen..title", None),
+            ("other", None),
+        ]:
+            self.assertEqual(evaluator.run(eval_name), expected, eval_name)
+
+        self.assertEqual(owner.accesses, 1)
+        owner.name = "Zooxy Le"
+        self.assertEqual(evaluator.run("gen.owner.name"), "Zooxy")
+        evaluator.invalidate()
+        self.assertEqual(evaluator.run("gen.owner.name"), "Zooxy Le")
+
+        evaluator.mount("gen.title", "Mounted")
+        self.assertEqual(evaluator.run("gen.title"), "Mounted")
+
+        prefixed = EvalRule.NamespaceEvaluator(prefix="doc", values={"a": [{"b": 1}]})
+        self.assertEqual(prefixed.run("doc.a[0].b"), 1)
+        self.assertEqual(prefixed.run("document.a"), None)
+        with self.assertRaises(InvalidValueException):
+            prefixed.mount("a..b", 1)
+
+        prefixed = EvalRule.NamespaceEvaluator(prefix="ns", evaluators=[PrefixEvaluator()])
+        self.assertEqual(prefixed.run("ns.git.author"), "GIT.AUTHOR")
+
+        owner = Owner()
+        bounded = EvalRule.NamespaceEvaluator(values={"owner": owner}, max_entries=1)
+        self.assertEqual(bounded.run("owner.profile.email"), "zooxy@example.com")
+        self.assertEqual(bounded.run("owner.profile.tags[0]"), "a")
+        self.assertEqual(bounded.run("owner.profile.email"), "zooxy@example.com")
+        self.assertEqual(owner.accesses, 3)
+        with self.assertRaises(InvalidValueException):
+            EvalRule.NamespaceEvaluator(max_entries=0)
+
 
 if __name__ == "__main__":
     unittest.main()
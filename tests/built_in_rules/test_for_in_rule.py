@@ -7,7 +7,9 @@ from typing import (
     Optional,
 )
 import unittest
+from unittest import mock
 from dictrule.context import Context
+from dictrule.eval_object import EvalObject
 from dictrule.built_in_rules import ForInRule, EvalRule
 
 
@@ -177,6 +179,31 @@ class TestForInRule(unittest.TestCase):
             "text\n0\ntext_1\n6\ntext\n1\ntext_text_2\n11\ntext\n2\ntext_text_text_3\n16",
         )
 
+    def test_for_in_frozen_context(self):
+        """Test method"""
+
+        rule = ForInRule()
+        context = Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[TestForInRule.LineEvaluator("lines")],
+                )
+            ]
+        ).freeze()
+
+        parsed = rule.parse(
+            rule_dict={
+                "for": "line",
+                "in": "lines",
+                "block": [{"eval": "line.text"}],
+            },
+            context=context,
+            rule_callback=TestForInRule._rule_callback,
+        )
+
+        self.assertEqual(parsed, "text_1\ntext_text_2\ntext_text_text_3")
+        self.assertEqual(len(context.cases), 1)
+
     def test_for_in_empty_block(self):
         """Test method"""
 
@@ -332,6 +359,105 @@ class TestForInRule(unittest.TestCase):
 
         self.assertEqual(parsed, "text\ntext_1")
 
+    def test_for_in_columns(self):
+        """Test method"""
+
+        rule = ForInRule()
+
+        parsed = rule.parse(
+            rule_dict={
+                "for": "line",
+                "in": "lines",
+                "block": [
+                    {
+                        "eval": "line.index",
+                    },
+                    {
+                        "eval": "line.text",
+                    },
+                    {
+                        "eval": "line.len",
+                    },
+                ],
+            },
+            context=Context(
+                [
+                    EvalRule.ContextCase(
+                        evaluators=[
+                            EvalRule.KeyValueEvaluator(
+                                "lines",
+                                EvalObject.from_homogeneous_list(
+                                    [
+                                        {"text": "text_1", "len": 6},
+                                        {"text": "text_text_2", "len": 11},
+                                    ]
+                                ),
+                            )
+                        ],
+                    )
+                ]
+            ),
+            rule_callback=TestForInRule._rule_callback,
+        )
+
+        self.assertEqual(parsed, "0\ntext_1\n6\n1\ntext_text_2\n11")
+
+    def test_for_in_columns_eval(self):
+        """Test method"""
+
+        columns = EvalObject.from_homogeneous_list(
+            [
+                {"text": "text_1", "len": 6},
+                {"text": "text_text_2", "len": 11},
+            ]
+        )
+        for_in_eval = ForInRule.ForInEval(
+            var_name="line",
+            var=columns[1],
+            extra_properties={"index": 1},
+            columns=columns.data,
+        )
+        with mock.patch.object(
+            EvalObject.Columns.Row, "__getattr__", side_effect=AssertionError
+        ):
+            self.assertEqual(for_in_eval.run("line.text"), "text_text_2")
+            self.assertEqual(for_in_eval.run("line.len"), 11)
+            self.assertEqual(for_in_eval.run("line.index"), 1)
+
+    def test_for_in_stream(self):
+        """Test method"""
+
+        rule = ForInRule()
+
+        parsed = rule.parse(
+            rule_dict={
+                "for": "line",
+                "in": "lines",
+                "block": [
+                    {
+                        "eval": "line",
+                    },
+                ],
+            },
+            context=Context(
+                [
+                    EvalRule.ContextCase(
+                        evaluators=[
+                            EvalRule.KeyValueEvaluator(
+                                "lines",
+                                EvalObject.from_eo_property_object(
+                                    f"text_{i}" for i in range(3)
+                                ),
+                            )
+                        ],
+                    )
+                ]
+            ),
+            rule_callback=TestForInRule._rule_callback,
+        )
+
+        self.assertEqual(parsed, "text_0\ntext_1\ntext_2")
+
 
 if __name__ == "__main__":
     unittest.main()
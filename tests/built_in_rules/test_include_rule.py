@@ -0,0 +1,114 @@
+"""IncludeRule test"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from dictrule.generator import Generator
+from dictrule.loader import TemplateLoader
+from dictrule.context import Context
+from dictrule.built_in_rules import (
+    EvalRule,
+    IncludeRule,
+)
+from dictrule.exceptions import InvalidValueException
+
+
+class TestIncludeRule(unittest.TestCase):
+    """Test class"""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self._path = Path(self._dir.name)
+        self._loader = TemplateLoader([self._path])
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write(self, name: str, rules, mtime_ns: int = 0):
+        path = self._path / f"{name}.json"
+        path.write_text(json.dumps(rules), encoding="utf-8")
+        if mtime_ns:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_parse(self):
+        """Test method"""
+
+        self._write("license", ["// line_1", "// line_2"])
+        rule = IncludeRule(self._loader)
+        parsed = rule.parse(
+            rule_dict={"include": "license"},
+            rule_callback=lambda x, y: y,
+        )
+        self.assertEqual(parsed, "// line_1\n// line_2")
+
+    def test_shared_partial(self):
+        """Test method"""
+
+        self._write("name", [{"eval": "name"}])
+        self._write(
+            "main",
+            [
+                {"include": "name"},
+                {"indent_1": {"include": "name"}},
+            ],
+        )
+        generator = self._loader.load("main")
+        partial_rule = self._loader.load_rules("name")[0]
+        node = generator.template.node(partial_rule)
+        self.assertIsNotNone(node)
+        self.assertEqual(node.dependencies, frozenset({"name"}))
+        nodes = [n for n in generator.template.nodes if n.rule_dict is partial_rule]
+        self.assertEqual(len(nodes), 1)
+        self.assertIn("name", generator.referenced_evals().evals)
+
+        text = generator.generate(
+            Context(
+                [
+                    EvalRule.ContextCase(
+                        evaluators=[EvalRule.DictPathEvaluator("", {"name": "zooxy"})],
+                    )
+                ]
+            )
+        )
+        self.assertEqual(text, "zooxy\n  zooxy")
+
+    def test_compiled_partial(self):
+        """Test method"""
+
+        self._write("name", ["first"], mtime_ns=1_000_000_000)
+        self._write("main", [{"include": "name"}, {"indent_1": {"include": "name"}}])
+        generator = self._loader.load("main")
+        with mock.patch.object(TemplateLoader, "load_rules") as load_rules:
+            self.assertEqual(generator.generate(), "first\n  first")
+            loaded = Generator.loads(
+                generator.dumps(),
+                parse_rules=Generator.STD_RULES + [IncludeRule(self._loader)],
+            )
+            self.assertEqual(loaded.generate(), "first\n  first")
+            load_rules.assert_not_called()
+
+        self._write("name", ["second", {"include": "main"}], mtime_ns=2_000_000_000)
+        self.assertEqual(generator.generate(), "first\n  first")
+        with self.assertRaises(InvalidValueException):
+            _ = self._loader.load("main")
+
+        self._write("name", ["second"], mtime_ns=3_000_000_000)
+        self.assertEqual(self._loader.load("main").generate(), "second\n  second")
+
+    def test_cycle(self):
+        """Test method"""
+
+        self._write("first", ["a", {"include": "second"}])
+        self._write("second", [{"block": [{"include": "first"}]}])
+        with self.assertRaises(InvalidValueException):
+            _ = self._loader.load("first")
+
+        generator = Generator(
+            [{"include": "second"}],
+            parse_rules=Generator.STD_RULES + [IncludeRule(self._loader)],
+        )
+        with self.assertRaises(InvalidValueException):
+            _ = generator.generate(Context([]))
@@ -0,0 +1,141 @@
+"""MacroRule and CallRule test"""
+
+import unittest
+from dictrule.generator import Generator
+from dictrule.context import Context
+from dictrule.built_in_rules import (
+    EvalRule,
+    MacroRule,
+    CallRule,
+)
+from dictrule.exceptions import InvalidValueException
+
+
+class TestMacroRule(unittest.TestCase):
+    """Test class"""
+
+    GETTER = {
+        "define": "getter",
+        "params": ["field"],
+        "block": [
+            {"inline": ["def get_", {"eval": "field.name"}, "(self):"]},
+            {"indent_1": {"inline": ["return self._", {"eval": "field.name"}]}},
+        ],
+    }
+
+    class Field:
+        """Field"""
+
+        def __init__(self, name: str):
+            self.name = name
+
+    def _context(self, **values) -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator("", values),
+                )
+            ]
+        )
+
+    def test_macro(self):
+        """Test method"""
+
+        rule = MacroRule()
+        macro = rule.macro(TestMacroRule.GETTER)
+        self.assertEqual(macro.name, "getter")
+        self.assertEqual(macro.params, ("field",))
+        self.assertEqual(rule.bound_evals(TestMacroRule.GETTER), ["field"])
+        self.assertEqual(
+            rule.parse(rule_dict=TestMacroRule.GETTER, rule_callback=lambda x, y: y), ""
+        )
+
+    def test_call(self):
+        """Test method"""
+
+        rule = CallRule()
+        context = self._context(title=TestMacroRule.Field("title")).with_case(
+            MacroRule.ContextCase([MacroRule().macro(TestMacroRule.GETTER)])
+        )
+        parsed = rule.parse(
+            rule_dict={"call": "getter", "with": {"field": {"eval": "title"}}},
+            rule_callback=lambda c, r: c.get(EvalRule.CONTEXT_NAME).eval("field.name"),
+            context=context,
+        )
+        self.assertEqual(parsed, "title\ntitle")
+
+    def test_generate(self):
+        """Test method"""
+
+        generator = Generator(
+            [
+                TestMacroRule.GETTER,
+                {"call": "getter", "with": {"field": {"eval": "first"}}},
+                {
+                    "for": "field",
+                    "in": "fields",
+                    "block": [{"call": "getter", "with": {"field": {"eval": "field"}}}],
+                },
+            ]
+        )
+        context = self._context(
+            first=TestMacroRule.Field("id"),
+            fields=[TestMacroRule.Field("name"), TestMacroRule.Field("age")],
+        )
+        self.assertEqual(
+            generator.generate(context),
+            "def get_id(self):\n  return self._id\n"
+            "def get_name(self):\n  return self._name\n"
+            "def get_age(self):\n  return self._age",
+        )
+
+        template = generator.template
+        self.assertEqual(list(template.definitions), ["getter"])
+        call_node = template.node(generator.gen_rules[1])
+        self.assertEqual(call_node.dependencies, frozenset({"first"}))
+        self.assertTrue(call_node.reusable)
+        self.assertIn("first", template.references.evals)
+        self.assertNotIn("field.name", template.references.evals)
+
+    def test_literal_and_rendered_arguments(self):
+        """Test method"""
+
+        generator = Generator(
+            [
+                {
+                    "define": "pair",
+                    "params": ["key", "value"],
+                    "block": [{"inline": [{"eval": "key"}, " = ", {"eval": "value"}]}],
+                },
+                {
+                    "call": "pair",
+                    "with": {"key": "name", "value": {"format_uppercase": "zooxy"}},
+                },
+            ]
+        )
+        self.assertEqual(generator.generate(), "name = ZOOXY")
+
+    def test_invalid(self):
+        """Test method"""
+
+        with self.assertRaises(InvalidValueException):
+            _ = Generator([{"call": "unknown"}]).template
+
+        with self.assertRaises(InvalidValueException):
+            _ = Generator(
+                [{"define": "loop", "block": [{"call": "loop"}]}, {"call": "loop"}]
+            ).template
+
+        with self.assertRaises(InvalidValueException):
+            _ = Generator(
+                [{"define": "twice", "block": ["a"]}, {"define": "twice", "block": ["b"]}]
+            ).template
+
+        generator = Generator(
+            [TestMacroRule.GETTER, {"call": "getter", "with": {"other": "value"}}]
+        )
+        with self.assertRaises(InvalidValueException):
+            _ = generator.generate()
+
+        self.assertIsInstance(Generator.STD_RULES[-1], CallRule)
@@ -0,0 +1,122 @@
+"""Command-line interface test"""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from dictrule.cli import main
+
+
+class TestCli(unittest.TestCase):
+    """Test class"""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self._path = Path(self._dir.name)
+        self._write("a.py.json", ["# a", {"eval": "gen.title"}])
+        self._write("b.py.json", ["# b", {"include": str(self._path / "partial.json")}])
+        self._write("partial.json", [{"format_uppercase": {"eval": "gen.title"}}])
+        self._write("context.json", {"gen": {"title": "hello"}})
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write(self, name: str, data):
+        (self._path / name).write_text(json.dumps(data), encoding="utf-8")
+
+    def _main(self, *argv):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main(list(argv))
+
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_render_stdout(self):
+        """Test method"""
+
+        code, stdout, stderr = self._main(
+            "render",
+            str(self._path / "a.py.json"),
+            str(self._path / "b.py.json"),
+            "--context",
+            str(self._path / "context.json"),
+            "--jobs",
+            "2",
+            "--timings",
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout, "# a\nhello\n# b\nHELLO\n")
+        self.assertIn("a.py.json: load", stderr)
+        self.assertIn("b.py.json: load", stderr)
+
+    def test_render_output_dir(self):
+        """Test method"""
+
+        argv = [
+            "render",
+            str(self._path / "a.py.json"),
+            "-c",
+            str(self._path / "context.json"),
+            "-o",
+            str(self._path / "out"),
+            "--timings",
+        ]
+        code, stdout, stderr = self._main(*argv)
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout, "")
+        self.assertTrue(stderr.rstrip().endswith("written"))
+        self.assertEqual((self._path / "out" / "a.py").read_text(encoding="utf-8"), "# a\nhello")
+
+        _, _, stderr = self._main(*argv)
+        self.assertTrue(stderr.rstrip().endswith("unchanged"))
+
+    def test_error(self):
+        """Test method"""
+
+        code, _, stderr = self._main("render", str(self._path / "missing.json"))
+        self.assertEqual(code, 1)
+        self.assertTrue(stderr.startswith("dictrule: error:"))
+
+        code, _, stderr = self._main(
+            "render",
+            str(self._path / "a.py.json"),
+            str(self._path / "missing.json"),
+            "--jobs",
+            "2",
+        )
+        self.assertEqual(code, 1)
+        self.assertTrue(stderr.startswith("dictrule: error:"))
+
+    def test_output_collision(self):
+        """Test method"""
+
+        (self._path / "other").mkdir()
+        self._write("other/a.py.json", ["# other a"])
+        code, _, stderr = self._main(
+            "render",
+            str(self._path / "a.py.json"),
+            str(self._path / "other" / "a.py.json"),
+            "-c",
+            str(self._path / "context.json"),
+            "-o",
+            str(self._path / "out"),
+        )
+        self.assertEqual(code, 1)
+        self.assertIn("are both written to", stderr)
+        self.assertFalse((self._path / "out").exists())
+
+    def test_invalid_context(self):
+        """Test method"""
+
+        self._write("list.json", ["hello"])
+        code, _, stderr = self._main(
+            "render",
+            str(self._path / "a.py.json"),
+            "-c",
+            str(self._path / "list.json"),
+        )
+        self.assertEqual(code, 1)
+        self.assertIn("Context data must be a mapping", stderr)
@@ -1,7 +1,16 @@
 """Test module"""
 
 import unittest
-from dictrule.context import Context
+from typing import (
+    Any,
+    Dict,
+)
+
+from dictrule.context import Context, FrozenContext
+from dictrule.dr_property import dr_property
+from dictrule.generator import Generator
+from dictrule.rule import Rule
+from dictrule.built_in_rules import EvalRule
 from dictrule.exceptions import (
     InvalidValueException,
 )
@@ -11,6 +20,33 @@ class DummyContext(Context):
     """Test class"""
 
 
+class NamedContext(Context):
+    """Test class"""
+
+    def __init__(self, cases, label: str):
+        super().__init__(cases)
+        self.label = label
+
+
+class LabelRule(Rule):
+    """Test class"""
+
+    @dr_property()
+    def _label(self, props: Dict[str, Any]) -> Any:
+        """Test method"""
+
+    def parse(self, rule_dict, rule_callback, context=None) -> str:
+        return context.label
+
+
+class NamedFrozenContext(FrozenContext):
+    """Test class"""
+
+    def __init__(self, cases, label: str):
+        super().__init__(cases)
+        object.__setattr__(self, "label", label)
+
+
 class DummyContextCase(Context.Case):
     """Test class"""
 
@@ -48,6 +84,126 @@ class TestContext(unittest.TestCase):
         with self.assertRaises(InvalidValueException):
             _ = DummyContext([DummyContextCase("dummy"), DummyContextCase("dummy")])
 
+    def test_with_case(self):
+        """Test method"""
+
+        case_1 = DummyContextCase("name_1")
+        case_2 = DummyContextCase("name_2")
+        context = DummyContext([case_1])
+
+        derived = context.with_case(case_2)
+        self.assertIsInstance(derived, DummyContext)
+        self.assertListEqual(context.cases, [case_1])
+        self.assertListEqual(derived.cases, [case_1, case_2])
+
+        replaced = derived.with_case(DummyContextCase("name_1"))
+        self.assertIsNot(replaced.get("name_1"), case_1)
+        self.assertIs(replaced.get("name_2"), case_2)
+
+        removed = derived.without_case("name_1")
+        self.assertListEqual(removed.cases, [case_2])
+        self.assertIs(removed.without_case("unknown"), removed)
+
+    def test_freeze(self):
+        """Test method"""
+
+        case_1 = DummyContextCase("name_1")
+        case_2 = DummyContextCase("name_2")
+        frozen = Context([case_1, case_2]).freeze()
+        self.assertIsInstance(frozen, FrozenContext)
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertTupleEqual(frozen.cases, (case_1, case_2))
+        self.assertIs(frozen.get("name_1"), case_1)
+
+        with self.assertRaises(TypeError):
+            frozen.case_map["name_3"] = DummyContextCase("name_3")
+
+        with self.assertRaises(AttributeError):
+            frozen._cases = ()
+
+        same = FrozenContext([case_2, case_1])
+        self.assertEqual(frozen, same)
+        self.assertEqual(hash(frozen), hash(same))
+        self.assertEqual(len({frozen, same}), 1)
+        self.assertNotEqual(frozen, FrozenContext([case_1]))
+
+        with self.assertRaises(InvalidValueException):
+            _ = FrozenContext([case_1, DummyContextCase("name_1")])
+
+    def test_freeze_state(self):
+        """Test method"""
+
+        def build(values):
+            return Context(
+                [
+                    EvalRule.ContextCase(
+                        evaluators=[EvalRule.KeyValueEvaluator("name", "zooxy")],
+                        values=values,
+                    )
+                ]
+            )
+
+        values = {"gen": {"title": "Sample"}}
+        frozen = build(values).freeze()
+        same = build({"gen": {"title": "Sample"}}).freeze()
+        self.assertEqual(frozen, same)
+        self.assertEqual(hash(frozen), hash(same))
+        self.assertNotEqual(frozen, build({"gen": {"title": "Other"}}).freeze())
+
+        fingerprint = frozen.fingerprint
+        values["gen"]["title"] = "Changed"
+        frozen.get(EvalRule.CONTEXT_NAME).evaluator_list.clear()
+        self.assertEqual(Generator([{"eval": "gen.title"}]).generate(frozen), "Sample")
+        self.assertEqual(frozen.fingerprint, fingerprint)
+        self.assertEqual(frozen, same)
+
+        generator = Generator([{"for": "item", "in": "items", "block": [{"eval": "item"}]}])
+        self.assertEqual(generator.generate(build({"items": ["a", "b"]}).freeze()), "a\nb")
+
+    def test_frozen_derive(self):
+        """Test method"""
+
+        case_1 = DummyContextCase("name_1")
+        case_2 = DummyContextCase("name_2")
+        frozen = FrozenContext([case_1])
+
+        derived = frozen.with_case(case_2)
+        self.assertIsInstance(derived, FrozenContext)
+        self.assertTupleEqual(frozen.cases, (case_1,))
+        self.assertTupleEqual(derived.cases, (case_1, case_2))
+        self.assertEqual(derived.without_case("name_2"), frozen)
+
+    def test_subclass_derive(self):
+        """Test method"""
+
+        case_1 = DummyContextCase("name_1")
+        case_2 = DummyContextCase("name_2")
+        context = NamedContext([case_1], label="named")
+        derived = context.with_case(case_2).without_case("name_1")
+        self.assertIsInstance(derived, NamedContext)
+        self.assertEqual(derived.label, "named")
+        self.assertListEqual(derived.cases, [case_2])
+        self.assertListEqual(context.cases, [case_1])
+
+        frozen = NamedFrozenContext([case_1], label="frozen")
+        derived = frozen.with_case(case_2)
+        self.assertIsInstance(derived, NamedFrozenContext)
+        self.assertEqual(derived.label, "frozen")
+        self.assertEqual(derived, FrozenContext([case_1, case_2]))
+        self.assertTupleEqual(frozen.cases, (case_1,))
+        with self.assertRaises(AttributeError):
+            derived.label = "changed"
+
+        generator = Generator(
+            [{"for": "item", "in": "items", "block": [{"label": True}]}],
+            parse_rules=Generator.STD_RULES + [LabelRule()],
+        )
+        context = NamedContext(
+            [EvalRule.ContextCase(evaluators=[], values={"items": [1, 2]})],
+            label="named",
+        )
+        self.assertEqual(generator.generate(context), "named\nnamed")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,8 @@
 """DictRule test"""
 
-from typing import Any
+from typing import Any, Dict, List
 from pathlib import Path
+import threading
 import unittest
 import yaml
 from dictrule.context import Context
@@ -72,7 +73,7 @@ class TestGenerator(unittest.TestCase):
 
         gen_rules = []
         generator = Generator(gen_rules=gen_rules)
-        self.assertListEqual(generator.gen_rules, [])
+        self.assertTupleEqual(generator.gen_rules, ())
 
     def test_gen_rules(self):
         """Test method"""
@@ -82,7 +83,22 @@ class TestGenerator(unittest.TestCase):
             "text",
         ]
         generator = Generator(gen_rules=gen_rules)
-        self.assertListEqual(generator.gen_rules, gen_rules)
+        self.assertTupleEqual(generator.gen_rules, tuple(gen_rules))
+
+    def test_invalidate(self):
+        """Test method"""
+
+        rule = {"eval": "name"}
+        generator = Generator(gen_rules=[rule])
+        context = {"name": "name", "other": "other"}
+        self.assertEqual(generator.generate(context), "name")
+        with self.assertRaises(AttributeError):
+            generator.gen_rules.append("text")
+
+        rule.clear()
+        rule["format_uppercase"] = {"eval": "other"}
+        generator.invalidate()
+        self.assertEqual(generator.generate(context), "OTHER")
 
     def test_empty_parse_rules(self):
         """Test method"""
@@ -91,7 +107,7 @@ class TestGenerator(unittest.TestCase):
             gen_rules=[],
             parse_rules=[],
         )
-        self.assertListEqual(generator.parse_rules, [])
+        self.assertTupleEqual(generator.parse_rules, ())
 
     def test_std_parse_rules(self):
         """Test method"""
@@ -100,7 +116,7 @@ class TestGenerator(unittest.TestCase):
             gen_rules=[],
             parse_rules=Generator.STD_RULES,
         )
-        self.assertListEqual(generator.parse_rules, Generator.STD_RULES)
+        self.assertTupleEqual(generator.parse_rules, tuple(Generator.STD_RULES))
 
     def test_add_parse_rule(self):
         """Test method"""
@@ -111,7 +127,7 @@ class TestGenerator(unittest.TestCase):
         )
         rule = TestGenerator.TestEvaluator("123")
         generator.add_parse_rule(rule)
-        self.assertListEqual(generator.parse_rules, [rule])
+        self.assertTupleEqual(generator.parse_rules, (rule,))
 
     def test_add_parse_rules(self):
         """Test method"""
@@ -125,7 +141,7 @@ class TestGenerator(unittest.TestCase):
             TestGenerator.TestEvaluator("456"),
         ]
         generator.add_parse_rules(parse_rules)
-        self.assertListEqual(generator.parse_rules, parse_rules)
+        self.assertTupleEqual(generator.parse_rules, tuple(parse_rules))
 
     def test_generate(self):
         """Test method"""
@@ -259,6 +275,349 @@ class Sample:
     ]''',
         )
 
+    def test_generate_concurrently(self):
+        """Test method"""
+
+        file_path = Path(__file__).parent / "test_dictrule.yml"
+        with open(file=file_path, mode="r", encoding="utf-8") as file:
+            rules = yaml.safe_load(file)
+
+        generator = Generator(gen_rules=rules * 10)
+        context = Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[TestGenerator.TestGenEvaluator()],
+                ),
+                CommentRule.ContextCase(
+                    singleline=CommentRule.ContextCase.SinglelineComment("# ")
+                ),
+            ]
+        )
+
+        num_threads = 32
+        barrier = threading.Barrier(num_threads)
+        outputs: List[str] = []
+        errors: List[Exception] = []
+
+        def _render():
+            barrier.wait()
+            try:
+                for _ in range(10):
+                    outputs.append(generator.generate(context))
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        threads = [threading.Thread(target=_render) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+        self.assertEqual(len(outputs), num_threads * 10)
+        expected = Generator(gen_rules=rules * 10).generate(context)
+        for output in outputs:
+            self.assertEqual(output, expected)
+
+    def test_referenced_evals(self):
+        """Test method"""
+
+        file_path = Path(__file__).parent / "test_dictrule.yml"
+        with open(file=file_path, mode="r", encoding="utf-8") as file:
+            rules = yaml.safe_load(file)
+
+        references = Generator(gen_rules=rules).referenced_evals()
+        self.assertTrue(references.complete)
+        self.assertSetEqual(
+            references.evals,
+            {
+                "gen.header",
+                "gen.id",
+                "gen.title",
+                "gen.date",
+                "gen.author",
+                "gen.contents",
+            },
+        )
+        self.assertSetEqual(references.bound_names, {"content"})
+        self.assertSetEqual(references.bound_evals, {"content", "content.index"})
+        self.assertDictEqual(
+            references.context_cases,
+            {
+                "eval": {"EvalRule", "ForInRule"},
+                "comment": {"CommentRule"},
+                "indent": {"IndentRule"},
+            },
+        )
+
+        references = Generator(
+            gen_rules=[{"join": ", ", "eval": "names"}, {"unknown": "value"}],
+        ).referenced_evals()
+        self.assertFalse(references.complete)
+        self.assertSetEqual(references.evals, {"names"})
+        self.assertDictEqual(references.context_cases, {"eval": {"JoinEvalRule"}})
+
+    def test_batched_evaluator(self):
+        """Test method"""
+
+        batches: List[List[str]] = []
+
+        class _BatchEvaluator(EvalRule.Evaluable):
+            @property
+            def name(self) -> str:
+                return "gen."
+
+            @property
+            def prefix_matching(self) -> bool:
+                return True
+
+            def run(self, cmd: str) -> Any:
+                raise AssertionError(f"`{cmd}` must be served from the batch")
+
+            def run_many(self, cmds: List[str]) -> Dict[str, Any]:
+                batches.append(sorted(cmds))
+                return {cmd: TestGenerator.TestGenEvaluator.EVALS[cmd] for cmd in cmds}
+
+        generator = Generator(
+            gen_rules=[
+                {"eval": "gen.title"},
+                {
+                    "for": "content",
+                    "in": "gen.contents",
+                    "block": [
+                        {"inline": [{"eval": "content"}, " by ", {"eval": "gen.author"}]}
+                    ],
+                },
+                {"eval": "local"},
+            ],
+        )
+        context = Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[
+                        _BatchEvaluator(),
+                        EvalRule.KeyValueEvaluator("local", "Local"),
+                    ],
+                ),
+            ]
+        )
+
+        self.assertEqual(
+            generator.generate(context),
+            "Sampler for getting sample contents\n"
+            "Train by Zooxy Le\nFlight by Zooxy Le\nShip by Zooxy Le\nLocal",
+        )
+        self.assertListEqual(batches, [["gen.author", "gen.contents", "gen.title"]])
+
+    def test_generate_values(self):
+        """Test method"""
+
+        batches: List[List[str]] = []
+
+        class _BatchEvaluator(EvalRule.Evaluable):
+            def run(self, cmd: str) -> Any:
+                raise AssertionError(f"`{cmd}` must be served from the batch")
+
+            def run_many(self, cmds: List[str]) -> Dict[str, Any]:
+                batches.append(sorted(cmds))
+                return {cmd: cmd.upper() for cmd in cmds}
+
+        gen_rules = [
+            {"eval": "gen.title"},
+            {
+                "for": "content",
+                "in": "gen.contents",
+                "block": [{"inline": [{"eval": "content"}, " by ", {"eval": "author"}]}],
+            },
+            {"eval": "other"},
+        ]
+        values = {
+            "gen": {"title": "Title", "contents": ["Train", "Ship"]},
+            "author": "Zooxy",
+            "other": "Other",
+        }
+        generator = Generator(gen_rules)
+        expected = "Title\nTrain by Zooxy\nShip by Zooxy\nOther"
+        self.assertEqual(generator.generate(values), expected)
+        self.assertEqual(generator.generate_result(values).text, expected)
+
+        del values["other"]
+        context = Context(
+            [EvalRule.ContextCase(evaluators=[], fallback=_BatchEvaluator(), values=values)]
+        )
+        self.assertEqual(
+            generator.generate(context),
+            "Title\nTrain by Zooxy\nShip by Zooxy\nOTHER",
+        )
+        self.assertListEqual(batches, [["other"]])
+
+    def test_generate_values_nested_loop(self):
+        """Test method"""
+
+        gen_rules = [
+            {
+                "for": "item",
+                "in": "items",
+                "block": [
+                    {
+                        "inline": [
+                            {"eval": "item.name"},
+                            ": ",
+                            {"eval": "item.tags[0]"},
+                            " ",
+                            {"eval": "item.owner.name"},
+                        ]
+                    },
+                    {
+                        "for": "tag",
+                        "in": "item.tags",
+                        "block": [{"inline": ["- ", {"eval": "tag"}]}],
+                    },
+                ],
+            }
+        ]
+        values = {
+            "items": [
+                {"name": "a", "tags": ["x", "y"], "owner": {"name": "Zooxy"}},
+                {"name": "b", "tags": ["z"], "owner": {"name": "Bob"}},
+            ]
+        }
+        expected = "a: x Zooxy\n- x\n- y\nb: z Bob\n- z"
+        self.assertEqual(Generator(gen_rules).generate(values), expected)
+        self.assertEqual(Generator(gen_rules, trusted=True).generate(values), expected)
+
+    def test_namespace_evaluator(self):
+        """Test method"""
+
+        generator = Generator(
+            gen_rules=[
+                {"eval": "gen.title"},
+                {
+                    "for": "content",
+                    "in": "gen.contents",
+                    "block": [{"inline": [{"eval": "content"}, " by ", {"eval": "git.user"}]}],
+                },
+            ],
+        )
+        context = Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.NamespaceEvaluator(
+                        evaluators=[TestGenerator.TestGenEvaluator()],
+                        values={"git": {"user": "Zooxy"}},
+                    ),
+                ),
+            ]
+        )
+        self.assertEqual(
+            generator.generate(context),
+            "Sampler for getting sample contents\n"
+            "Train by Zooxy\nFlight by Zooxy\nShip by Zooxy",
+        )
+
+    def test_batched_shadowed_by_loop(self):
+        """Test method"""
+
+        class _BatchEvaluator(EvalRule.Evaluable):
+            @property
+            def name(self) -> str:
+                return "item"
+
+            @property
+            def prefix_matching(self) -> bool:
+                return True
+
+            def run(self, cmd: str) -> Any:
+                return "outer"
+
+            def run_many(self, cmds: List[str]) -> Dict[str, Any]:
+                return {cmd: "outer" for cmd in cmds}
+
+        generator = Generator(
+            gen_rules=[
+                {"eval": "item"},
+                {"for": "item", "in": "items", "block": [{"eval": "item"}]},
+            ],
+        )
+        context = Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[
+                        _BatchEvaluator(),
+                        EvalRule.KeyValueEvaluator("items", ["inner"]),
+                    ],
+                ),
+            ]
+        )
+
+        self.assertEqual(generator.generate(context), "outer\ninner")
+
+    def test_rerender(self):
+        """Test method"""
+
+        values = {
+            "gen.title": "Title",
+            "gen.author": "Zooxy Le",
+            "gen.contents": ["Train", "Flight"],
+        }
+        runs = []
+
+        class _Evaluator(EvalRule.Evaluable):
+            @property
+            def name(self) -> str:
+                return "gen."
+
+            @property
+            def prefix_matching(self) -> bool:
+                return True
+
+            def run(self, cmd: str) -> Any:
+                runs.append(cmd)
+                return values.get(cmd)
+
+        generator = Generator(
+            gen_rules=[
+                {"format_uppercase": {"eval": "gen.title"}},
+                {"comment": [{"inline": ["Author: ", {"eval": "gen.author"}]}]},
+                {
+                    "for": "content",
+                    "in": "gen.contents",
+                    "block": [{"stringify": {"eval": "content"}}],
+                },
+            ],
+        )
+        context = Context(
+            [
+                EvalRule.ContextCase(evaluators=[_Evaluator()]),
+                CommentRule.ContextCase(
+                    singleline=CommentRule.ContextCase.SinglelineComment("# ")
+                ),
+            ]
+        )
+
+        result = generator.generate_result(context)
+        self.assertEqual(result.text, generator.generate(context))
+        self.assertEqual(str(result), 'TITLE\n# Author: Zooxy Le\n"Train"\n"Flight"')
+
+        values["gen.author"] = "Zooxy"
+        values["gen.title"] = "Ignored"
+        runs.clear()
+        result = generator.rerender(result, ["gen.author"])
+        self.assertEqual(result.text, 'TITLE\n# Author: Zooxy\n"Train"\n"Flight"')
+        self.assertListEqual(runs, ["gen.author"])
+
+        values["gen.contents"] = ["Ship"]
+        runs.clear()
+        result = generator.rerender(result, ["gen"])
+        self.assertEqual(result.text, 'IGNORED\n# Author: Zooxy\n"Ship"')
+        self.assertListEqual(runs, ["gen.title", "gen.author", "gen.contents"])
+
+        runs.clear()
+        result = generator.rerender(result, [])
+        self.assertEqual(result.text, 'IGNORED\n# Author: Zooxy\n"Ship"')
+        self.assertListEqual(runs, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,165 @@
+"""Hooks test"""
+
+import unittest
+from unittest import mock
+from dictrule.generator import Generator
+from dictrule.render_cache import RenderCache
+from dictrule.hooks import Hooks
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule
+from dictrule.exceptions import InvalidValueException
+
+
+class RecordingHooks(Hooks):
+    """Hooks recording every call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def on_render_end(self):
+        self.calls.append(("end",))
+
+    def on_node_enter(self, node, rule, rule_dict):
+        self.calls.append(("enter", node.path if node else None, type(rule).__name__))
+
+    def on_node_exit(self, node, rule, rule_dict, output):
+        self.calls.append(("exit", node.path if node else None, output))
+
+    def on_eval(self, eval_name, value, seconds):
+        self.calls.append(("eval", eval_name, value))
+
+
+class TestHooks(unittest.TestCase):
+    """Test class"""
+
+    RULES = [
+        "header",
+        {"inline": ["- ", {"eval": "title"}]},
+    ]
+
+    @staticmethod
+    def _context() -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[EvalRule.KeyValueEvaluator("title", "hello")],
+                )
+            ]
+        )
+
+    def test_calls(self):
+        """Test method"""
+
+        hooks = RecordingHooks()
+        generator = Generator(TestHooks.RULES)
+        generator.add_hooks(hooks)
+        self.assertEqual(generator.hooks, (hooks,))
+        self.assertEqual(generator.generate(TestHooks._context()), "header\n- hello")
+        self.assertEqual(
+            hooks.calls,
+            [
+                ("enter", "[1]", "InlineRule"),
+                ("enter", "[1].inline[1]", "EvalRule"),
+                ("eval", "title", "hello"),
+                ("exit", "[1].inline[1]", "hello"),
+                ("exit", "[1]", "- hello"),
+                ("end",),
+            ],
+        )
+
+    def test_trusted(self):
+        """Test method"""
+
+        for cache in (None, RenderCache()):
+            hooks = RecordingHooks()
+            generator = Generator(TestHooks.RULES, cache=cache, trusted=True)
+            generator.add_hooks(hooks)
+            with mock.patch.object(
+                EvalRule, "parse", side_effect=AssertionError("untrusted parse")
+            ):
+                self.assertEqual(generator.generate(TestHooks._context()), "header\n- hello")
+
+            self.assertIn(("exit", "[1].inline[1]", "hello"), hooks.calls)
+
+    def test_exit_order(self):
+        """Test method"""
+
+        calls = []
+
+        class Named(Hooks):
+            """Hooks recording their name"""
+
+            def __init__(self, name):
+                self.name = name
+
+            def on_node_enter(self, node, rule, rule_dict):
+                calls.append(("enter", self.name))
+
+            def on_node_exit(self, node, rule, rule_dict, output):
+                calls.append(("exit", self.name))
+
+        generator = Generator([{"eval": "title"}])
+        generator.add_hooks(Named("a"))
+        generator.add_hooks(Named("b"))
+        generator.generate(TestHooks._context())
+        self.assertEqual(
+            calls,
+            [("enter", "a"), ("enter", "b"), ("exit", "b"), ("exit", "a")],
+        )
+
+    def test_exit_on_error(self):
+        """Test method"""
+
+        class Failing(EvalRule.Evaluable):
+            """Evaluator raising an error"""
+
+            @property
+            def name(self):
+                return "title"
+
+            def run(self, cmd):
+                raise InvalidValueException("failed")
+
+        hooks = RecordingHooks()
+        generator = Generator([{"eval": "title"}])
+        generator.add_hooks(hooks)
+        with self.assertRaises(InvalidValueException):
+            generator.generate(Context([EvalRule.ContextCase(evaluators=[Failing()])]))
+
+        self.assertEqual(hooks.calls[-2], ("exit", "[0]", None))
+        self.assertEqual(hooks.calls[-1], ("end",))
+
+    def test_remove_hooks(self):
+        """Test method"""
+
+        hooks = RecordingHooks()
+        generator = Generator(TestHooks.RULES)
+        generator.add_hooks(hooks)
+        generator.remove_hooks(hooks)
+        self.assertEqual(generator.hooks, ())
+        generator.generate(TestHooks._context())
+        self.assertEqual(hooks.calls, [])
+
+    def test_render_hooks(self):
+        """Test method"""
+
+        renders = []
+
+        class PerRender(Hooks):
+            """Hooks creating state per render"""
+
+            def render_hooks(self):
+                hooks = RecordingHooks()
+                renders.append(hooks)
+                return hooks
+
+        generator = Generator(TestHooks.RULES)
+        generator.add_hooks(PerRender())
+        generator.generate(TestHooks._context())
+        generator.generate(TestHooks._context())
+        self.assertEqual(len(renders), 2)
+        self.assertEqual(renders[0].calls, renders[1].calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Lazy import test"""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import dictrule
+from dictrule.generator import Generator
+from dictrule.built_in_rules import EvalRule, FormatRule
+
+
+class TestLazyImport(unittest.TestCase):
+    """Test class"""
+
+    def test_import(self):
+        """Test method"""
+
+        source_dir = str(Path(dictrule.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, dictrule\n"
+                "print(sorted(name for name in sys.modules if name.startswith('dictrule.')))\n"
+                "dictrule.Generator\n"
+                "print('dictrule.built_in_rules.format_rule' in sys.modules)\n",
+            ],
+            env=dict(os.environ, PYTHONPATH=source_dir),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported, format_rule = result.stdout.splitlines()
+        self.assertEqual(
+            imported,
+            str(["dictrule.__version__", "dictrule.eo_property", "dictrule.exceptions"]),
+        )
+        self.assertEqual(format_rule, "False")
+
+    def test_names(self):
+        """Test method"""
+
+        for name in dictrule.__all__:
+            self.assertIsNotNone(getattr(dictrule, name))
+
+        self.assertIn("Generator", dir(dictrule))
+        self.assertIs(dictrule.Generator, Generator)
+        self.assertIs(dictrule.EvalRule, EvalRule)
+        with self.assertRaises(AttributeError):
+            _ = dictrule.Unknown
+
+    def test_std_rules(self):
+        """Test method"""
+
+        self.assertIs(Generator.STD_RULES, Generator.STD_RULES)
+        format_rules = [rule for rule in Generator.STD_RULES if isinstance(rule, FormatRule)]
+        self.assertEqual(len(format_rules), 1)
+        self.assertEqual(len(Generator.STD_RULES), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
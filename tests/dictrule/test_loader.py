@@ -0,0 +1,146 @@
+"""TemplateLoader test"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from dictrule.loader import TemplateLoader
+from dictrule.exceptions import (
+    InvalidTypeException,
+    InvalidValueException,
+    TemplateValidationException,
+)
+
+
+class TestTemplateLoader(unittest.TestCase):
+    """Test class"""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self._path = Path(self._dir.name)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write(self, name: str, content: str, mtime_ns: int = 0) -> Path:
+        path = self._path / name
+        path.write_text(content, encoding="utf-8")
+        if mtime_ns:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_resolve(self):
+        """Test method"""
+
+        yml = self._write("sample.yml", "- text")
+        js = self._write("other.json", '["text"]')
+        loader = TemplateLoader([self._path])
+        self.assertEqual(loader.resolve("sample"), yml)
+        self.assertEqual(loader.resolve("sample.yml"), yml)
+        self.assertEqual(loader.resolve("other"), js)
+        self.assertEqual(loader.resolve(str(js)), js)
+        with self.assertRaises(InvalidValueException):
+            _ = loader.resolve("unknown")
+
+    def test_load(self):
+        """Test method"""
+
+        self._write("sample.yml", "- header\n- format_uppercase: text\n")
+        self._write("single.json", json.dumps({"inline": ["a", "b"]}))
+        loader = TemplateLoader([self._path])
+
+        generator = loader.load("sample")
+        self.assertEqual(generator.generate(), "header\nTEXT")
+        self.assertIs(loader.load("sample"), generator)
+        self.assertIs(loader.load_rules("sample")[1], generator.gen_rules[1])
+        self.assertEqual(loader.load("single").generate(), "ab")
+
+    def test_cached_load_costs_one_stat(self):
+        """Test method"""
+
+        self._write("sample.yml", "- text")
+        loader = TemplateLoader([self._path])
+        generator = loader.load("sample")
+
+        with mock.patch("dictrule.loader.os.stat", wraps=os.stat) as stat:
+            with mock.patch.object(TemplateLoader, "parse") as parse:
+                self.assertIs(loader.load("sample"), generator)
+                self.assertEqual(stat.call_count, 1)
+                parse.assert_not_called()
+
+    def test_mtime_validation(self):
+        """Test method"""
+
+        self._write("sample.yml", "- text", mtime_ns=1_000_000_000)
+        loader = TemplateLoader([self._path])
+        generator = loader.load("sample")
+
+        self._write("sample.yml", "- changed", mtime_ns=2_000_000_000)
+        changed = loader.load("sample")
+        self.assertIsNot(changed, generator)
+        self.assertEqual(changed.generate(), "changed")
+
+    def test_hash_validation(self):
+        """Test method"""
+
+        self._write("sample.yml", "- text", mtime_ns=1_000_000_000)
+        loader = TemplateLoader(
+            [self._path],
+            validation=TemplateLoader.Validation.HASH,
+        )
+        generator = loader.load("sample")
+
+        self._write("sample.yml", "- text", mtime_ns=2_000_000_000)
+        self.assertIs(loader.load("sample"), generator)
+
+        self._write("sample.yml", "- other", mtime_ns=3_000_000_000)
+        self.assertEqual(loader.load("sample").generate(), "other")
+
+    def test_lru(self):
+        """Test method"""
+
+        for index in range(3):
+            self._write(f"t{index}.yml", f"- text_{index}")
+
+        loader = TemplateLoader([self._path], max_entries=2)
+        first = loader.load("t0")
+        _ = loader.load("t1")
+        self.assertIs(loader.load("t0"), first)
+        _ = loader.load("t2")
+        self.assertIs(loader.load("t0"), first)
+        self.assertEqual(loader.load("t1").generate(), "text_1")
+
+        loader.clear()
+        self.assertIsNot(loader.load("t0"), first)
+
+    def test_invalid_rules(self):
+        """Test method"""
+
+        self._write("invalid.json", '"text"')
+        loader = TemplateLoader([self._path])
+        with self.assertRaises(InvalidTypeException):
+            _ = loader.load("invalid")
+
+    def test_trusted(self):
+        """Test method"""
+
+        self._write("partial.yml", "- block: text\n")
+        self._write("sample.yml", "- include: partial\n- eval: 1\n")
+        self.assertEqual(TemplateLoader([self._path]).load("sample").template.errors[1][0], "[1]")
+
+        loader = TemplateLoader([self._path], trusted=True)
+        with self.assertRaises(TemplateValidationException) as raised:
+            _ = loader.load("sample")
+        self.assertEqual(
+            raised.exception.errors,
+            [
+                ("[0].sub_rules[0]", "`block` value must be a list"),
+                ("[1]", "`eval` must be a str"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""MemoryReport test"""
+
+import sys
+import tracemalloc
+import types
+import unittest
+from unittest import mock
+from dictrule import memory
+from dictrule.generator import Generator
+from dictrule.memory import MemoryReport
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule, CommentRule
+
+
+class TestMemoryReport(unittest.TestCase):
+    """Test class"""
+
+    RULES = [
+        "header",
+        {
+            "comment": {
+                "for": "item",
+                "in": "items",
+                "block": [{"eval": "item"}],
+            },
+        },
+    ]
+
+    @staticmethod
+    def _context() -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator(
+                        "", {"items": [f"item_{index}" for index in range(1000)]}
+                    ),
+                ),
+                CommentRule.ContextCase(
+                    singleline=CommentRule.ContextCase.SinglelineComment("# "),
+                ),
+            ]
+        )
+
+    def test_report(self):
+        """Test method"""
+
+        report = MemoryReport()
+        generator = Generator(TestMemoryReport.RULES)
+        text = generator.generate(TestMemoryReport._context(), hooks=[report])
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(report.peak, 0)
+
+        self.assertEqual(report.largest_rule, "CommentRule")
+        self.assertEqual(report.largest_path, "[1]")
+        self.assertEqual(report.largest_size, sys.getsizeof(text[len("header\n"):]))
+        self.assertEqual(report.string_counts["EvalRule"], 1000)
+        self.assertEqual(report.string_counts["ForInRule"], 1)
+        self.assertGreater(report.string_bytes["CommentRule"], report.string_bytes["ForInRule"])
+        self.assertEqual(report.total_string_bytes, sum(report.string_bytes.values()))
+        self.assertIn("largest string", report.report())
+        self.assertEqual(generator.hooks, ())
+
+    def test_reset(self):
+        """Test method"""
+
+        report = MemoryReport()
+        generator = Generator(TestMemoryReport.RULES)
+        generator.generate(TestMemoryReport._context(), hooks=[report])
+        Generator(["header"]).generate(None, hooks=[report])
+        self.assertEqual(report.largest_rule, None)
+        self.assertEqual(report.string_bytes, {})
+
+    def test_tracing(self):
+        """Test method"""
+
+        tracemalloc.start()
+        try:
+            report = MemoryReport()
+            generator = Generator(TestMemoryReport.RULES)
+            generator.generate(TestMemoryReport._context(), hooks=[report])
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertGreater(report.peak, 0)
+        finally:
+            tracemalloc.stop()
+
+    def test_tracing_without_reset_peak(self):
+        """Test method"""
+
+        without_reset_peak = types.SimpleNamespace(
+            is_tracing=tracemalloc.is_tracing,
+            start=tracemalloc.start,
+            stop=tracemalloc.stop,
+            get_traced_memory=tracemalloc.get_traced_memory,
+        )
+        generator = Generator(TestMemoryReport.RULES)
+        with mock.patch.object(memory, "tracemalloc", without_reset_peak):
+            report = MemoryReport()
+            generator.generate(TestMemoryReport._context(), hooks=[report])
+            self.assertGreater(report.peak, 0)
+
+            tracemalloc.start()
+            try:
+                generator.generate(TestMemoryReport._context(), hooks=[report])
+                self.assertTrue(tracemalloc.is_tracing())
+            finally:
+                tracemalloc.stop()
+
+        self.assertIsNone(report.peak)
+        self.assertIn("peak traced memory: unavailable", report.report())
+        self.assertEqual(report.string_counts["EvalRule"], 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Profiler test"""
+
+import unittest
+from dictrule.generator import Generator
+from dictrule.profiler import Profiler
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule
+from dictrule.exceptions import InvalidValueException
+
+
+class TestProfiler(unittest.TestCase):
+    """Test class"""
+
+    RULES = [
+        "header",
+        {"format_uppercase": {"eval": "title"}},
+        {
+            "for": "item",
+            "in": "items",
+            "block": [{"inline": ["- ", {"eval": "item"}]}],
+        },
+    ]
+
+    @staticmethod
+    def _context() -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator(
+                        "", {"title": "hello", "items": ["a", "b", "c"]}
+                    ),
+                )
+            ]
+        )
+
+    def test_profile(self):
+        """Test method"""
+
+        generator = Generator(TestProfiler.RULES, profile=True)
+        text = generator.generate(TestProfiler._context())
+        self.assertEqual(text, "header\nHELLO\n- a\n- b\n- c")
+
+        profiler = generator.profiler
+        rules = profiler.stats(Profiler.Group.RULE)
+        self.assertEqual(rules["FormatRule"].calls, 1)
+        self.assertEqual(rules["FormatRule"].output_size, 5)
+        self.assertEqual(rules["InlineRule"].calls, 3)
+        self.assertEqual(rules["EvalRule"].calls, 4)
+        self.assertEqual(rules["ForInRule"].calls, 1)
+        self.assertGreaterEqual(rules["ForInRule"].cumulative, rules["ForInRule"].self_time)
+        self.assertGreaterEqual(rules["ForInRule"].cumulative, rules["InlineRule"].cumulative)
+
+        nodes = profiler.stats(Profiler.Group.NODE)
+        self.assertEqual(nodes["[1]"].calls, 1)
+        self.assertEqual(nodes["[2].block[0]"].calls, 3)
+        self.assertEqual(nodes["[2].block[0].inline[1]"].output_size, 3)
+
+        evals = profiler.stats(Profiler.Group.EVAL)
+        self.assertEqual(evals["title"].calls, 1)
+        self.assertEqual(evals["items"].calls, 1)
+        self.assertEqual(evals["item"].calls, 3)
+
+        generator.generate(TestProfiler._context())
+        self.assertEqual(profiler.stats(Profiler.Group.RULE)["FormatRule"].calls, 2)
+
+    def test_profiler_argument(self):
+        """Test method"""
+
+        generator = Generator(TestProfiler.RULES)
+        self.assertIsNone(generator.profiler)
+        generator.generate(TestProfiler._context())
+
+        profiler = Profiler()
+        generator.generate(TestProfiler._context(), profiler=profiler)
+        rows = profiler.rows(Profiler.Group.RULE, sort_by="calls", limit=2)
+        self.assertEqual([key for key, _ in rows], ["EvalRule", "InlineRule"])
+
+        report = profiler.report(sort_by="self_time")
+        self.assertIn("FormatRule", report)
+        self.assertIn("[2].block[0]", report)
+        with self.assertRaises(InvalidValueException):
+            _ = profiler.report(sort_by="unknown")
+
+        profiler.reset()
+        self.assertEqual(profiler.stats(Profiler.Group.RULE), {})
@@ -0,0 +1,103 @@
+"""Project test"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from dictrule.generator import Generator
+from dictrule.loader import TemplateLoader
+from dictrule.project import Project
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule
+from dictrule.exceptions import (
+    NoneValueException,
+    InvalidValueException,
+)
+
+
+class TestProject(unittest.TestCase):
+    """Test class"""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self._path = Path(self._dir.name)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    @staticmethod
+    def _context(name: str) -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator("", {"name": name}),
+                )
+            ]
+        )
+
+    def _project(self, names, max_workers=4) -> Project:
+        (self._path / "templates").mkdir(exist_ok=True)
+        (self._path / "templates" / "model.json").write_text(
+            json.dumps(["class Model:", {"eval": "name"}]), encoding="utf-8"
+        )
+        project = Project(
+            loader=TemplateLoader([self._path / "templates"]),
+            max_workers=max_workers,
+        )
+        for index, name in enumerate(names):
+            project.add("model", TestProject._context(name), self._path / "out" / f"{index}.py")
+
+        return project
+
+    def test_generate(self):
+        """Test method"""
+
+        names = [f"name_{index}" for index in range(20)]
+        report = self._project(names).generate()
+        self.assertEqual(len(report.written), 20)
+        self.assertEqual(report.unchanged, [])
+        self.assertEqual(
+            (self._path / "out" / "3.py").read_text(encoding="utf-8"),
+            "class Model:\nname_3",
+        )
+
+        for index in range(20):
+            os.utime(self._path / "out" / f"{index}.py", ns=(1000, 1000))
+
+        names[2] = names[5] = names[11] = "changed"
+        report = self._project(names).generate()
+        self.assertEqual(
+            report.written,
+            [self._path / "out" / f"{index}.py" for index in (2, 5, 11)],
+        )
+        self.assertEqual(len(report.unchanged), 17)
+        self.assertEqual(os.stat(self._path / "out" / "0.py").st_mtime_ns, 1000)
+        self.assertNotEqual(os.stat(self._path / "out" / "2.py").st_mtime_ns, 1000)
+        self.assertEqual(len(list((self._path / "out").iterdir())), 20)
+
+    def test_write_if_changed(self):
+        """Test method"""
+
+        path = self._path / "file.txt"
+        self.assertEqual(Project.write_if_changed(path, b"abc"), Project.Status.WRITTEN)
+        os.chmod(path, 0o600)
+        self.assertEqual(Project.write_if_changed(path, b"abc"), Project.Status.UNCHANGED)
+        self.assertEqual(Project.write_if_changed(path, b"abd"), Project.Status.WRITTEN)
+        self.assertEqual(path.read_bytes(), b"abd")
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+    def test_invalid(self):
+        """Test method"""
+
+        project = Project()
+        project.add("model", None, self._path / "a.txt")
+        with self.assertRaises(NoneValueException):
+            _ = project.generate()
+
+        project = Project()
+        project.add(Generator(["a"]), None, self._path / "a.txt")
+        project.add(Generator(["b"]), None, self._path / "." / "a.txt")
+        with self.assertRaises(InvalidValueException):
+            _ = project.generate()
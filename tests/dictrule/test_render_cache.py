@@ -0,0 +1,243 @@
+"""RenderCache test"""
+
+import unittest
+from dictrule.generator import Generator
+from dictrule.hooks import Hooks
+from dictrule.render_cache import RenderCache
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule, CommentRule
+from dictrule.exceptions import InvalidTypeException, InvalidValueException
+
+
+class CountingEvaluator(EvalRule.Evaluable):
+    """Evaluator counting calls"""
+
+    def __init__(self, values):
+        self.values = values
+        self.calls = 0
+
+    @property
+    def name(self):
+        return ""
+
+    @property
+    def prefix_matching(self):
+        return True
+
+    def run(self, cmd):
+        self.calls += 1
+        return self.values[cmd]
+
+
+class TestRenderCache(unittest.TestCase):
+    """Test class"""
+
+    RULES = [
+        {
+            "comment": [
+                {"inline": ["Author: ", {"eval": "author"}]},
+                {"inline": ["Date: ", {"eval": "date"}]},
+            ]
+        },
+        {"format_uppercase": {"eval": "title"}},
+        {
+            "for": "item",
+            "in": "items",
+            "block": [{"eval": "item"}],
+        },
+    ]
+
+    @staticmethod
+    def _context(values) -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator("", values),
+                ),
+                CommentRule.ContextCase(
+                    singleline=CommentRule.ContextCase.SinglelineComment("# "),
+                ),
+            ]
+        )
+
+    def test_reuse(self):
+        """Test method"""
+
+        cache = RenderCache()
+        generator = Generator(TestRenderCache.RULES, cache=cache)
+        uncached = Generator(TestRenderCache.RULES)
+        values = {"author": "Zooxy", "date": "2024", "title": "a", "items": ["x", "y"]}
+        context = TestRenderCache._context(values)
+
+        text = generator.generate(context)
+        self.assertEqual(text, uncached.generate(context))
+        misses = cache.stats().misses
+        self.assertEqual(cache.stats().hits, 0)
+
+        self.assertEqual(generator.generate(context), text)
+        self.assertEqual(cache.stats().misses, misses)
+        self.assertEqual(cache.stats().hits, 3)
+
+        changed = dict(values, title="b", items=["z"])
+        context = TestRenderCache._context(changed)
+        self.assertEqual(generator.generate(context), uncached.generate(context))
+        stats = cache.stats()
+        self.assertEqual(stats.hits, 4)
+        self.assertGreater(stats.misses, misses)
+
+    def test_evaluations(self):
+        """Test method"""
+
+        evaluator = CountingEvaluator({"author": "Zooxy", "date": "2024"})
+        generator = Generator(TestRenderCache.RULES[:1], cache=RenderCache())
+        context = Context(
+            [
+                EvalRule.ContextCase(evaluators=[evaluator]),
+                CommentRule.ContextCase(
+                    singleline=CommentRule.ContextCase.SinglelineComment("# "),
+                ),
+            ]
+        )
+        text = generator.generate(context)
+        self.assertEqual(evaluator.calls, 2)
+        self.assertEqual(generator.generate(context), text)
+        self.assertEqual(evaluator.calls, 4)
+
+    def test_cases(self):
+        """Test method"""
+
+        generator = Generator(TestRenderCache.RULES[:1], cache=RenderCache())
+        values = {"author": "Zooxy", "date": "2024"}
+        context = TestRenderCache._context(values)
+        generator.generate(context)
+        other = context.with_case(
+            CommentRule.ContextCase(
+                singleline=CommentRule.ContextCase.SinglelineComment("// "),
+            )
+        )
+        self.assertEqual(generator.generate(other), "// Author: Zooxy\n// Date: 2024")
+
+    def test_hooks(self):
+        """Test method"""
+
+        entered = []
+
+        class Entered(Hooks):
+            """Hooks recording entered paths"""
+
+            def on_node_enter(self, node, rule, rule_dict):
+                entered.append(node.path)
+
+        generator = Generator(TestRenderCache.RULES[:2], cache=RenderCache())
+        generator.add_hooks(Entered())
+        context = TestRenderCache._context({"author": "a", "date": "b", "title": "c"})
+        text = generator.generate(context)
+        self.assertIn("[1]", entered)
+        del entered[:]
+        self.assertEqual(generator.generate(context), text)
+        self.assertEqual(entered, [])
+
+    def test_lru(self):
+        """Test method"""
+
+        cache = RenderCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        self.assertEqual(cache.get("a"), "1")
+        cache.put("c", "3")
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("a"), "1")
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 1, 1))
+        self.assertEqual(len(cache), 2)
+
+    def test_max_bytes(self):
+        """Test method"""
+
+        cache = RenderCache(max_bytes=200)
+        cache.put("a", "x" * 100)
+        cache.put("b", "y" * 100)
+        self.assertEqual(cache.get("a"), None)
+        self.assertLessEqual(cache.stats().size, 200)
+        cache.put("c", "z" * 1000)
+        self.assertEqual(cache.get("c"), None)
+        cache.clear()
+        self.assertEqual(cache.stats().size, 0)
+
+        with self.assertRaises(InvalidValueException):
+            RenderCache(max_entries=0)
+
+    def test_value_key(self):
+        """Test method"""
+
+        self.assertNotEqual(RenderCache.value_key(1), RenderCache.value_key(True))
+        self.assertNotEqual(RenderCache.value_key(1), RenderCache.value_key("1"))
+        self.assertEqual(
+            RenderCache.value_key({"a": [1, "b"]}),
+            RenderCache.value_key({"a": [1, "b"]}),
+        )
+        with self.assertRaises(InvalidTypeException):
+            RenderCache.value_key(object())
+
+    def test_state_key(self):
+        """Test method"""
+
+        def comment(prefix):
+            return CommentRule.ContextCase(
+                singleline=CommentRule.ContextCase.SinglelineComment(prefix),
+            )
+
+        self.assertEqual(RenderCache.state_key(comment("# ")), RenderCache.state_key(comment("# ")))
+        self.assertNotEqual(
+            RenderCache.state_key(comment("# ")), RenderCache.state_key(comment("// "))
+        )
+
+        case = comment("# ")
+        case.parent = case
+        with self.assertRaises(InvalidTypeException):
+            RenderCache.state_key(case)
+
+        values = [1]
+        values.append(values)
+        with self.assertRaises(InvalidTypeException):
+            RenderCache.value_key(values)
+
+        shared = comment("# ")
+        case = comment("# ")
+        case.first = shared
+        case.second = shared
+        self.assertEqual(RenderCache.state_key(case), RenderCache.state_key(case))
+
+        first = comment("# ")
+        first.cases = [comment("# "), {"key": comment("// ")}]
+        second = comment("# ")
+        second.cases = [comment("# "), {"key": comment("// ")}]
+        self.assertEqual(RenderCache.state_key(first), RenderCache.state_key(second))
+        second.cases[1]["key"] = comment("# ")
+        self.assertNotEqual(RenderCache.state_key(first), RenderCache.state_key(second))
+        second.cases.append(second)
+        with self.assertRaises(InvalidTypeException):
+            RenderCache.state_key(second)
+
+        case = CommentRule.ContextCase(
+            singleline=CommentRule.ContextCase.SinglelineComment("# "),
+        )
+        case.parent = case
+        context = Context(
+            [
+                EvalRule.ContextCase(evaluators=[], values={"author": "Zooxy", "date": "2024"}),
+                case,
+            ]
+        )
+        rules = TestRenderCache.RULES[:1]
+        cache = RenderCache()
+        self.assertEqual(
+            Generator(rules, cache=cache).generate(context),
+            Generator(rules).generate(context),
+        )
+        self.assertEqual(cache.stats().entries, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
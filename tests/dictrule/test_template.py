@@ -0,0 +1,190 @@
+"""Template test"""
+
+import os
+import tempfile
+import unittest
+from dictrule.generator import Generator
+from dictrule.template import Template
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule
+from dictrule.exceptions import InvalidTypeException, InvalidValueException
+
+
+class TestTemplate(unittest.TestCase):
+    """Test class"""
+
+    @staticmethod
+    def _compile(gen_rules) -> Template:
+        return Generator(gen_rules=gen_rules).template
+
+    def test_dependencies(self):
+        """Test method"""
+
+        title = {"eval": "gen.title"}
+        loop = {
+            "for": "content",
+            "in": "gen.contents",
+            "block": [
+                {"inline": [{"eval": "content.index"}, {"eval": "separator"}]},
+                {
+                    "for": "item",
+                    "in": "content.items",
+                    "block": [{"eval": "item"}],
+                },
+            ],
+        }
+        header = {"comment": [{"format_uppercase": title}, "static"]}
+        template = TestTemplate._compile(["text", header, {"indent_1": loop}])
+
+        self.assertIsNone(template.roots[0])
+        self.assertSetEqual(set(template.roots[1].dependencies), {"gen.title"})
+        self.assertSetEqual(
+            set(template.roots[2].dependencies),
+            {"gen.contents", "separator"},
+        )
+        self.assertTrue(template.roots[1].reusable)
+
+        loop_node = template.node(loop)
+        self.assertEqual(loop_node.path, "[2].indent_1")
+        self.assertListEqual(loop_node.bound_names, ["content"])
+        self.assertFalse(loop_node.scoped)
+        self.assertTrue(loop_node.children[0].scoped)
+        self.assertFalse(loop_node.children[0].reusable)
+        self.assertEqual(template.node(title).path, "[1].comment[0].format_uppercase")
+
+    def test_depends_on(self):
+        """Test method"""
+
+        template = TestTemplate._compile([{"eval": "gen.contents"}])
+        node = template.roots[0]
+        self.assertTrue(node.depends_on(["gen.contents"]))
+        self.assertTrue(node.depends_on(["gen"]))
+        self.assertTrue(node.depends_on(["gen.contents[1]"]))
+        self.assertFalse(node.depends_on(["gen.content"]))
+        self.assertFalse(node.depends_on(["generator"]))
+        self.assertFalse(node.depends_on([]))
+
+    def test_unknown_rule(self):
+        """Test method"""
+
+        unknown = {"unknown": "value"}
+        template = TestTemplate._compile([{"inline": [unknown]}, {"eval": "name"}])
+        self.assertIsNone(template.node(unknown).rule)
+        self.assertTrue(template.roots[0].dynamic)
+        self.assertTrue(template.roots[0].depends_on([]))
+        self.assertFalse(template.roots[1].dynamic)
+
+    def test_shared_node(self):
+        """Test method"""
+
+        shared = {"eval": "name"}
+        template = TestTemplate._compile([shared, {"block": [shared]}])
+        self.assertIs(template.roots[0], template.roots[1].children[0])
+        self.assertEqual(len(template.nodes), 2)
+        self.assertEqual(len(template.roots[1].descendants()), 2)
+
+    def test_dumps(self):
+        """Test method"""
+
+        shared = {"eval": "gen.title"}
+        rules = [
+            {"define": "line", "params": ["text"], "block": [{"inline": ["- ", {"eval": "text"}]}]},
+            "text",
+            {"comment": [shared, shared]},
+            {
+                "indent_1": {
+                    "for": "item",
+                    "in": "gen.items",
+                    "block": [{"call": "line", "with": {"text": {"eval": "item"}}}],
+                }
+            },
+            None,
+        ]
+        generator = Generator(rules)
+        loaded = Generator.loads(generator.dumps())
+        template = generator.template
+        loaded_template = loaded.template
+
+        self.assertEqual(loaded.gen_rules, tuple(rules))
+        self.assertIs(loaded.gen_rules[2]["comment"][0], loaded.gen_rules[2]["comment"][1])
+        self.assertIs(
+            loaded_template.node(loaded.gen_rules[2]["comment"][0]),
+            loaded_template.roots[2].children[0],
+        )
+        self.assertEqual(
+            [(node.path, node.dependencies, node.scoped, node.dynamic) for node in template.nodes],
+            [
+                (node.path, node.dependencies, node.scoped, node.dynamic)
+                for node in loaded_template.nodes
+            ],
+        )
+        self.assertEqual(
+            [type(node.rule) for node in template.nodes],
+            [type(node.rule) for node in loaded_template.nodes],
+        )
+        self.assertEqual(loaded_template.roots[4], None)
+        self.assertEqual(list(loaded_template.definitions), ["line"])
+        self.assertEqual(loaded_template.references.evals, template.references.evals)
+        self.assertEqual(
+            loaded_template.references.context_cases, template.references.context_cases
+        )
+
+        context = Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator(
+                        "", {"gen": {"title": "T", "items": ["a", "b"]}}
+                    ),
+                ),
+            ]
+        )
+        rules[2] = "comment"
+        generator = Generator(rules)
+        self.assertEqual(
+            Generator.loads(generator.dumps()).generate(context),
+            generator.generate(context),
+        )
+
+    def test_load(self):
+        """Test method"""
+
+        generator = Generator(["text", {"format_uppercase": "text"}])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "template.drt")
+            with open(path, "wb") as file:
+                file.write(generator.dumps())
+
+            self.assertEqual(Generator.load(path).generate(), "text\nTEXT")
+
+            with open(path, "wb") as file:
+                file.write(b"")
+            with self.assertRaises(InvalidValueException):
+                Generator.load(path)
+
+    def test_loads_errors(self):
+        """Test method"""
+
+        data = Generator(["text", {"eval": "name"}]).dumps()
+        with self.assertRaises(InvalidValueException):
+            Generator.loads(b"not a template")
+
+        with self.assertRaises(InvalidValueException):
+            Generator.loads(data[:5] + b"\xff\xff" + data[7:])
+
+        with self.assertRaises(InvalidValueException):
+            Generator.loads(data[:-10])
+
+        python_version = bytes([data[7] + 1, data[8]])
+        with self.assertRaises(InvalidValueException):
+            Generator.loads(data[:7] + python_version + data[9:])
+
+        with self.assertRaises(InvalidValueException):
+            Generator.loads(data, parse_rules=[EvalRule()])
+
+        with self.assertRaises(InvalidTypeException):
+            Generator(["text", {"eval": "name", "extra": object()}]).dumps()
+
+
+if __name__ == "__main__":
+    unittest.main()
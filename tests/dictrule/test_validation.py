@@ -0,0 +1,210 @@
+"""Template validation test"""
+
+import unittest
+from dictrule.generator import Generator
+from dictrule.render_cache import RenderCache
+from dictrule.context import Context
+from dictrule.built_in_rules import EvalRule, CommentRule, IndentRule
+from dictrule.exceptions import (
+    InvalidTypeException,
+    InvalidValueException,
+    NoneValueException,
+    TemplateValidationException,
+)
+
+
+class Item:
+    """Looped item"""
+
+    def __init__(self, name, tags):
+        self.name = name
+        self.tags = tags
+
+
+class TestValidation(unittest.TestCase):
+    """Test class"""
+
+    RULES = [
+        {"comment": ["Author: ", {"eval": "author"}]},
+        {"define": "field", "params": ["name"], "block": [{"eval": "name"}]},
+        {
+            "for": "item",
+            "in": "items",
+            "block": [
+                {"format_pascal_case": {"eval": "item.name"}},
+                {"indent_1": {"join": ", ", "eval": "item.tags"}},
+                {"inline": ["#", {"eval": "item.index"}]},
+                {"call": "field", "with": {"name": {"eval": "item.name"}}},
+            ],
+        },
+        {"join": "-", "block": ["a", "b"]},
+        {"stringify": "quoted"},
+    ]
+
+    @staticmethod
+    def _context() -> Context:
+        return Context(
+            [
+                EvalRule.ContextCase(
+                    evaluators=[],
+                    fallback=EvalRule.DictPathEvaluator(
+                        "",
+                        {
+                            "author": "Zooxy",
+                            "items": [
+                                Item("first item", ["a", "b"]),
+                                Item("second item", []),
+                            ],
+                        },
+                    ),
+                ),
+                CommentRule.ContextCase(
+                    singleline=CommentRule.ContextCase.SinglelineComment("# "),
+                ),
+                IndentRule.ContextCase(2),
+            ]
+        )
+
+    def test_trusted(self):
+        """Test method"""
+
+        context = TestValidation._context()
+        expected = Generator(TestValidation.RULES).generate(context)
+        trusted = Generator(TestValidation.RULES, trusted=True)
+        self.assertTrue(trusted.trusted)
+        self.assertEqual(trusted.template.errors, [])
+        self.assertEqual(trusted.generate(context), expected)
+
+        cached = Generator(TestValidation.RULES, cache=RenderCache(), trusted=True)
+        self.assertEqual(cached.generate(context), expected)
+        self.assertEqual(cached.generate(context), expected)
+
+    def test_errors(self):
+        """Test method"""
+
+        rules = [
+            {"block": "text"},
+            {
+                "for": "item",
+                "in": ["items"],
+                "block": [
+                    {"eval": 1},
+                    {"format_title": "text"},
+                    {"unknown": "value"},
+                ],
+            },
+            {"indent_x": "text"},
+            {"join": 1, "block": ["a"]},
+        ]
+        generator = Generator(rules)
+        self.assertEqual(
+            generator.template.errors,
+            [
+                ("[0]", "`block` value must be a list"),
+                ("[1]", "`for:in:` ['items'] must be a str"),
+                ("[1].block[0]", "`eval` must be a str"),
+                ("[1].block[1]", "`format:` type title is invalid"),
+                ("[1].block[2]", "Not found any rule in dict {'unknown': 'value'}"),
+                ("[2]", "`indent_` suffix must be a digit str"),
+                ("[3]", "`join` must be a str"),
+            ],
+        )
+
+        with self.assertRaises(TemplateValidationException) as raised:
+            generator.validate()
+        self.assertEqual(len(raised.exception.errors), 7)
+        self.assertIn("[1].block[0]: `eval` must be a str", str(raised.exception))
+
+        with self.assertRaises(TemplateValidationException):
+            _ = Generator(rules, trusted=True).template
+
+        with self.assertRaises(InvalidTypeException):
+            generator.generate(TestValidation._context())
+
+    def test_exception_types(self):
+        """Test method"""
+
+        error = TemplateValidationException([("[0]", "`block` value must be a list")])
+        self.assertIsInstance(error, InvalidValueException)
+        self.assertIsInstance(error, InvalidTypeException)
+
+    def test_invalid_definition(self):
+        """Test method"""
+
+        rules = [
+            {"define": "field", "params": "name", "block": ["text"]},
+            {"call": 1},
+        ]
+        self.assertEqual(
+            Generator(rules).template.errors,
+            [
+                ("[0]", "`define:params:` name must be a list of str"),
+                ("[1]", "`call:` 1 must be a str"),
+            ],
+        )
+
+    def test_unrenderable(self):
+        """Test method"""
+
+        rules = [
+            {"define": "twice", "block": ["a"]},
+            {"define": "twice", "block": ["b"]},
+            {"define": "loop", "block": [{"call": "loop"}]},
+            {"call": "unknown"},
+            {"block": 1},
+        ]
+        with self.assertRaises(TemplateValidationException) as raised:
+            _ = Generator(rules).template
+        self.assertEqual(
+            raised.exception.errors,
+            [
+                ("[1]", "Found a duplicate definition `twice`"),
+                ("[2].block[0]", "Found a recursive call of `loop`"),
+                ("[3]", "Not found definition `unknown`"),
+                ("[4]", "`block` value must be a list"),
+            ],
+        )
+
+        cycle: list = ["text"]
+        cycle.append({"block": cycle})
+        with self.assertRaises(TemplateValidationException) as raised:
+            _ = Generator(cycle).template
+        self.assertEqual(raised.exception.errors, [("[1].block[1]", "Found a cycle of rules")])
+
+    def test_runtime_checks(self):
+        """Test method"""
+
+        generator = Generator([{"eval": "missing"}], trusted=True)
+        with self.assertRaises(NoneValueException):
+            generator.generate()
+
+        with self.assertRaises(NoneValueException):
+            generator.generate(TestValidation._context())
+
+        generator = Generator(
+            [{"for": "item", "in": "author", "block": [{"eval": "item"}]}],
+            trusted=True,
+        )
+        self.assertEqual(generator.generate(TestValidation._context()), "Z\no\no\nx\ny")
+
+    def test_loads(self):
+        """Test method"""
+
+        data = Generator([{"block": "text"}]).dumps()
+        self.assertEqual(
+            Generator.loads(data).template.errors,
+            [("[0]", "`block` value must be a list")],
+        )
+        with self.assertRaises(TemplateValidationException):
+            Generator.loads(data, trusted=True)
+
+        data = Generator(TestValidation.RULES).dumps()
+        context = TestValidation._context()
+        self.assertEqual(
+            Generator.loads(data, trusted=True).generate(context),
+            Generator(TestValidation.RULES).generate(context),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Watcher test"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from dictrule.loader import TemplateLoader
+from dictrule.project import Project
+from dictrule.watcher import Watcher
+
+
+class TestWatcher(unittest.TestCase):
+    """Test class"""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self._path = Path(self._dir.name)
+        self._mtime = 1_000_000_000
+        self._write("header.json", ["# generated"])
+        self._write("user.json", [{"include": "header"}, {"eval": "user.name"}])
+        self._write("post.json", [{"eval": "post.title"}])
+        self._write("plain.json", ["plain"])
+        self._write("context.json", {"user": {"name": "zooxy"}, "post": {"title": "hi"}})
+        self._watcher = Watcher(
+            loader=TemplateLoader([self._path]),
+            targets=[
+                (self._path / f"{name}.json", self._path / "out" / f"{name}.txt")
+                for name in ("user", "post", "plain")
+            ],
+            context_path=self._path / "context.json",
+        )
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write(self, name: str, data):
+        path = self._path / name
+        path.write_text(json.dumps(data), encoding="utf-8")
+        self._mtime += 1_000_000
+        os.utime(path, ns=(self._mtime, self._mtime))
+
+    def _out(self, name: str) -> str:
+        return (self._path / "out" / f"{name}.txt").read_text(encoding="utf-8")
+
+    def test_poll(self):
+        """Test method"""
+
+        results = self._watcher.render_all()
+        self.assertEqual(set(results.values()), {Project.Status.WRITTEN})
+        self.assertEqual(self._out("user"), "# generated\nzooxy")
+        self.assertEqual(self._watcher.poll(), {})
+
+        self._write("header.json", ["# header"])
+        results = self._watcher.poll()
+        self.assertEqual(list(results), [self._path / "out" / "user.txt"])
+        self.assertEqual(self._out("user"), "# header\nzooxy")
+
+        self._write("context.json", {"user": {"name": "zooxy"}, "post": {"title": "hello"}})
+        results = self._watcher.poll()
+        self.assertEqual(list(results), [self._path / "out" / "post.txt"])
+        self.assertEqual(self._out("post"), "hello")
+
+        self._write("plain.json", [{"call": "unknown"}])
+        results = self._watcher.poll()
+        self.assertIsInstance(results[self._path / "out" / "plain.txt"], Exception)
+        self._write("plain.json", ["fixed"])
+        results = self._watcher.poll()
+        self.assertEqual(results, {self._path / "out" / "plain.txt": Project.Status.WRITTEN})
+
+    def test_invalid_context(self):
+        """Test method"""
+
+        context_path = self._path / "context.json"
+        self._watcher.render_all()
+        context_path.write_text('{"user": {"name": ', encoding="utf-8")
+        results = self._watcher.poll()
+        self.assertEqual(list(results), [context_path])
+        self.assertIsInstance(results[context_path], ValueError)
+        self.assertEqual(self._watcher.poll(), {})
+
+        context_path.unlink()
+        results = self._watcher.poll()
+        self.assertIsInstance(results[context_path], OSError)
+        self.assertEqual(self._out("post"), "hi")
+
+        self._write("context.json", {"user": {"name": "zooxy"}, "post": {"title": "hello"}})
+        results = self._watcher.poll()
+        self.assertEqual(results, {self._path / "out" / "post.txt": Project.Status.WRITTEN})
+        self.assertEqual(self._out("post"), "hello")
+
+    def test_changed_names(self):
+        """Test method"""
+
+        self.assertEqual(
+            Watcher.changed_names(
+                {"a": {"b": 1, "c": [1]}, "d": 1},
+                {"a": {"b": 2, "c": [1]}, "e": 1},
+            ),
+            ["a.b", "d", "e"],
+        )
+        self.assertIsNone(Watcher.changed_names([1], [2]))
+        self.assertEqual(Watcher.changed_names({"a": 1}, {"a": 1}), [])
+
+    def test_run(self):
+        """Test method"""
+
+        stop = threading.Event()
+        rendered = []
+
+        def on_render(results, _):
+            rendered.append(results)
+            stop.set()
+
+        self._watcher.run(stop=stop, on_render=on_render)
+        self.assertEqual(len(rendered), 1)
+        self.assertEqual(len(rendered[0]), 3)
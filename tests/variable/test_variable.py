@@ -9,8 +9,11 @@ from typing import (
     Dict,
 )
 
+from array import array
+from enum import Enum
 from dictrule.eo_property import eo_property
 from dictrule.eval_object import EvalObject
+from dictrule.exceptions import InvalidValueException
 
 
 class ObjProperty:
@@ -181,6 +184,191 @@ class TestObject(unittest.TestCase):
             self.assertEqual(getattr(obj_c, "prop_b"), obj.prop_c[key].prop_b)
             self.assertEqual(getattr(obj_c, "prop_c"), obj.prop_c[key].prop_c)
 
+    def test_shared_objects(self):
+        """Test method"""
+
+        shared = ObjProperty()
+        obj_list: List[Any] = EvalObject.from_eo_property_object([shared] * 100)
+        self.assertEqual(len(obj_list), 100)
+        for obj in obj_list:
+            self.assertIs(obj, obj_list[0])
+
+        shared_list = [ObjProperty()]
+        obj_dict: Dict[Any, Any] = EvalObject.from_eo_property_object(
+            {"1": shared_list, "2": shared_list}
+        )
+        self.assertIs(obj_dict["1"], obj_dict["2"])
+
+    def test_preserve_cycle(self):
+        """Test method"""
+
+        parent = {"name": "parent", "children": []}
+        child = {"name": "child", "parent": parent}
+        parent["children"].append(child)
+
+        obj: Dict[Any, Any] = EvalObject.from_eo_property_object(parent)
+        self.assertEqual(obj["children"][0]["name"], "child")
+        self.assertIs(obj["children"][0]["parent"], obj)
+
+        cyclic_list: List[Any] = [1]
+        cyclic_list.append(cyclic_list)
+        obj_list: List[Any] = EvalObject.from_eo_property_object(cyclic_list)
+        self.assertEqual(obj_list[0], 1)
+        self.assertIs(obj_list[1], obj_list)
+
+    def test_cut_cycle(self):
+        """Test method"""
+
+        parent = {"name": "parent", "children": []}
+        child = {"name": "child", "parent": parent}
+        parent["children"].append(child)
+
+        obj: Dict[Any, Any] = EvalObject.from_eo_property_object(
+            parent,
+            cycle_policy=EvalObject.CyclePolicy.CUT,
+        )
+        self.assertDictEqual(obj, {"name": "parent", "children": [{"name": "child"}]})
+
+    def test_max_depth(self):
+        """Test method"""
+
+        nested = [1, [2, [3, [4]]]]
+        self.assertListEqual(
+            EvalObject.from_eo_property_object(nested, max_depth=1),
+            [1, [2]],
+        )
+
+    def test_deep_nesting(self):
+        """Test method"""
+
+        nested: List[Any] = ["leaf"]
+        for i in range(1, 10000):
+            nested = [i, nested]
+
+        obj_list: List[Any] = EvalObject.from_eo_property_object(nested)
+        depth = 0
+        while len(obj_list) > 1:
+            obj_list = obj_list[1]
+            depth += 1
+
+        self.assertEqual(depth, 9999)
+
+    def test_iterables(self):
+        """Test method"""
+
+        self.assertListEqual(
+            EvalObject.from_eo_property_object((1, "text", None, 0)),
+            [1, "text"],
+        )
+        self.assertListEqual(EvalObject.from_eo_property_object(range(1, 4)), [1, 2, 3])
+        self.assertSetEqual(
+            EvalObject.from_eo_property_object(frozenset([1, 2])),
+            {1, 2},
+        )
+        self.assertDictEqual(
+            EvalObject.from_eo_property_object({(1, 2): "pair", "key": (3,)}),
+            {(1, 2): "pair", "key": [3]},
+        )
+        self.assertIsNone(EvalObject.from_eo_property_object(b"bytes"))
+
+    def test_primitive_subclasses(self):
+        """Test method"""
+
+        class Color(str, Enum):
+            """Test class"""
+
+            RED = "red"
+
+        class Name(str):
+            """Test class"""
+
+        name = Name("Zooxy")
+        self.assertIs(EvalObject.from_eo_property_object(Color.RED), Color.RED)
+        self.assertIs(EvalObject.from_eo_property_object(name), name)
+        self.assertListEqual(
+            EvalObject.from_eo_property_object([Color.RED, name, True]),
+            [Color.RED, name, True],
+        )
+        self.assertIsNone(EvalObject.from_eo_property_object(bytearray(b"bytes")))
+
+    def test_hashable_set_items(self):
+        """Test method"""
+
+        self.assertDictEqual(EvalObject._parse_value({"a": {(1, 2)}}), {"a": {(1, 2)}})
+        self.assertSetEqual(EvalObject._parse_value({frozenset({1})}), {frozenset({1})})
+        self.assertSetEqual(
+            EvalObject._parse_value({(1, (2, frozenset({3}))), "text"}),
+            {(1, (2, frozenset({3}))), "text"},
+        )
+
+    def test_lazy_iterator(self):
+        """Test method"""
+
+        consumed: List[int] = []
+
+        def _records():
+            for i in range(3):
+                consumed.append(i)
+                yield ObjProperty()
+
+        stream = EvalObject.from_eo_property_object(_records())
+        self.assertListEqual(consumed, [])
+
+        first = next(stream)
+        self.assertIsInstance(first, EvalObject)
+        self.assertEqual(first.prop_a, "_prop_a")
+        self.assertListEqual(consumed, [0])
+        self.assertEqual(len(list(stream)), 2)
+
+        obj: Dict[Any, Any] = EvalObject.from_eo_property_object(
+            {"items": (i for i in [0, 1, 2])}
+        )
+        self.assertListEqual(list(obj["items"]), [1, 2])
+
+    def test_homogeneous_list(self):
+        """Test method"""
+
+        columns = EvalObject.from_homogeneous_list(
+            [
+                {"name": "Train", "speed": 300, "cost": 1.5},
+                {"name": "Flight", "speed": 900, "cost": 9.0},
+                {"name": "Ship", "speed": 60, "cost": 0.5},
+            ]
+        )
+        self.assertEqual(len(columns), 3)
+        self.assertIsInstance(columns.column("speed"), array)
+        self.assertIsInstance(columns.column("cost"), array)
+        self.assertListEqual(columns.column("name"), ["Train", "Flight", "Ship"])
+        self.assertEqual(columns[1].name, "Flight")
+        self.assertEqual(columns[-1].speed, 60)
+        self.assertListEqual([row.cost for row in columns], [1.5, 9.0, 0.5])
+        with self.assertRaises(AttributeError):
+            _ = columns[0].unknown
+
+        with self.assertRaises(IndexError):
+            _ = columns[3]
+
+    def test_homogeneous_list_of_objects(self):
+        """Test method"""
+
+        obj_prop_list = [ObjProperty(), ObjProperty()]
+        columns = EvalObject.from_homogeneous_list(obj_prop_list)
+        self.assertSetEqual(set(columns.data.keys()), {"prop_a", "prop_b", "prop_c"})
+        for row, obj_prop in zip(columns, obj_prop_list):
+            self.assertEqual(row.prop_a, obj_prop.prop_a)
+            self.assertFalse(hasattr(row, "prop_d"))
+
+        self.assertEqual(len(EvalObject.from_homogeneous_list([])), 0)
+
+    def test_heterogeneous_list(self):
+        """Test method"""
+
+        with self.assertRaises(InvalidValueException):
+            _ = EvalObject.from_homogeneous_list([{"a": 1}, {"b": 1}])
+
+        with self.assertRaises(InvalidValueException):
+            _ = EvalObject.from_homogeneous_list([ObjProperty(), ComplexObject()])
+
 
 if __name__ == "__main__":
     unittest.main()